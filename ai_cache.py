@@ -0,0 +1,360 @@
+"""
+AI 생성 결과 캐시
+
+동일한 프롬프트로 유료 API를 반복 호출하지 않도록 LLM 응답을
+로컬 SQLite 파일에 저장합니다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from ai_config import AIConfig
+
+
+class CompletionCache:
+    """프롬프트 해시 기반 LLM 응답 캐시 (TTL + LRU)"""
+
+    def __init__(self, path: str, max_entries: int = 5000,
+                 category_ttls: Optional[Dict[str, int]] = None, default_ttl: int = 86400):
+        """
+        캐시 초기화
+
+        Args:
+            path: SQLite 파일 경로
+            max_entries: 최대 저장 항목 수 (초과 시 가장 오래 사용되지 않은 항목 삭제)
+            category_ttls: 카테고리별 유효기간 (초)
+            default_ttl: 카테고리 TTL이 없을 때의 유효기간 (초)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.category_ttls = category_ttls or {}
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS completion_cache (
+                cache_key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                model TEXT NOT NULL,
+                category TEXT,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                last_accessed REAL NOT NULL,
+                hit_count INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS ix_completion_cache_last_accessed '
+            'ON completion_cache (last_accessed)'
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(provider: str, model: str, temperature: float, max_tokens: int, prompt: str) -> str:
+        """공급자, 모델, 생성 옵션, 프롬프트 해시로 캐시 키 생성"""
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        raw = json.dumps([provider, model, float(temperature), int(max_tokens), prompt_hash])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get_ttl(self, category: Optional[str]) -> int:
+        """카테고리별 유효기간 (초)"""
+        return self.category_ttls.get(category or '', self.default_ttl)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회
+
+        Returns:
+            저장된 응답 (없거나 만료되었으면 None)
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT response, expires_at FROM completion_cache WHERE cache_key = ?', (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            response, expires_at = row
+            if expires_at <= now:
+                self._conn.execute('DELETE FROM completion_cache WHERE cache_key = ?', (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                'UPDATE completion_cache SET last_accessed = ?, hit_count = hit_count + 1 '
+                'WHERE cache_key = ?', (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return response
+
+    def set(self, key: str, response: str, provider: str, model: str, category: Optional[str] = None):
+        """응답 저장 후 최대 항목 수를 넘으면 LRU 순으로 정리"""
+        now = time.time()
+        expires_at = now + self.get_ttl(category)
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO completion_cache '
+                '(cache_key, provider, model, category, response, created_at, expires_at, last_accessed) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, provider, model, category, response, now, expires_at, now)
+            )
+            self._conn.execute(
+                'DELETE FROM completion_cache WHERE cache_key IN ('
+                '  SELECT cache_key FROM completion_cache ORDER BY last_accessed DESC LIMIT -1 OFFSET ?'
+                ')', (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._conn.execute('DELETE FROM completion_cache')
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """캐시 적중/미스 통계"""
+        with self._lock:
+            entries, total_hits = self._conn.execute(
+                'SELECT COUNT(*), COALESCE(SUM(hit_count), 0) FROM completion_cache'
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            'entries': entries,
+            'stored_hits': total_hits,
+            'max_entries': self.max_entries
+        }
+
+
+_completion_cache: Optional[CompletionCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_completion_cache() -> Optional[CompletionCache]:
+    """공유 응답 캐시 반환 (비활성화 시 None)"""
+    global _completion_cache
+    if not AIConfig.COMPLETION_CACHE_ENABLED:
+        return None
+
+    if _completion_cache is None:
+        with _cache_lock:
+            if _completion_cache is None:
+                _completion_cache = CompletionCache(
+                    AIConfig.COMPLETION_CACHE_PATH,
+                    max_entries=AIConfig.COMPLETION_CACHE_MAX_ENTRIES,
+                    category_ttls=AIConfig.COMPLETION_CACHE_TTLS,
+                    default_ttl=AIConfig.COMPLETION_CACHE_DEFAULT_TTL
+                )
+    return _completion_cache
+
+
+# 여행 일수 구간 (체크리스트/템플릿의 3일, 5일, 7일 기준과 맞춤)
+DAY_BUCKETS = ((1, 2), (3, 4), (5, 7), (8, None))
+
+
+def get_day_bucket(days: int) -> str:
+    """여행 일수를 캐시용 구간 라벨로 변환 (예: 5 -> '5-7')"""
+    for low, high in DAY_BUCKETS:
+        if high is None:
+            if days >= low:
+                return f"{low}+"
+        elif days <= high:
+            return f"{low}-{high}"
+    return f"{DAY_BUCKETS[0][0]}-{DAY_BUCKETS[0][1]}"
+
+
+class TripBundleCache:
+    """
+    목적지/계절/여행 스타일/일수 구간 단위의 여행 컨텐츠 묶음 캐시
+
+    stale-while-revalidate 방식으로 동작합니다:
+    - fresh: 그대로 반환
+    - stale: 캐시된 값을 즉시 반환하고 백그라운드에서 다시 생성
+    - miss/만료: 호출자가 동기적으로 생성
+    """
+
+    def __init__(self, path: str, fresh_ttl: int, stale_ttl: int, max_refresh_workers: int = 2):
+        """
+        캐시 초기화
+
+        Args:
+            path: SQLite 파일 경로
+            fresh_ttl: 재생성 없이 사용할 기간 (초)
+            stale_ttl: 만료 전까지 백그라운드 재생성과 함께 사용할 기간 (초)
+            max_refresh_workers: 동시에 실행할 백그라운드 재생성 수
+        """
+        self.path = path
+        self.fresh_ttl = fresh_ttl
+        self.stale_ttl = stale_ttl
+        self.max_refresh_workers = max_refresh_workers
+        self.counts = {'fresh': 0, 'stale': 0, 'miss': 0, 'refreshed': 0}
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._executor = None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS trip_bundle_cache (
+                bundle_key TEXT PRIMARY KEY,
+                destination TEXT NOT NULL,
+                season TEXT NOT NULL,
+                travel_style TEXT NOT NULL,
+                day_bucket TEXT NOT NULL,
+                bundle TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                fresh_until REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(destination: str, season: str, travel_style: str, days: int) -> str:
+        """
+        정규화된 목적지/계절/스타일/일수 구간으로 캐시 키 생성
+
+        지명 사전에 없는 목적지는 입력 그대로 들어오므로 구분자(|)와 이스케이프 문자(%)를
+        이스케이프해 키를 다시 네 필드로 나눌 수 있게 합니다.
+        """
+        destination = destination.strip().lower().replace('%', '%25').replace('|', '%7C')
+        return '|'.join([destination, season, travel_style, get_day_bucket(days)])
+
+    @staticmethod
+    def split_key(key: str) -> Tuple[str, str, str, str]:
+        """make_key로 만든 키 -> (목적지, 계절, 스타일, 일수 구간)"""
+        destination, season, travel_style, day_bucket = key.split('|')
+        return destination.replace('%7C', '|').replace('%25', '%'), season, travel_style, day_bucket
+
+    def get(self, key: str):
+        """
+        캐시 조회
+
+        Returns:
+            (컨텐츠 묶음 또는 None, 상태) - 상태는 'fresh', 'stale', 'miss' 중 하나
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT bundle, fresh_until, expires_at FROM trip_bundle_cache WHERE bundle_key = ?',
+                (key,)
+            ).fetchone()
+
+            if row is None or row[2] <= now:
+                self.counts['miss'] += 1
+                return None, 'miss'
+
+            state = 'fresh' if row[1] > now else 'stale'
+            self.counts[state] += 1
+            return json.loads(row[0]), state
+
+    def set(self, key: str, bundle: Dict):
+        """컨텐츠 묶음 저장"""
+        now = time.time()
+        destination, season, travel_style, day_bucket = self.split_key(key)
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO trip_bundle_cache '
+                '(bundle_key, destination, season, travel_style, day_bucket, bundle, '
+                ' created_at, fresh_until, expires_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, destination, season, travel_style, day_bucket,
+                 json.dumps(bundle, ensure_ascii=False), now,
+                 now + self.fresh_ttl, now + self.fresh_ttl + self.stale_ttl)
+            )
+            self._conn.commit()
+
+    def is_fresh(self, key: str) -> bool:
+        """통계에 반영하지 않고 fresh 여부만 확인"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT fresh_until FROM trip_bundle_cache WHERE bundle_key = ?', (key,)
+            ).fetchone()
+        return row is not None and row[0] > time.time()
+
+    def refresh_async(self, key: str, generate: Callable[[], Optional[Dict]]):
+        """
+        백그라운드에서 컨텐츠 묶음 재생성
+
+        같은 키의 재생성이 이미 진행 중이면 무시합니다.
+        generate가 None을 반환하거나 빈 카테고리가 하나라도 있으면 기존 값을 유지합니다
+        (일부 실패한 결과가 정상 묶음을 덮어쓰고 fresh로 바뀌지 않도록).
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_refresh_workers, thread_name_prefix='bundle-refresh'
+                )
+
+        def _refresh():
+            try:
+                bundle = generate()
+                if bundle and all(bundle.values()):
+                    self.set(key, bundle)
+                    with self._lock:
+                        self.counts['refreshed'] += 1
+            except Exception as e:
+                print(f"❌ 캐시 재생성 오류 ({key}): {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(_refresh)
+
+    def stats(self) -> Dict:
+        """캐시 상태별 통계"""
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM trip_bundle_cache').fetchone()[0]
+            counts = dict(self.counts)
+        lookups = counts['fresh'] + counts['stale'] + counts['miss']
+        counts['entries'] = entries
+        counts['hit_rate'] = round((counts['fresh'] + counts['stale']) / lookups, 3) if lookups else 0.0
+        return counts
+
+
+_bundle_cache: Optional[TripBundleCache] = None
+
+
+def get_bundle_cache() -> Optional[TripBundleCache]:
+    """공유 여행 컨텐츠 묶음 캐시 반환 (비활성화 시 None)"""
+    global _bundle_cache
+    if not AIConfig.BUNDLE_CACHE_ENABLED:
+        return None
+
+    if _bundle_cache is None:
+        with _cache_lock:
+            if _bundle_cache is None:
+                _bundle_cache = TripBundleCache(
+                    AIConfig.COMPLETION_CACHE_PATH,
+                    fresh_ttl=AIConfig.BUNDLE_CACHE_FRESH_TTL,
+                    stale_ttl=AIConfig.BUNDLE_CACHE_STALE_TTL
+                )
+    return _bundle_cache
@@ -0,0 +1,237 @@
+"""
+AI API 호출 녹화/재생 (카세트)
+
+record 모드에서는 generate_completion / generate_completion_stream 호출마다
+요청 키(공급자, 모델, 생성 옵션, 프롬프트 해시)와 응답 텍스트, 시간 정보
+(TTFB, 전체 소요 시간, 스트리밍 조각 도착 시각), 상태 코드, 토큰 사용량을
+카세트 파일(.jsonl, 경로가 .gz로 끝나면 gzip 압축)에 한 줄씩 추가합니다.
+
+replay 모드에서는 네트워크 없이 카세트에서 응답을 돌려줍니다.
+CASSETTE_SPEED가 1이면 기록된 속도 그대로, 2면 두 배 빠르게, 0이면 즉시 재생합니다.
+같은 요청이 여러 번 기록되어 있으면 기록된 순서대로 돌려주고 마지막 응답을 반복합니다.
+"""
+
+import gzip
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ai_config import AIConfig
+from ai_telemetry import CallRecord
+
+# 기록/재생하는 호출 측정값
+RECORDED_FIELDS = ('status', 'ttfb', 'input_tokens', 'output_tokens',
+                   'cache_read_tokens', 'cache_write_tokens', 'stop_reason', 'error')
+
+
+def _open(path: str, mode: str):
+    """카세트 파일 열기 (.gz면 gzip 텍스트 모드)"""
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class Cassette:
+    """AI API 호출 녹화/재생기"""
+
+    def __init__(self, path: str, mode: str, speed: float = 1.0):
+        """
+        카세트 초기화
+
+        Args:
+            path: 카세트 파일 경로
+            mode: record(녹화) 또는 replay(재생)
+            speed: 재생 속도 배율 (0이면 대기 없이 즉시 재생)
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"지원하지 않는 카세트 모드: {mode}")
+
+        self.path = path
+        self.mode = mode
+        self.speed = speed
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+        self._entries: Dict[str, List[Dict]] = {}
+        self._positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if mode == 'record':
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        else:
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    def _load(self):
+        """카세트 파일을 요청 키별로 읽기"""
+        if not os.path.exists(self.path):
+            print(f"⚠️ 카세트 파일이 없습니다: {self.path}")
+            return
+
+        with _open(self.path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries.setdefault(entry['key'], []).append(entry)
+        print(f"📼 카세트 로드: {sum(len(entries) for entries in self._entries.values())}건 ({self.path})")
+
+    # ===== 녹화 =====
+
+    def record(self, key: str, call: CallRecord, text: str,
+               chunks: Optional[List[Tuple[float, str]]] = None):
+        """
+        호출 1건 기록
+
+        Args:
+            key: 요청 키 (CompletionCache.make_key)
+            call: 호출 측정값
+            text: 응답 텍스트
+            chunks: 스트리밍 조각 (호출 시작부터의 도착 시각, 텍스트) 목록
+        """
+        entry = {
+            'key': key,
+            'provider': call.provider,
+            'model': call.model,
+            'category': call.category,
+            'recorded_at': datetime.now().isoformat(),
+            'wall_time': round(call.wall_time if call.wall_time is not None else time.monotonic() - call.started, 4),
+            **{field: getattr(call, field) for field in RECORDED_FIELDS},
+            'text': text
+        }
+        if entry['ttfb'] is not None:
+            entry['ttfb'] = round(entry['ttfb'], 4)
+        if chunks is not None:
+            entry['chunks'] = [[round(offset, 4), chunk] for offset, chunk in chunks]
+
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n'
+        with self._lock:
+            with _open(self.path, 'a') as f:
+                f.write(line)
+            self.recorded += 1
+
+    # ===== 재생 =====
+
+    def _next_entry(self, key: str) -> Optional[Dict]:
+        """요청 키의 다음 기록 (기록 순서대로, 끝나면 마지막 기록 반복)"""
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.misses += 1
+                return None
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            self.replayed += 1
+            return entries[min(position, len(entries) - 1)]
+
+    def _wait_until(self, started: float, offset: Optional[float]):
+        """호출 시작 후 기록된 시각(offset)까지 재생 속도에 맞춰 대기"""
+        if not offset or self.speed <= 0:
+            return
+        delay = started + offset / self.speed - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    @staticmethod
+    def _apply(entry: Dict, call: CallRecord):
+        for field in RECORDED_FIELDS:
+            setattr(call, field, entry.get(field))
+        call.replayed = True
+
+    def _miss(self, call: CallRecord):
+        print(f"⚠️ 카세트에 없는 요청입니다 ({call.provider}/{call.category}).")
+        call.error = 'cassette_miss'
+
+    def replay(self, key: str, call: CallRecord) -> str:
+        """
+        기록된 응답 반환 (기록에 없으면 빈 문자열)
+
+        Args:
+            key: 요청 키
+            call: 기록된 측정값을 채울 호출 측정값
+
+        Returns:
+            기록된 응답 텍스트
+        """
+        entry = self._next_entry(key)
+        if entry is None:
+            self._miss(call)
+            return ""
+
+        self._wait_until(call.started, entry.get('wall_time'))
+        self._apply(entry, call)
+        return entry.get('text') or ""
+
+    def replay_stream(self, key: str, call: CallRecord) -> Iterator[str]:
+        """
+        기록된 응답을 조각 단위로 반환 (스트리밍 없이 기록된 응답은 한 조각)
+
+        Args:
+            key: 요청 키
+            call: 기록된 측정값을 채울 호출 측정값
+
+        Yields:
+            응답 텍스트 조각
+        """
+        entry = self._next_entry(key)
+        if entry is None:
+            self._miss(call)
+            return
+
+        self._apply(entry, call)
+        chunks = entry.get('chunks')
+        if chunks is None:
+            text = entry.get('text') or ""
+            chunks = [[entry.get('wall_time'), text]] if text else []
+
+        for offset, chunk in chunks:
+            self._wait_until(call.started, offset)
+            yield chunk
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'mode': self.mode,
+                'path': self.path,
+                'speed': self.speed,
+                'recorded': self.recorded,
+                'replayed': self.replayed,
+                'misses': self.misses,
+                'keys': len(self._entries)
+            }
+
+
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """
+    공유 카세트 반환 (CASSETTE_MODE가 비어 있으면 None)
+
+    설정(모드/경로/속도)이 바뀌면 새 카세트를 만듭니다.
+    """
+    global _cassette
+    mode = AIConfig.CASSETTE_MODE
+    if not mode:
+        return None
+
+    settings = (mode, AIConfig.CASSETTE_PATH, AIConfig.CASSETTE_SPEED)
+    cassette = _cassette
+    if cassette is None or (cassette.mode, cassette.path, cassette.speed) != settings:
+        with _cassette_lock:
+            cassette = _cassette
+            if cassette is None or (cassette.mode, cassette.path, cassette.speed) != settings:
+                cassette = _cassette = Cassette(AIConfig.CASSETTE_PATH, mode, AIConfig.CASSETTE_SPEED)
+    return cassette
@@ -0,0 +1,109 @@
+"""
+AI 공급자 클라이언트 공유 관리
+
+프로세스 전체에서 재사용하는 HTTP 세션(keep-alive 연결 풀)과
+Claude/DeepSeek 클라이언트 인스턴스를 관리합니다.
+"""
+
+import os
+import threading
+from typing import Dict, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ai_config import AIConfig
+
+_sessions: Dict[str, requests.Session] = {}
+_clients: Dict[Tuple[str, str, str], object] = {}
+_session_lock = threading.Lock()
+_client_lock = threading.Lock()
+
+
+def get_http_session(base_url: str) -> requests.Session:
+    """
+    베이스 URL별 공유 HTTP 세션 반환
+
+    세션은 keep-alive 연결 풀을 사용하므로 같은 호스트로의 요청은
+    TCP/TLS 연결을 재사용합니다.
+
+    Args:
+        base_url: API 베이스 URL
+
+    Returns:
+        연결 풀이 설정된 requests 세션
+    """
+    key = base_url.rstrip('/')
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+
+    with _session_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=AIConfig.HTTP_POOL_CONNECTIONS,
+                pool_maxsize=AIConfig.HTTP_POOL_MAXSIZE,
+                pool_block=AIConfig.HTTP_POOL_BLOCK
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _sessions[key] = session
+        return session
+
+
+def get_ai_client(service: str):
+    """
+    AI 서비스별 공유 클라이언트 반환
+
+    API 키는 호출 시점의 환경변수에서 읽으며, 키나 베이스 URL이 바뀌면
+    새 클라이언트를 만듭니다.
+
+    Args:
+        service: AI 서비스명 (claude, deepseek)
+
+    Returns:
+        클라이언트 인스턴스 (API 키가 없거나 지원하지 않는 서비스면 None,
+        카세트 재생 모드에서는 API 키 없이도 생성)
+    """
+    if service == 'claude':
+        api_key = os.getenv('ANTHROPIC_API_KEY')
+        base_url = AIConfig.ANTHROPIC_BASE_URL
+    elif service == 'deepseek':
+        api_key = os.getenv('DEEPSEEK_API_KEY')
+        base_url = AIConfig.DEEPSEEK_BASE_URL
+    else:
+        return None
+
+    if not api_key:
+        if AIConfig.CASSETTE_MODE != 'replay':
+            return None
+        # 재생 모드는 네트워크를 쓰지 않으므로 키가 필요 없음
+        api_key = 'cassette-replay'
+
+    key = (service, api_key, base_url)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _client_lock:
+        client = _clients.get(key)
+        if client is None:
+            if service == 'claude':
+                from claude_client import ClaudeClient
+                client = ClaudeClient(api_key, base_url=base_url)
+            else:
+                from deepseek_client import DeepSeekClient
+                client = DeepSeekClient(api_key, base_url=base_url)
+            _clients[key] = client
+        return client
+
+
+def close_http_sessions():
+    """공유 HTTP 세션과 클라이언트 정리 (테스트/종료용)"""
+    with _client_lock, _session_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _clients.clear()
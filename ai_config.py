@@ -5,7 +5,7 @@ AI API 설정 파일
 """
 
 import os
-from typing import Optional
+from typing import Dict, Optional
 
 class AIConfig:
     """AI 서비스 설정"""
@@ -19,6 +19,7 @@ class AIConfig:
     
     # Claude 설정
     ANTHROPIC_API_KEY: Optional[str] = os.getenv('ANTHROPIC_API_KEY')
+    ANTHROPIC_BASE_URL: str = os.getenv('ANTHROPIC_BASE_URL', 'https://api.anthropic.com')
     
     # DeepSeek 설정 (추가)
     DEEPSEEK_API_KEY: Optional[str] = os.getenv('DEEPSEEK_API_KEY')
@@ -33,6 +34,102 @@ class AIConfig:
     # 응답 온도 (창의성)
     TEMPERATURE: float = 0.7
     
+    # 컨텐츠 생성 방식
+    # - per_category: 카테고리별로 4번 요청 (동시 실행)
+    # - combined: 네 카테고리를 하나의 JSON 문서로 한 번에 요청
+    GENERATION_MODE: str = os.getenv('AI_GENERATION_MODE', 'per_category')
+    
+    # Claude 응답 형식
+    # - text: 프롬프트로 JSON 배열을 요청하고 텍스트에서 추출
+    # - tool: 카테고리 스키마를 도구로 선언해 구조화된 JSON으로 받기 (파싱 실패 없음)
+    CLAUDE_OUTPUT_MODE: str = os.getenv('AI_CLAUDE_OUTPUT_MODE', 'text')
+    
+    # AI API 호출 녹화/재생 (ai_cassette)
+    # - record: 모든 요청/응답과 시간 정보를 카세트 파일에 기록
+    # - replay: 네트워크 없이 카세트에서 응답 (CASSETTE_SPEED 1=기록 속도, 0=즉시)
+    CASSETTE_MODE: str = os.getenv('AI_CASSETTE_MODE', '')
+    CASSETTE_PATH: str = os.getenv('AI_CASSETTE_PATH', 'instance/ai_cassette.jsonl.gz')
+    CASSETTE_SPEED: float = float(os.getenv('AI_CASSETTE_SPEED', '1'))
+    
+    # 프롬프트 캐시 (정적 지침 + 여행 정보 접두어 재사용)
+    # Claude는 cache_control을 지정하고, DeepSeek은 같은 접두어를 자동으로 캐시함
+    PROMPT_CACHE_ENABLED: bool = os.getenv('AI_PROMPT_CACHE', 'true').lower() == 'true'
+    # 첫 카테고리를 먼저 생성해 캐시를 만든 뒤 나머지를 동시에 생성 (동시 요청은 서로의 캐시를 못 읽음)
+    PROMPT_CACHE_PRIME_FIRST: bool = os.getenv('AI_PROMPT_CACHE_PRIME_FIRST', 'false').lower() == 'true'
+    
+    # 여행 컨텐츠 생성 전체 시간 제한 (초, 0이면 제한 없음)
+    # 시간 안에 끝나지 않은 카테고리는 목적지 템플릿으로 채움
+    GENERATION_DEADLINE_SECONDS: float = float(os.getenv('AI_GENERATION_DEADLINE', '45'))
+    
+    # combined 모드의 최대 출력 토큰 수
+    COMBINED_MAX_TOKENS: int = int(os.getenv('AI_COMBINED_MAX_TOKENS', '4096'))
+    
+    # 카테고리별 생성 요청을 동시에 보낼 최대 개수
+    MAX_CONCURRENT_REQUESTS: int = int(os.getenv('AI_MAX_CONCURRENT_REQUESTS', '4'))
+    
+    # API 요청 타임아웃 (초)
+    REQUEST_TIMEOUT: float = float(os.getenv('AI_REQUEST_TIMEOUT', '30'))
+    
+    # 재시도 설정 (429/5xx/네트워크 오류, 지수 백오프 + 지터, Retry-After 우선)
+    RETRY_MAX_ATTEMPTS: int = int(os.getenv('AI_RETRY_MAX_ATTEMPTS', '2'))  # 첫 요청 이후 재시도 횟수
+    RETRY_BASE_DELAY: float = float(os.getenv('AI_RETRY_BASE_DELAY', '0.5'))  # 초
+    RETRY_MAX_DELAY: float = float(os.getenv('AI_RETRY_MAX_DELAY', '8'))  # 이보다 길게 기다려야 하면 포기
+    
+    # 서킷 브레이커 설정 (연속 실패 시 대기 시간 동안 바로 대체 경로 사용)
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv('AI_CIRCUIT_FAILURE_THRESHOLD', '5'))
+    CIRCUIT_RESET_TIMEOUT: float = float(os.getenv('AI_CIRCUIT_RESET_TIMEOUT', '60'))  # 초
+    
+    # 공급자별 호출 한도 (분당 요청/토큰 수, 동시 요청 수, 0이면 제한 없음)
+    # 모든 스레드와 프로세스(웹 서버, worker.py)가 RATE_LIMIT_PATH 파일로 한도를 공유
+    RATE_LIMIT_ENABLED: bool = os.getenv('AI_RATE_LIMIT', 'true').lower() == 'true'
+    RATE_LIMIT_PATH: str = os.getenv('AI_RATE_LIMIT_PATH', 'instance/ai_ratelimit.db')
+    RATE_LIMIT_MAX_WAIT: float = float(os.getenv('AI_RATE_LIMIT_MAX_WAIT', '30'))  # 초, 넘으면 호출 포기
+    RATE_LIMITS: Dict[str, Dict[str, int]] = {
+        'claude': {
+            'requests_per_minute': int(os.getenv('AI_CLAUDE_RPM', '50')),
+            'tokens_per_minute': int(os.getenv('AI_CLAUDE_TPM', '50000')),
+            'max_concurrent': int(os.getenv('AI_CLAUDE_MAX_CONCURRENT', '8'))
+        },
+        'deepseek': {
+            'requests_per_minute': int(os.getenv('AI_DEEPSEEK_RPM', '60')),
+            'tokens_per_minute': int(os.getenv('AI_DEEPSEEK_TPM', '0')),
+            'max_concurrent': int(os.getenv('AI_DEEPSEEK_MAX_CONCURRENT', '8'))
+        }
+    }
+    
+    # 헤징 요청 (주 공급자가 늦으면 보조 공급자에도 요청해 먼저 온 유효한 결과 사용)
+    HEDGING_ENABLED: bool = os.getenv('AI_HEDGING', 'false').lower() == 'true'
+    HEDGE_SECONDARY_SERVICE: str = os.getenv('AI_HEDGE_SECONDARY', '')  # 비우면 claude <-> deepseek
+    HEDGE_DELAY_PERCENTILE: float = float(os.getenv('AI_HEDGE_PERCENTILE', '95'))  # 주 공급자 지연시간 백분위
+    HEDGE_DEFAULT_DELAY: float = float(os.getenv('AI_HEDGE_DEFAULT_DELAY', '8'))  # 표본이 부족할 때 (초)
+    HEDGE_MIN_DELAY: float = float(os.getenv('AI_HEDGE_MIN_DELAY', '1'))  # 초
+    HEDGE_MIN_SAMPLES: int = 20
+    
+    # AI 호출 계측 기록 파일 (JSONL, 비우면 메모리에서만 집계)
+    TELEMETRY_LOG_PATH: str = os.getenv('AI_TELEMETRY_LOG', '')
+    
+    # HTTP 연결 풀 설정 (keep-alive 연결 재사용)
+    HTTP_POOL_CONNECTIONS: int = int(os.getenv('AI_HTTP_POOL_CONNECTIONS', '4'))  # 유지할 호스트별 풀 개수
+    HTTP_POOL_MAXSIZE: int = int(os.getenv('AI_HTTP_POOL_MAXSIZE', '10'))  # 호스트당 최대 연결 수
+    HTTP_POOL_BLOCK: bool = os.getenv('AI_HTTP_POOL_BLOCK', 'false').lower() == 'true'  # 풀이 가득 차면 대기
+    
+    # LLM 응답 캐시 설정 (동일 프롬프트 재호출 방지)
+    COMPLETION_CACHE_ENABLED: bool = os.getenv('AI_COMPLETION_CACHE', 'true').lower() == 'true'
+    COMPLETION_CACHE_PATH: str = os.getenv('AI_CACHE_PATH', 'instance/ai_cache.db')
+    COMPLETION_CACHE_MAX_ENTRIES: int = int(os.getenv('AI_COMPLETION_CACHE_MAX_ENTRIES', '5000'))
+    COMPLETION_CACHE_DEFAULT_TTL: int = 24 * 3600
+    COMPLETION_CACHE_TTLS: Dict[str, int] = {
+        'checklist': 30 * 24 * 3600,
+        'items': 30 * 24 * 3600,
+        'local_info': 7 * 24 * 3600,  # 환율 등 자주 바뀌는 정보
+        'wishlist': 30 * 24 * 3600
+    }
+    
+    # 여행 컨텐츠 묶음 캐시 (목적지/계절/스타일/일수 구간 단위, stale-while-revalidate)
+    BUNDLE_CACHE_ENABLED: bool = os.getenv('AI_BUNDLE_CACHE', 'true').lower() == 'true'
+    BUNDLE_CACHE_FRESH_TTL: int = int(os.getenv('AI_BUNDLE_CACHE_FRESH_TTL', str(7 * 24 * 3600)))
+    BUNDLE_CACHE_STALE_TTL: int = int(os.getenv('AI_BUNDLE_CACHE_STALE_TTL', str(30 * 24 * 3600)))
+    
     @classmethod
     def is_ai_available(cls) -> bool:
         """실제 AI 서비스 사용 가능 여부"""
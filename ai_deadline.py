@@ -0,0 +1,66 @@
+"""
+AI 생성 전체 시간 제한 (deadline)
+
+generate_ai_travel_content가 정한 마감 시각을 컨텍스트 변수로 보관해
+카테고리 작업 스레드, 재시도, 호출 한도 대기, HTTP 타임아웃이 모두
+남은 시간 안에서만 동작하도록 합니다.
+"""
+
+import contextvars
+import time
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar('ai_deadline', default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """
+    블록 안의 AI 호출에 시간 제한 적용
+
+    Args:
+        seconds: 허용 시간 (초, None 또는 0 이하면 제한 없음). 바깥 제한이 더 짧으면 바깥 제한 유지
+    """
+    if not seconds or seconds <= 0:
+        yield
+        return
+
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """남은 시간 (초, 제한이 없으면 None)"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def deadline_exceeded() -> bool:
+    """시간 제한 초과 여부"""
+    remaining = remaining_time()
+    return remaining is not None and remaining <= 0
+
+
+def bounded_timeout(timeout: float) -> float:
+    """기본 타임아웃을 남은 시간으로 제한"""
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout
+    return max(0.1, min(timeout, remaining))
+
+
+def submit_with_deadline(executor: Executor, func: Callable[[], Any]) -> Future:
+    """현재 시간 제한을 작업 스레드로 전달하며 작업 제출"""
+    return executor.submit(contextvars.copy_context().run, func)
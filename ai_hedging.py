@@ -0,0 +1,152 @@
+"""
+AI 공급자 헤징 요청
+
+주 공급자에 먼저 요청하고, 최근 지연시간의 상위 백분위(p95)만큼 기다려도
+유효한 결과가 없으면 보조 공급자에도 같은 요청을 보내 먼저 도착한
+유효한 결과를 사용합니다. 늦은 요청은 기다리지 않고 버립니다.
+"""
+
+import math
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Optional
+
+from ai_config import AIConfig
+from ai_deadline import remaining_time, submit_with_deadline
+
+
+class LatencyTracker:
+    """
+    공급자별 최근 성공 요청 지연시간 기록
+
+    AI 호출 계측(AITelemetry.record_call)이 실제로 네트워크에 보낸 요청만 기록합니다.
+    응답 캐시/카세트 적중(거의 0초)이 섞이면 p95 대기 시간이 0에 가까워져
+    거의 모든 요청을 헤징하게 되기 때문입니다.
+    """
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, seconds: float):
+        """지연시간 기록"""
+        with self._lock:
+            samples = self._samples.get(provider)
+            if samples is None:
+                samples = self._samples[provider] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, provider: str, percent: float) -> Optional[float]:
+        """
+        지연시간 백분위수
+
+        Returns:
+            백분위수 (표본이 HEDGE_MIN_SAMPLES보다 적으면 None)
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(provider, ()))
+        if len(samples) < AIConfig.HEDGE_MIN_SAMPLES:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(len(samples) * percent / 100.0) - 1))
+        return samples[index]
+
+    def stats(self) -> Dict[str, Dict]:
+        """공급자별 표본 수와 p50/p95"""
+        with self._lock:
+            providers = list(self._samples)
+        return {
+            provider: {
+                'samples': len(self._samples[provider]),
+                'p50': self.percentile(provider, 50),
+                'p95': self.percentile(provider, 95)
+            }
+            for provider in providers
+        }
+
+
+_latency_tracker = LatencyTracker()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """공유 지연시간 기록기 반환"""
+    return _latency_tracker
+
+
+def get_hedge_delay(provider: str) -> float:
+    """보조 공급자 요청까지 기다릴 시간 (최근 지연시간 백분위 기반)"""
+    delay = _latency_tracker.percentile(provider, AIConfig.HEDGE_DELAY_PERCENTILE)
+    if delay is None:
+        delay = AIConfig.HEDGE_DEFAULT_DELAY
+    return max(AIConfig.HEDGE_MIN_DELAY, delay)
+
+
+def run_hedged(primary: Callable[[], Any], secondary: Callable[[], Any], primary_name: str,
+               secondary_name: str, delay: Optional[float] = None,
+               is_valid: Callable[[Any], bool] = bool, label: str = '') -> Any:
+    """
+    헤징 요청 실행
+
+    Args:
+        primary: 주 공급자 요청 함수
+        secondary: 보조 공급자 요청 함수
+        primary_name: 주 공급자명 (지연시간 기록용)
+        secondary_name: 보조 공급자명
+        delay: 보조 요청까지 기다릴 시간 (기본값: 주 공급자 p95)
+        is_valid: 결과가 유효한지 판단하는 함수
+        label: 로그에 표시할 이름 (카테고리명 등)
+
+    Returns:
+        먼저 도착한 유효한 결과 (둘 다 유효하지 않으면 주 공급자 결과)
+    """
+    if delay is None:
+        delay = get_hedge_delay(primary_name)
+    remaining = remaining_time()
+    if remaining is not None:
+        delay = min(delay, remaining)
+
+    # 늦은 요청을 기다리지 않도록 with 문 대신 shutdown(wait=False) 사용
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ai-hedge')
+    try:
+        futures = {submit_with_deadline(executor, primary): primary_name}
+        done, _ = wait(futures, timeout=delay)
+
+        primary_result = None
+        if done:
+            primary_result = _future_result(next(iter(done)), primary_name)
+            if is_valid(primary_result):
+                return primary_result
+            print(f"⚠️ {label} {primary_name} 결과 없음, {secondary_name}로 요청")
+        else:
+            print(f"⏱️ {label} {primary_name} 응답이 {delay:.1f}초를 넘어 {secondary_name}에도 요청")
+
+        futures[submit_with_deadline(executor, secondary)] = secondary_name
+        pending = {future for future in futures if not future.done()}
+        while pending:
+            done, pending = wait(pending, timeout=remaining_time(), return_when=FIRST_COMPLETED)
+            if not done:
+                print(f"⏰ {label} 시간 제한 초과")
+                break
+            for future in done:
+                name = futures[future]
+                result = _future_result(future, name)
+                if is_valid(result):
+                    if name != primary_name:
+                        print(f"🏁 {label} {name} 결과 사용")
+                    return result
+                if name == primary_name:
+                    primary_result = result
+
+        return primary_result if primary_result is not None else []
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _future_result(future, name: str) -> Any:
+    """작업 결과 (예외는 결과 없음으로 처리)"""
+    try:
+        return future.result()
+    except Exception as e:
+        print(f"❌ {name} 헤징 요청 오류: {e}")
+        return None
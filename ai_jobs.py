@@ -0,0 +1,355 @@
+"""
+AI 여행 컨텐츠 백그라운드 생성 작업
+
+여행 생성 요청은 작업만 등록하고 바로 응답하며, 실제 AI 생성과
+데이터베이스 적용은 워커 스레드가 처리합니다.
+작업은 데이터베이스(generation_job 테이블)에 저장되므로 웹 프로세스와
+별도 워커 프로세스(worker.py)가 같은 큐를 공유할 수 있습니다.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+CATEGORIES = ('checklist', 'items', 'local_info', 'wishlist')
+
+# 스트리밍 저장 권한 작업 상태 (워커가 가져가거나 재시도하지 않음)
+STREAM_JOB_STATUS = 'streaming'
+
+_wakeup = threading.Event()
+_workers: List[threading.Thread] = []
+
+
+def enqueue_generation_job(trip_id: int):
+    """
+    여행의 AI 컨텐츠 생성 작업 등록
+
+    Args:
+        trip_id: 여행 ID
+
+    Returns:
+        등록된 작업
+    """
+    from app import db, GenerationJob
+
+    job = GenerationJob(
+        trip_id=trip_id,
+        status='queued',
+        progress=json.dumps({category: {'status': 'pending', 'count': 0} for category in CATEGORIES})
+    )
+    db.session.add(job)
+    db.session.commit()
+
+    _wakeup.set()
+    return job
+
+
+def claim_next_job(worker_id: str):
+    """
+    대기 중인 작업 하나를 원자적으로 가져오기
+
+    여러 워커(스레드/프로세스)가 동시에 호출해도 한 작업은 한 워커만 가져갑니다.
+
+    Returns:
+        가져온 작업 (없으면 None)
+    """
+    from app import db, GenerationJob
+
+    while True:
+        job_id = db.session.query(GenerationJob.id).filter_by(status='queued') \
+            .order_by(GenerationJob.id).limit(1).scalar()
+        if job_id is None:
+            db.session.rollback()
+            return None
+
+        claimed = db.session.query(GenerationJob).filter_by(id=job_id, status='queued').update({
+            'status': 'running',
+            'worker': worker_id,
+            'started_at': datetime.utcnow(),
+            'attempts': GenerationJob.attempts + 1
+        }, synchronize_session=False)
+        db.session.commit()
+
+        if claimed:
+            return db.session.get(GenerationJob, job_id)
+
+
+def requeue_stale_jobs(stale_seconds: int) -> int:
+    """워커 종료 등으로 멈춘 실행 중 작업을 다시 대기 상태로 변경"""
+    from app import db, GenerationJob
+
+    cutoff = datetime.utcnow() - timedelta(seconds=stale_seconds)
+    count = db.session.query(GenerationJob).filter(
+        GenerationJob.status == 'running',
+        GenerationJob.started_at < cutoff
+    ).update({'status': 'queued'}, synchronize_session=False)
+    db.session.commit()
+    return count
+
+
+def claim_stream_job(trip_id: int, category: str, stale_seconds: int) -> Optional[int]:
+    """
+    한 카테고리 스트리밍 생성 결과의 저장 권한을 원자적으로 가져오기
+
+    여행에 대기/실행 중인 생성 작업이나 다른 스트리밍 저장이 없고 해당 카테고리 항목도
+    아직 없을 때만 작업 행을 추가하는 INSERT ... SELECT 한 문장이므로,
+    같은 여행에 동시에 요청해도 한 요청만 저장합니다.
+
+    Args:
+        trip_id: 여행 ID
+        category: AI 카테고리명
+        stale_seconds: 이 시간이 지난 스트리밍 저장은 끊긴 것으로 보고 무시
+
+    Returns:
+        저장 권한 작업 ID (이미 항목이 있거나 다른 작업이 저장 중이면 None)
+    """
+    from sqlalchemy import and_, exists, insert, literal, or_, select
+    from app import db, GenerationJob, AI_CATEGORY_KEYS, CONTENT_MODELS
+
+    model = CONTENT_MODELS[AI_CATEGORY_KEYS[category]]
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=stale_seconds)
+    active_job = exists().where(
+        GenerationJob.trip_id == trip_id,
+        or_(GenerationJob.status.in_(('queued', 'running')),
+            and_(GenerationJob.status == STREAM_JOB_STATUS, GenerationJob.started_at >= cutoff))
+    )
+    has_items = exists().where(model.trip_id == trip_id)
+
+    values = {
+        'trip_id': trip_id,
+        'status': STREAM_JOB_STATUS,
+        'progress': json.dumps({category: {'status': 'pending', 'count': 0}}),
+        'attempts': 1,
+        'worker': f'stream:{category}',
+        'created_at': now,
+        'started_at': now
+    }
+    claim = select(*(literal(value, getattr(GenerationJob, key).type) for key, value in values.items())) \
+        .where(~active_job, ~has_items)
+    job_id = db.session.execute(
+        insert(GenerationJob).from_select(list(values), claim).returning(GenerationJob.id)
+    ).scalar()
+    db.session.commit()
+    return job_id
+
+
+def finish_stream_job(job_id: int, category: str, count: int, error: Optional[str] = None) -> bool:
+    """
+    스트리밍 저장 권한 작업 종료 기록
+
+    Returns:
+        아직 이 요청이 맡고 있던 작업이면 True
+    """
+    from app import db, GenerationJob, AI_CATEGORY_KEYS
+
+    finished = db.session.query(GenerationJob).filter_by(id=job_id, status=STREAM_JOB_STATUS).update({
+        'status': 'failed' if error else 'completed',
+        'progress': json.dumps({category: {'status': 'done' if count else 'empty', 'count': count}}),
+        'result': json.dumps({AI_CATEGORY_KEYS[category]: count}),
+        'error': error,
+        'finished_at': datetime.utcnow()
+    }, synchronize_session=False)
+    db.session.commit()
+    return bool(finished)
+
+
+class JobProgress:
+    """
+    카테고리별 진행 상황 기록기
+
+    카테고리 생성은 여러 스레드에서 끝나므로, 각 기록은 자체 앱 컨텍스트에서
+    진행 상황 컬럼만 갱신합니다.
+    """
+
+    def __init__(self, app, job_id: int, progress: Dict):
+        self.app = app
+        self.job_id = job_id
+        self.progress = progress
+        self._lock = threading.Lock()
+
+    def update(self, category: str, items: List[Dict]):
+        """카테고리 생성 완료 기록"""
+        from app import db, GenerationJob
+
+        with self._lock:
+            self.progress[category] = {'status': 'done' if items else 'empty', 'count': len(items)}
+            progress = json.dumps(self.progress)
+
+            with self.app.app_context():
+                db.session.query(GenerationJob).filter_by(id=self.job_id).update(
+                    {'progress': progress}, synchronize_session=False
+                )
+                db.session.commit()
+
+
+def _finish_job(job_id: int, worker_id: str, values: Dict) -> bool:
+    """
+    이 워커가 아직 맡고 있는 작업일 때만 상태 변경 (커밋은 호출자가)
+
+    오래 걸려 다른 워커에게 다시 넘어간 작업이면 False를 반환하고,
+    호출자는 같은 트랜잭션의 컨텐츠 저장까지 되돌립니다.
+    """
+    from app import db, GenerationJob
+
+    return bool(db.session.query(GenerationJob).filter_by(
+        id=job_id, status='running', worker=worker_id
+    ).update(values, synchronize_session=False))
+
+
+def run_generation_job(job) -> None:
+    """
+    작업 실행: AI 컨텐츠 생성 후 여행에 적용
+
+    컨텐츠 저장과 작업 완료 표시는 한 트랜잭션으로 커밋하므로, 중간에 워커가
+    죽어 작업이 다시 대기열에 들어가도 컨텐츠가 두 번 저장되지 않습니다.
+    실패 시 최대 시도 횟수까지 다시 대기열에 넣고, 마지막 실패에는
+    기본 체크리스트를 적용합니다.
+    """
+    from app import app, db, Trip, GenerationJob, apply_ai_content_to_trip, apply_default_checklists
+    from ai_travel_assistant import generate_ai_travel_content
+
+    job_id = job.id
+    worker_id = job.worker
+    trip = db.session.get(Trip, job.trip_id)
+    if trip is None:
+        job.status = 'failed'
+        job.error = '여행을 찾을 수 없습니다.'
+        job.finished_at = datetime.utcnow()
+        db.session.commit()
+        return
+
+    days = (trip.end_date - trip.start_date).days + 1
+    tracker = JobProgress(app, job_id, json.loads(job.progress or '{}'))
+
+    try:
+        print(f"🛠️ 작업 #{job_id} 시작: {trip.destination} ({days}일)")
+        ai_content = generate_ai_travel_content(
+            trip.destination, days, trip.start_date, progress_callback=tracker.update
+        )
+        result = apply_ai_content_to_trip(trip.id, ai_content, commit=False)
+
+        if not _finish_job(job_id, worker_id, {
+            'status': 'completed',
+            'result': json.dumps(result),
+            'error': None,
+            'finished_at': datetime.utcnow()
+        }):
+            db.session.rollback()
+            print(f"⚠️ 작업 #{job_id}을 다른 워커가 맡아 결과를 저장하지 않습니다.")
+            return
+        db.session.commit()
+        print(f"✅ 작업 #{job_id} 완료: {result}")
+
+    except Exception as e:
+        db.session.rollback()
+        print(f"❌ 작업 #{job_id} 오류: {e}")
+
+        job = db.session.get(GenerationJob, job_id)
+        if job.attempts >= app.config['GENERATION_JOB_MAX_ATTEMPTS']:
+            # AI 생성 실패시 기본 체크리스트만 생성 (실패 표시와 같은 트랜잭션)
+            apply_default_checklists(trip.id, commit=False)
+            done = _finish_job(job_id, worker_id, {
+                'status': 'failed',
+                'error': str(e),
+                'finished_at': datetime.utcnow()
+            })
+        else:
+            done = _finish_job(job_id, worker_id, {'status': 'queued', 'error': str(e)})
+
+        if done:
+            db.session.commit()
+        else:
+            db.session.rollback()
+
+
+def _worker_loop(app, worker_id: str, stop_event: Optional[threading.Event] = None):
+    """작업을 가져와 실행하는 워커 루프 (멈춘 작업도 주기적으로 다시 대기열에 넣음)"""
+    poll_interval = app.config['GENERATION_JOB_POLL_INTERVAL']
+    stale_seconds = app.config['GENERATION_JOB_STALE_SECONDS']
+    next_requeue = time.monotonic() + stale_seconds / 2
+
+    while not (stop_event and stop_event.is_set()):
+        try:
+            with app.app_context():
+                if time.monotonic() >= next_requeue:
+                    next_requeue = time.monotonic() + stale_seconds / 2
+                    requeued = requeue_stale_jobs(stale_seconds)
+                    if requeued:
+                        print(f"♻️ 멈춘 작업 {requeued}개를 다시 대기열에 넣었습니다.")
+
+                job = claim_next_job(worker_id)
+                if job is not None:
+                    run_generation_job(job)
+                    continue
+        except Exception as e:
+            print(f"❌ 워커 {worker_id} 오류: {e}")
+
+        _wakeup.wait(poll_interval)
+        _wakeup.clear()
+
+
+def start_generation_workers(app, workers: Optional[int] = None,
+                             stop_event: Optional[threading.Event] = None) -> List[threading.Thread]:
+    """
+    현재 프로세스에서 백그라운드 워커 스레드 시작
+
+    Args:
+        app: Flask 앱
+        workers: 워커 수 (기본값: GENERATION_WORKERS 설정)
+        stop_event: 설정되면 워커가 종료되는 이벤트
+
+    Returns:
+        시작된 워커 스레드 목록
+    """
+    if _workers and stop_event is None:
+        return _workers
+
+    count = workers if workers is not None else app.config['GENERATION_WORKERS']
+
+    with app.app_context():
+        requeued = requeue_stale_jobs(app.config['GENERATION_JOB_STALE_SECONDS'])
+        if requeued:
+            print(f"♻️ 멈춘 작업 {requeued}개를 다시 대기열에 넣었습니다.")
+
+    prefix = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+    threads = []
+    for index in range(count):
+        thread = threading.Thread(
+            target=_worker_loop,
+            args=(app, f"{prefix}-{index}", stop_event),
+            name=f"generation-worker-{index}",
+            daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+
+    if stop_event is None:
+        _workers.extend(threads)
+    print(f"🛠️ AI 생성 워커 {count}개를 시작했습니다.")
+    return threads
+
+
+def get_generation_status(trip_id: int) -> Dict:
+    """여행의 최근 생성 작업 상태"""
+    from app import GenerationJob
+
+    job = GenerationJob.query.filter_by(trip_id=trip_id).order_by(GenerationJob.id.desc()).first()
+    if job is None:
+        return {'status': 'none'}
+
+    return {
+        'job_id': job.id,
+        'status': job.status,
+        'progress': json.loads(job.progress or '{}'),
+        'result': json.loads(job.result) if job.result else None,
+        'error': job.error,
+        'attempts': job.attempts,
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None
+    }
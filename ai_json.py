@@ -0,0 +1,595 @@
+"""
+AI 응답 JSON 처리 유틸리티
+
+- 스트리밍으로 도착하는 JSON 배열에서 객체가 완성되는 즉시 꺼내는 증분 파서
+- 설명 문장/코드 블록이 섞이거나 일부 손상된(후행 쉼표, 잘린 마지막 객체,
+  둥근 따옴표) 응답에서도 항목을 최대한 살리는 단일 패스 추출기
+- 카테고리별 필드 정규화 (수량은 정수, 평점은 실수 또는 None 등)
+- 잘리거나 복구한 응답에서 나온 카테고리 기록 (degraded_scope, 묶음 캐시 저장 판단용)
+"""
+
+import contextvars
+import json
+import math
+import re
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# 상태별로 다음에 확인해야 할 문자만 찾아 건너뛰기 위한 패턴
+_ARRAY_START = re.compile(r'\[')
+_ARRAY_LEVEL = re.compile(r'[{\]]')
+_OBJECT_LEVEL = re.compile(r'["{}\[\]]')
+_STRING_LEVEL = re.compile(r'["\\]')
+
+_decoder = json.JSONDecoder()
+
+# 손상 복구용 패턴
+_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+_SMART_QUOTE_OPEN = re.compile(r'([{\[,:]\s*)[“”]')
+_SMART_QUOTE_CLOSE = re.compile(r'[“”](\s*[:,}\]])')
+
+# degraded_scope 안에서 max_tokens에 잘리거나 JSON 복구로 살린 카테고리
+_degraded: contextvars.ContextVar[Optional[Set[str]]] = contextvars.ContextVar('ai_degraded', default=None)
+
+
+@contextmanager
+def degraded_scope() -> Iterator[Set[str]]:
+    """
+    블록 안에서 잘리거나 복구된 응답의 카테고리 모으기
+
+    컨텍스트 변수이므로 submit_with_deadline으로 제출한 카테고리 작업 스레드의
+    기록도 같은 집합에 모입니다.
+
+    Yields:
+        카테고리명 집합 (블록이 끝난 뒤 확인)
+    """
+    categories: Set[str] = set()
+    token = _degraded.set(categories)
+    try:
+        yield categories
+    finally:
+        _degraded.reset(token)
+
+
+def mark_degraded(category: Optional[str], reason: str):
+    """잘리거나 복구된 응답의 카테고리 기록 (degraded_scope 밖에서는 무시)"""
+    categories = _degraded.get()
+    category = category or 'unknown'
+    if categories is not None and category not in categories:
+        categories.add(category)
+        print(f"⚠️ {category} 응답 품질 저하 ({reason})")
+
+
+class JSONArrayStreamParser:
+    """
+    JSON 배열 증분 파서
+
+    텍스트 조각을 feed()로 넣으면 최상위 배열 안에서 닫는 중괄호가 도착한
+    객체들을 바로 반환합니다. 배열 앞의 설명 문장이나 ```json 코드 블록
+    표시는 무시합니다. 문자를 하나씩 보지 않고 상태별로 의미 있는 문자
+    (괄호, 따옴표, 백슬래시)만 정규식으로 찾아 이동합니다.
+
+    tolerant=True이면 파싱에 실패한 객체를 복구해 다시 시도하고, close()에서
+    잘린 마지막 객체도 완성된 필드까지 살립니다.
+    """
+
+    def __init__(self, tolerant: bool = False):
+        self.tolerant = tolerant
+        self._in_array = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._buffer: List[str] = []
+        self.finished = False
+        self.repaired = 0
+
+    def feed(self, chunk: str) -> List[Dict]:
+        """
+        텍스트 조각 처리
+
+        Args:
+            chunk: 새로 도착한 텍스트
+
+        Returns:
+            이번 조각으로 완성된 객체 리스트
+        """
+        completed = []
+        if self.finished:
+            return completed
+
+        index, length = 0, len(chunk)
+        start = 0 if self._depth else None  # 현재 객체가 이 조각에서 시작하는 위치
+
+        while index < length:
+            if self._escape:
+                self._escape = False
+                index += 1
+                continue
+
+            if not self._in_array:
+                pattern = _ARRAY_START
+            elif self._depth == 0:
+                pattern = _ARRAY_LEVEL
+            elif self._in_string:
+                pattern = _STRING_LEVEL
+            else:
+                pattern = _OBJECT_LEVEL
+
+            match = pattern.search(chunk, index)
+            if match is None:
+                break
+            index = match.start()
+            char = chunk[index]
+
+            if not self._in_array:
+                self._in_array = True
+            elif self._depth == 0:
+                if char == ']':
+                    self.finished = True
+                    break
+                self._depth = 1
+                start = index
+            elif self._in_string:
+                if char == '\\':
+                    self._escape = True
+                else:
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._buffer.append(chunk[start:index + 1])
+                    text = ''.join(self._buffer)
+                    self._buffer = []
+                    start = None
+                    obj = self._load(text)
+                    if isinstance(obj, dict):
+                        completed.append(obj)
+
+            index += 1
+
+        if self._depth and start is not None:
+            self._buffer.append(chunk[start:])
+
+        return completed
+
+    def close(self) -> List[Dict]:
+        """
+        입력 종료 처리
+
+        Returns:
+            tolerant 모드에서 잘린 마지막 객체를 복구한 결과 (없으면 빈 리스트)
+        """
+        text = ''.join(self._buffer)
+        self._buffer = []
+        if not (self.tolerant and self._depth and text):
+            return []
+
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        closed = close_truncated_json(text)
+        if closed is None:
+            return []
+
+        obj = self._load(closed)
+        if not isinstance(obj, dict):
+            return []
+        self.repaired += 1
+        return [obj]
+
+    def _load(self, text: str) -> Any:
+        """객체 텍스트 파싱 (tolerant 모드에서는 실패 시 복구 후 재시도)"""
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            if not self.tolerant:
+                return None
+
+        try:
+            obj = json.loads(repair_json_text(text))
+        except json.JSONDecodeError:
+            return None
+        self.repaired += 1
+        return obj
+
+
+def iter_json_array_objects(chunks: Iterable[str]) -> Iterator[Dict]:
+    """
+    텍스트 조각 스트림에서 JSON 배열의 객체를 하나씩 생성
+
+    배열이 끝난 뒤의 조각은 버리지만 스트림은 끝까지 읽습니다. 클라이언트는
+    종료 이벤트(종료 사유, 토큰 사용량)까지 받아야 응답을 정상 종료로 보고 캐시합니다.
+
+    Args:
+        chunks: 스트리밍 응답 텍스트 조각들
+
+    Yields:
+        완성된 JSON 객체
+    """
+    parser = JSONArrayStreamParser(tolerant=True)
+    for chunk in chunks:
+        if not parser.finished:
+            yield from parser.feed(chunk)
+    if not parser.finished:
+        yield from parser.close()
+
+
+def repair_json_text(text: str) -> str:
+    """흔한 손상 복구: 구조 위치의 둥근 따옴표, 닫는 괄호 앞 후행 쉼표"""
+    text = _SMART_QUOTE_OPEN.sub(r'\1"', text)
+    text = _SMART_QUOTE_CLOSE.sub(r'"\1', text)
+    return _TRAILING_COMMA.sub(r'\1', text)
+
+
+def _find_object_end(text: str, start: int) -> Optional[int]:
+    """start 위치의 '{'와 짝이 맞는 닫는 괄호 다음 위치 (잘렸으면 None)"""
+    depth = 0
+    index = start
+    while True:
+        match = _OBJECT_LEVEL.search(text, index)
+        if match is None:
+            return None
+        index = match.start()
+        char = text[index]
+        if char == '"':
+            # 문자열 끝까지 건너뛰기 (이스케이프된 따옴표 제외)
+            string_end = _STRING_LEVEL.search(text, index + 1)
+            while string_end is not None and text[string_end.start()] == '\\':
+                string_end = _STRING_LEVEL.search(text, string_end.start() + 2)
+            if string_end is None:
+                return None
+            index = string_end.start() + 1
+            continue
+        if char in '{[':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+
+
+def _salvage_array(text: str, start: int) -> List[Dict]:
+    """
+    start 위치의 '['부터 객체를 하나씩 추출
+
+    정상 객체는 C 구현 디코더(raw_decode)로 바로 읽고, 손상된 객체만
+    괄호 짝을 찾아 복구를 시도합니다.
+    """
+    items: List[Dict] = []
+    index = start + 1
+    while True:
+        match = _ARRAY_LEVEL.search(text, index)
+        if match is None or text[match.start()] == ']':
+            return items
+        index = match.start()
+
+        try:
+            obj, index = _decoder.raw_decode(text, index)
+        except json.JSONDecodeError:
+            end = _find_object_end(text, index)
+            if end is None:
+                # 잘린 마지막 객체: 완성된 필드까지만 사용
+                closed = close_truncated_json(text[index:])
+                obj = _loads_or_none(closed) if closed else None
+                if isinstance(obj, dict):
+                    items.append(obj)
+                return items
+            obj = _loads_or_none(repair_json_text(text[index:end]))
+            index = end
+
+        if isinstance(obj, dict):
+            items.append(obj)
+
+
+def _loads_or_none(text: str) -> Any:
+    """JSON 파싱 (실패 시 None)"""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return None
+
+
+def close_truncated_json(text: str) -> Optional[str]:
+    """
+    중간에 잘린 JSON 값을 마지막으로 완성된 필드까지 잘라 괄호를 닫기
+
+    Args:
+        text: '{' 또는 '['로 시작하는 잘린 텍스트
+
+    Returns:
+        닫힌 JSON 텍스트 (살릴 수 있는 필드가 없으면 None)
+    """
+    stack: List[str] = []
+    in_string = False
+    escape = False
+    safe_end = None
+    safe_stack: List[str] = []
+
+    for index, char in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif char == '\\':
+                escape = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in '{[':
+            stack.append('}' if char == '{' else ']')
+        elif char in '}]':
+            if stack:
+                stack.pop()
+            safe_end, safe_stack = index + 1, list(stack)
+        elif char == ',':
+            # 쉼표 앞까지는 완성된 값
+            safe_end, safe_stack = index, list(stack)
+
+    if safe_end is None:
+        return None
+    return text[:safe_end].rstrip() + ''.join(reversed(safe_stack))
+
+
+def extract_json_array(text: str) -> List[Dict]:
+    """
+    모델 응답에서 가장 바깥 JSON 배열의 객체들을 추출
+
+    정상 응답은 json.loads 한 번으로 처리하고, 실패하면 흔한 손상을 고쳐
+    다시 시도한 뒤, 그래도 실패하면 배열을 한 번 훑으며 손상된 객체만
+    복구하거나 건너뛰어 살릴 수 있는 객체를 반환합니다.
+
+    Args:
+        text: AI 응답 텍스트
+
+    Returns:
+        객체 리스트 (배열을 찾지 못하면 빈 리스트)
+    """
+    return _extract_json_array(text)[0]
+
+
+def _extract_json_array(text: str) -> Tuple[List[Dict], bool]:
+    """extract_json_array 본체 (객체 리스트, 복구 경로 사용 여부)"""
+    if not text:
+        return [], False
+
+    start = text.find('[')
+    end = text.rfind(']')
+    if start != -1 and end > start:
+        # 정상 응답, 그다음 후행 쉼표/둥근 따옴표만 고친 응답을 한 번에 파싱
+        candidate = text[start:end + 1]
+        for source in (candidate, None):
+            try:
+                parsed = json.loads(source if source is not None else repair_json_text(candidate))
+            except json.JSONDecodeError:
+                continue
+            if isinstance(parsed, list):
+                return [obj for obj in parsed if isinstance(obj, dict)], source is None
+            break
+
+    # 설명 문장 속 '[참고]' 같은 괄호에서 시작했으면 다음 '['부터 다시 시도
+    while start != -1:
+        items = _salvage_array(text, start)
+        if items:
+            return items, True
+        start = text.find('[', start + 1)
+    return [], False
+
+
+def extract_json_category_arrays(text: str, categories: Iterable[str]) -> Dict[str, List[Dict]]:
+    """
+    통합 응답({"checklist": [...], ...})에서 카테고리별 배열 추출
+
+    객체 전체가 정상이면 json.loads 한 번으로 처리하고, 손상되었으면
+    카테고리 키마다 배열 위치를 찾아 extract_json_array로 복구합니다.
+
+    Returns:
+        카테고리명 -> 객체 리스트 (찾지 못한 카테고리는 제외)
+    """
+    result: Dict[str, List[Dict]] = {}
+    if not text:
+        return result
+
+    start = text.find('{')
+    end = text.rfind('}')
+    if start != -1 and end > start:
+        try:
+            parsed = json.loads(text[start:end + 1])
+        except json.JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, dict):
+            for category in categories:
+                if isinstance(parsed.get(category), list):
+                    result[category] = [obj for obj in parsed[category] if isinstance(obj, dict)]
+            return result
+
+    # 객체 전체가 손상되었으므로 여기서 살린 카테고리는 모두 복구분
+    for category in categories:
+        match = re.search(r'"%s"\s*:\s*\[' % re.escape(category), text)
+        if match:
+            items = extract_json_array(text[match.end() - 1:])
+            if items:
+                result[category] = items
+                mark_degraded(category, 'JSON 복구')
+    return result
+
+
+# 카테고리별 필드 정규화 규칙
+# - required: 비어 있으면 항목을 버리는 필드
+# - defaults: 없거나 비어 있으면 채우는 기본값
+# - optional: 문자열 또는 None으로 정리하는 필드
+CATEGORY_FIELDS: Dict[str, Dict[str, Any]] = {
+    'checklist': {
+        'required': ('title',),
+        'defaults': {'category': '출발 전', 'priority': 'medium'},
+        'optional': ('description',)
+    },
+    'items': {
+        'required': ('name',),
+        'defaults': {'category': '기타', 'quantity': 1},
+        'optional': ('notes',)
+    },
+    'local_info': {
+        'required': ('title',),
+        'defaults': {'category': '기타', 'content': ''},
+        'optional': ('phone', 'address')
+    },
+    'wishlist': {
+        'required': ('place_name',),
+        'defaults': {'category': '관광지', 'priority': 'medium'},
+        'optional': ('description', 'address')
+    }
+}
+
+PRIORITY_ALIASES = {
+    'high': 'high', '높음': 'high', '상': 'high', 'urgent': 'high',
+    'medium': 'medium', 'mid': 'medium', 'normal': 'medium', '보통': 'medium', '중간': 'medium', '중': 'medium',
+    'low': 'low', '낮음': 'low', '하': 'low'
+}
+
+_NUMBER = re.compile(r'-?\d+(?:\.\d+)?')
+
+# 수량 상한 (넘으면 기본값, SQLite INTEGER 범위를 넘는 값이 일괄 저장 전체를 실패시키지 않도록)
+MAX_QUANTITY = 9999
+
+
+_NULL_TEXTS = frozenset(('null', 'none', 'n/a'))
+
+
+def _clean_text(value: Any) -> Optional[str]:
+    """문자열 정리 (None/빈 값/'null'은 None)"""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        if isinstance(value, (dict, list)):
+            return None
+        value = str(value)
+    text = value.strip()
+    if not text or (len(text) <= 4 and text.lower() in _NULL_TEXTS):
+        return None
+    return text
+
+
+def _to_int(value: Any, default: int) -> int:
+    """수량 변환 ('2개', '2.0', 2.5 -> 1~MAX_QUANTITY 정수, 실패/범위 초과 시 기본값)"""
+    if isinstance(value, bool):
+        return default
+    if isinstance(value, (int, float)):
+        number = value
+    else:
+        match = _NUMBER.search(str(value or ''))
+        if match is None:
+            return default
+        number = float(match.group())
+    # json.loads는 NaN/Infinity와 1e30 같은 큰 값을 허용함
+    if isinstance(number, float) and not math.isfinite(number):
+        return default
+    if number > MAX_QUANTITY:
+        return default
+    return max(1, int(number))
+
+
+def _to_rating(value: Any) -> Optional[float]:
+    """평점 변환 ('4.5/5', '4.5점' -> 4.5, 실패 시 None)"""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        rating = float(value)
+    else:
+        match = _NUMBER.search(str(value))
+        if match is None:
+            return None
+        rating = float(match.group())
+    # NaN/Infinity는 데이터베이스에 넣지 않음
+    return rating if math.isfinite(rating) else None
+
+
+def coerce_item(item: Dict, category: str) -> Optional[Dict]:
+    """
+    카테고리 규칙에 맞게 항목 필드 정규화
+
+    Args:
+        item: 파싱된 항목
+        category: 카테고리명 (checklist, items, local_info, wishlist)
+
+    Returns:
+        정규화된 항목 (필수 필드가 없으면 None)
+    """
+    rules = CATEGORY_FIELDS.get(category)
+    if rules is None:
+        return item
+
+    result = dict(item)
+    for field in rules['required']:
+        value = _clean_text(item.get(field))
+        if value is None:
+            return None
+        result[field] = value
+
+    for field, default in rules['defaults'].items():
+        if field == 'quantity':
+            result[field] = _to_int(item.get(field), default)
+        elif field == 'priority':
+            priority = (_clean_text(item.get(field)) or '').lower()
+            result[field] = PRIORITY_ALIASES.get(priority, default)
+        else:
+            result[field] = _clean_text(item.get(field)) or default
+
+    for field in rules['optional']:
+        result[field] = _clean_text(item.get(field))
+
+    if category == 'local_info':
+        result['rating'] = _to_rating(item.get('rating'))
+
+    return result
+
+
+def coerce_items(items: Iterable[Dict], category: str) -> List[Dict]:
+    """항목 리스트 정규화 (필수 필드가 없는 항목은 제외)"""
+    result = []
+    for item in items:
+        coerced = coerce_item(item, category)
+        if coerced is not None:
+            result.append(coerced)
+    return result
+
+
+def parse_category_items(text: str, category: str) -> List[Dict]:
+    """
+    카테고리 응답 텍스트를 정규화된 항목 리스트로 변환
+
+    Args:
+        text: AI 응답 텍스트
+        category: 카테고리명
+
+    Returns:
+        정규화된 항목 리스트 (손상을 복구해 얻은 항목이면 mark_degraded로 기록)
+    """
+    items, repaired = _extract_json_array(text)
+    if repaired:
+        mark_degraded(category, 'JSON 복구')
+    return coerce_items(items, category)
+
+
+def has_category_items(text: str, category: Optional[str]) -> bool:
+    """
+    응답에서 정규화된 항목을 하나 이상 얻을 수 있는지 (응답 캐시 저장 판단용)
+
+    Args:
+        text: AI 응답 텍스트
+        category: 카테고리명 ('all'이면 통합 응답, 카테고리가 아니면 텍스트 유무만 확인)
+    """
+    if not text:
+        return False
+    if category == 'all':
+        arrays = extract_json_category_arrays(text, CATEGORY_FIELDS)
+        return any(coerce_items(items, name) for name, items in arrays.items())
+    if category in CATEGORY_FIELDS:
+        return bool(coerce_items(extract_json_array(text), category))
+    return True
@@ -0,0 +1,69 @@
+"""
+AI 카테고리 병렬 생성 유틸리티
+
+체크리스트, 준비물품, 현지정보, 위시리스트처럼 서로 독립적인 생성 작업을
+제한된 크기의 스레드 풀에서 동시에 실행합니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from typing import Any, Callable, Dict, Optional
+
+from ai_deadline import remaining_time, submit_with_deadline
+
+
+def run_category_tasks(tasks: Dict[str, Callable[[], Any]], max_workers: int = 4,
+                       on_complete: Optional[Callable[[str, Any], None]] = None) -> Dict[str, Any]:
+    """
+    카테고리별 작업을 동시에 실행
+
+    각 작업은 독립적으로 실패하며, 실패한 카테고리는 빈 리스트로 채워집니다.
+    시간 제한(ai_deadline)이 있으면 마감 시각까지 끝난 카테고리만 반환하고
+    끝나지 않은 작업은 기다리지 않습니다.
+
+    Args:
+        tasks: 카테고리명 -> 인자 없는 생성 함수
+        max_workers: 동시에 실행할 최대 작업 수
+        on_complete: 카테고리가 끝날 때마다 (카테고리명, 결과)로 호출되는 콜백
+
+    Returns:
+        카테고리명 -> 작업 결과 (입력 순서 유지, 시간 초과한 카테고리는 제외)
+    """
+    results: Dict[str, Any] = {}
+    if not tasks:
+        return results
+
+    workers = max(1, min(max_workers, len(tasks)))
+    # 시간 초과 시 남은 작업을 기다리지 않도록 with 문 대신 shutdown(wait=False) 사용
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ai-category')
+    try:
+        futures = {submit_with_deadline(executor, task): category for category, task in tasks.items()}
+        try:
+            for future in as_completed(futures, timeout=remaining_time()):
+                category = futures[future]
+                try:
+                    results[category] = future.result()
+                except Exception as e:
+                    print(f"❌ {category} 생성 오류: {e}")
+                    results[category] = []
+                
+                if on_complete:
+                    notify_progress(on_complete, category, results[category])
+        except TimeoutError:
+            unfinished = [category for future, category in futures.items() if category not in results]
+            print(f"⏰ 시간 제한 초과, 미완료 카테고리: {', '.join(unfinished)}")
+            for future in futures:
+                future.cancel()
+    finally:
+        executor.shutdown(wait=False)
+
+    return {category: results[category] for category in tasks if category in results}
+
+
+def notify_progress(callback: Optional[Callable[[str, Any], None]], category: str, result: Any):
+    """진행 상황 콜백 호출 (콜백 오류는 생성 결과에 영향을 주지 않음)"""
+    if callback is None:
+        return
+    try:
+        callback(category, result)
+    except Exception as e:
+        print(f"⚠️ {category} 진행 상황 기록 오류: {e}")
@@ -0,0 +1,210 @@
+"""
+AI 여행 컨텐츠 프롬프트 구성
+
+프롬프트를 세 부분으로 나눠 공급자의 프롬프트 캐시가 앞부분을 재사용하게 합니다.
+
+1. instructions: 모든 여행/카테고리에 공통인 정적 지침 (네 카테고리 작성 규칙 전체)
+2. context: 여행 정보 (같은 여행의 카테고리 요청끼리 공통)
+3. request: 카테고리별 짧은 요청
+
+Anthropic은 앞의 두 부분에 cache_control을 지정하고, DeepSeek은 같은
+접두어를 자동으로 캐시하므로 순서와 내용이 매번 똑같아야 합니다.
+"""
+
+from typing import Dict, List
+
+CATEGORY_GUIDES = {
+    'checklist': """**체크리스트 (checklist)**
+여행 준비를 위한 단계별 체크리스트를 만들어주세요.
+
+다음 카테고리로 분류해주세요:
+- 출발 전 (3-4개): 여행 전 필수 준비사항
+- 1일차 (2-3개): 도착 후 첫날 할 일
+- 2일차 (여행이 3일 이상인 경우, 1-2개)
+- 3일차 (여행이 5일 이상인 경우, 1-2개)
+- 귀국 후 (1-2개): 여행 후 정리사항
+
+형식:
+[
+    {"category": "출발 전", "title": "여권 유효기간 확인", "priority": "high", "description": "6개월 이상 남아있는지 확인"},
+    {"category": "1일차", "title": "현지 심카드 구매", "priority": "medium", "description": "공항이나 편의점에서 구매"}
+]
+
+목적지의 특성과 계절을 고려한 실용적인 체크리스트를 만들어주세요.""",
+
+    'items': """**준비물품 (items)**
+여행에 필요한 준비물품을 카테고리별로 추천해주세요.
+
+다음 카테고리로 분류해주세요:
+- 서류 (여권, 비자, 보험 등)
+- 의류 (현지 날씨와 문화 고려)
+- 용품 (현지에서 구하기 어려운 것들)
+- 약품 (현지 특성 고려)
+- 전자기기 (현지 전압, 인터넷 등 고려)
+
+형식:
+[
+    {"category": "의류", "name": "방수 재킷", "quantity": 1, "notes": "우기철 필수품"},
+    {"category": "전자기기", "name": "멀티 어댑터", "quantity": 1, "notes": "현지 콘센트 형태 확인"}
+]
+
+현지 특성을 반영한 실용적인 물품들을 추천해주세요.""",
+
+    'local_info': """**현지정보 (local_info)**
+여행지에서 유용한 현지 정보를 제공해주세요.
+
+다음 카테고리로 분류해주세요:
+- 환율 (현재 환율 정보 및 팁)
+- 긴급연락처 (영사관, 응급실, 경찰 등)
+- 교통수단 (추천 앱, 교통카드, 택시 팁 등)
+- 맛집 (현지 특색 음식 2-3곳)
+- 기타 (팁 문화, 주의사항, 에티켓 등)
+
+형식:
+[
+    {"category": "환율", "title": "현지 화폐 정보", "content": "1달러 = 1300원 (변동)", "rating": null, "phone": null, "address": null},
+    {"category": "맛집", "title": "현지 특색 음식점", "content": "현지인 추천 맛집", "rating": 4.8, "phone": "+82-2-1234-5678", "address": "서울시 중구 명동"}
+]
+
+최신이고 정확한 정보를 제공해주세요.""",
+
+    'wishlist': """**위시리스트 (wishlist)**
+여행자들이 꼭 가봐야 할 장소들을 추천해주세요.
+
+다음 카테고리로 분류해주세요:
+- 관광지 (대표 명소, 박물관 등)
+- 맛집 (현지 특색 음식점)
+- 체험 (현지만의 특별한 활동)
+- 쇼핑 (기념품, 특산품 구매처)
+- 기타 (숨은 명소, 포토스팟 등)
+
+여행 기간에 맞게 우선순위를 설정해주세요.
+
+형식:
+[
+    {"place_name": "에펠탑", "category": "관광지", "description": "파리의 상징적 랜드마크", "priority": "high", "address": "파리 7구"},
+    {"place_name": "현지 전통시장", "category": "쇼핑", "description": "현지 문화 체험 가능", "priority": "medium", "address": "시장 주소"}
+]
+
+현지인들도 추천하는 진정성 있는 장소들을 포함해주세요."""
+}
+
+CATEGORY_REQUESTS = {
+    'checklist': '**체크리스트 요청:**\n위 여행에 대한 체크리스트(checklist)만 만들어주세요.\n다른 설명 없이 JSON 배열만 응답해주세요.\n',
+    'items': '**준비물품 요청:**\n위 여행에 대한 준비물품(items)만 추천해주세요.\n다른 설명 없이 JSON 배열만 응답해주세요.\n',
+    'local_info': '**현지정보 요청:**\n위 여행에 대한 현지정보(local_info)만 제공해주세요.\n다른 설명 없이 JSON 배열만 응답해주세요.\n',
+    'wishlist': '**위시리스트 요청:**\n위 여행에 대한 위시리스트(wishlist)만 추천해주세요.\n다른 설명 없이 JSON 배열만 응답해주세요.\n'
+}
+
+# 카테고리별 항목 이름 필드 (기존 항목 제외/중복 판단용)
+CATEGORY_TITLE_FIELDS = {
+    'checklist': 'title',
+    'items': 'name',
+    'local_info': 'title',
+    'wishlist': 'place_name'
+}
+
+CATEGORY_LABELS = {
+    'checklist': '체크리스트',
+    'items': '준비물품',
+    'local_info': '현지정보',
+    'wishlist': '위시리스트'
+}
+
+# 추가 생성 요청에 넣을 기존 항목 이름 최대 개수
+MAX_GAP_FILL_EXCLUSIONS = 100
+
+GAP_FILL_REQUEST = """**{label} 추가 요청:**
+위 여행에는 이미 아래 {label} 항목이 있습니다.
+{exclusions}
+이 항목들과 겹치지 않는 새로운 {label}({category})만 만들어주세요.
+다른 설명 없이 JSON 배열만 응답해주세요.
+"""
+
+COMBINED_REQUEST = """**전체 여행 준비 요청:**
+위 여행에 대한 네 가지 항목(checklist, items, local_info, wishlist)을 한 번에 만들어주세요.
+
+다음 JSON 형식으로만 응답해주세요:
+{"checklist": [...], "items": [...], "local_info": [...], "wishlist": [...]}
+
+다른 설명 없이 JSON 객체만 응답해주세요.
+"""
+
+
+class SegmentedPrompt(str):
+    """
+    캐시 가능한 부분으로 나뉜 프롬프트
+
+    문자열로는 전체 프롬프트(instructions + context + request)와 같아서
+    응답 캐시 키, 토큰 추정, 부분 구분을 모르는 공급자에 그대로 사용할 수 있습니다.
+    """
+
+    def __new__(cls, instructions: str, context: str, request: str):
+        prompt = super().__new__(cls, instructions + context + request)
+        prompt.instructions = instructions
+        prompt.context = context
+        prompt.request = request
+        return prompt
+
+
+def build_instructions(intro: str) -> str:
+    """
+    정적 지침 생성 (여행 정보가 들어가지 않아 모든 요청에서 동일)
+
+    Args:
+        intro: 공급자별 도입 문장
+
+    Returns:
+        네 카테고리 작성 규칙을 모두 포함한 지침
+    """
+    guides = '\n\n'.join(CATEGORY_GUIDES.values())
+    return f"""{intro.strip()}
+
+요청마다 아래 카테고리 중 하나 또는 전체를 요청합니다. 각 카테고리는 다음 규칙에 따라 작성해주세요.
+
+{guides}
+
+모든 응답은 요청한 JSON만 포함하고 다른 설명은 붙이지 마세요.
+
+"""
+
+
+def build_category_prompts(instructions: str, context: str) -> Dict[str, SegmentedPrompt]:
+    """카테고리명 -> 분할 프롬프트"""
+    return {
+        category: SegmentedPrompt(instructions, context, request)
+        for category, request in CATEGORY_REQUESTS.items()
+    }
+
+
+def build_gap_fill_prompt(instructions: str, context: str, category: str,
+                          exclusions: List[str]) -> SegmentedPrompt:
+    """
+    기존 항목을 제외하고 한 카테고리만 추가로 요청하는 분할 프롬프트
+
+    지침과 여행 컨텍스트는 build_category_prompts와 같아서 프롬프트 캐시를 그대로 재사용합니다.
+
+    Args:
+        instructions: 정적 지침
+        context: 여행 컨텍스트
+        category: 카테고리명
+        exclusions: 이미 있는 항목 이름 (앞에서부터 MAX_GAP_FILL_EXCLUSIONS개까지 사용)
+
+    Returns:
+        분할 프롬프트 (제외할 항목이 없으면 일반 카테고리 요청)
+    """
+    exclusions = [title for title in exclusions if title][:MAX_GAP_FILL_EXCLUSIONS]
+    if not exclusions:
+        return SegmentedPrompt(instructions, context, CATEGORY_REQUESTS[category])
+
+    request = GAP_FILL_REQUEST.format(
+        label=CATEGORY_LABELS[category],
+        category=category,
+        exclusions='\n'.join(f'- {title}' for title in exclusions)
+    )
+    return SegmentedPrompt(instructions, context, request)
+
+
+def build_combined_prompt(instructions: str, context: str) -> SegmentedPrompt:
+    """네 카테고리를 하나의 JSON 객체로 요청하는 분할 프롬프트"""
+    return SegmentedPrompt(instructions, context, COMBINED_REQUEST)
@@ -0,0 +1,292 @@
+"""
+AI API 호출 속도 제한
+
+공급자별 분당 요청 수/분당 토큰 수(토큰 버킷)와 동시 요청 수(세마포어)를
+로컬 SQLite 파일로 관리하므로 같은 서버의 모든 스레드와 프로세스가
+하나의 한도를 공유합니다.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from ai_config import AIConfig
+from ai_deadline import remaining_time
+
+
+class RateLimitTimeout(Exception):
+    """허용 대기 시간 안에 호출 한도를 얻지 못함"""
+
+
+class RateLimitLease:
+    """획득한 호출 한도 (실제 사용 토큰 수를 기록하면 반납 시 정산)"""
+
+    def __init__(self, lease_id: Optional[str], estimated_tokens: int):
+        self.lease_id = lease_id
+        self.estimated_tokens = estimated_tokens
+        self.actual_tokens: Optional[int] = None
+
+
+class ProviderRateLimiter:
+    """공급자별 토큰 버킷 + 동시 요청 세마포어 (프로세스 간 공유)"""
+
+    def __init__(self, provider: str, path: str, requests_per_minute: int = 0,
+                 tokens_per_minute: int = 0, max_concurrent: int = 0, lease_timeout: float = 300.0):
+        """
+        속도 제한기 초기화
+
+        Args:
+            provider: 공급자명
+            path: 공유 SQLite 파일 경로
+            requests_per_minute: 분당 최대 요청 수 (0이면 제한 없음)
+            tokens_per_minute: 분당 최대 토큰 수 (0이면 제한 없음)
+            max_concurrent: 최대 동시 요청 수 (0이면 제한 없음)
+            lease_timeout: 반납되지 않은 동시 요청 슬롯을 회수하는 시간 (초)
+        """
+        self.provider = provider
+        self.path = path
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrent = max_concurrent
+        self.lease_timeout = lease_timeout
+        self.metrics = {'acquired': 0, 'waited': 0, 'timeouts': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+        self._metrics_lock = threading.Lock()
+        self._local = threading.local()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limit_bucket (
+                provider TEXT PRIMARY KEY,
+                request_tokens REAL NOT NULL,
+                token_tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limit_lease (
+                lease_id TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                pid INTEGER NOT NULL,
+                tokens INTEGER NOT NULL,
+                acquired_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        conn.execute(
+            'INSERT OR IGNORE INTO rate_limit_bucket (provider, request_tokens, token_tokens, updated_at) '
+            'VALUES (?, ?, ?, ?)',
+            (provider, float(requests_per_minute), float(tokens_per_minute), time.time())
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결 (트랜잭션은 직접 관리)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def _try_acquire(self, tokens: int):
+        """
+        한도 획득 시도 (한 번의 쓰기 트랜잭션)
+
+        Returns:
+            (lease_id 또는 None, 다시 시도하기까지 기다릴 시간)
+        """
+        conn = self._connection()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute(
+                'DELETE FROM rate_limit_lease WHERE provider = ? AND expires_at <= ?', (self.provider, now)
+            )
+            active = conn.execute(
+                'SELECT COUNT(*) FROM rate_limit_lease WHERE provider = ?', (self.provider,)
+            ).fetchone()[0]
+            request_tokens, token_tokens, updated_at = conn.execute(
+                'SELECT request_tokens, token_tokens, updated_at FROM rate_limit_bucket WHERE provider = ?',
+                (self.provider,)
+            ).fetchone()
+
+            # 경과 시간만큼 버킷 채우기
+            elapsed = max(0.0, now - updated_at)
+            if self.requests_per_minute:
+                request_tokens = min(self.requests_per_minute,
+                                     request_tokens + elapsed * self.requests_per_minute / 60.0)
+            if self.tokens_per_minute:
+                token_tokens = min(self.tokens_per_minute,
+                                   token_tokens + elapsed * self.tokens_per_minute / 60.0)
+
+            wait = 0.0
+            if self.max_concurrent and active >= self.max_concurrent:
+                wait = 0.1
+            if self.requests_per_minute and request_tokens < 1:
+                wait = max(wait, (1 - request_tokens) * 60.0 / self.requests_per_minute)
+            if self.tokens_per_minute and token_tokens < tokens:
+                wait = max(wait, (tokens - token_tokens) * 60.0 / self.tokens_per_minute)
+
+            lease_id = None
+            if wait == 0.0:
+                if self.requests_per_minute:
+                    request_tokens -= 1
+                if self.tokens_per_minute:
+                    token_tokens -= tokens
+                lease_id = uuid.uuid4().hex
+                conn.execute(
+                    'INSERT INTO rate_limit_lease (lease_id, provider, pid, tokens, acquired_at, expires_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (lease_id, self.provider, os.getpid(), tokens, now, now + self.lease_timeout)
+                )
+
+            conn.execute(
+                'UPDATE rate_limit_bucket SET request_tokens = ?, token_tokens = ?, updated_at = ? '
+                'WHERE provider = ?', (request_tokens, token_tokens, now, self.provider)
+            )
+            conn.execute('COMMIT')
+            return lease_id, wait
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def acquire(self, estimated_tokens: int, timeout: Optional[float] = None) -> Optional[RateLimitLease]:
+        """
+        호출 한도 획득 (한도가 생길 때까지 대기)
+
+        Args:
+            estimated_tokens: 이번 호출의 예상 토큰 수 (입력 + 최대 출력)
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            획득한 한도 (시간 초과 시 None)
+        """
+        tokens = int(estimated_tokens)
+        if self.tokens_per_minute:
+            # 분당 한도보다 큰 요청이 영원히 대기하지 않도록 제한
+            tokens = min(tokens, self.tokens_per_minute)
+
+        started = time.monotonic()
+        while True:
+            lease_id, wait = self._try_acquire(tokens)
+            waited = time.monotonic() - started
+
+            if lease_id is not None:
+                with self._metrics_lock:
+                    self.metrics['acquired'] += 1
+                    if waited > 0.001:
+                        self.metrics['waited'] += 1
+                        self.metrics['total_wait'] += waited
+                        self.metrics['max_wait'] = max(self.metrics['max_wait'], waited)
+                return RateLimitLease(lease_id, tokens)
+
+            if timeout is not None and waited + wait > timeout:
+                with self._metrics_lock:
+                    self.metrics['timeouts'] += 1
+                return None
+
+            time.sleep(min(wait, 1.0))
+
+    def release(self, lease: RateLimitLease):
+        """한도 반납 (실제 사용 토큰이 예상보다 적으면 차액 환급)"""
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute('DELETE FROM rate_limit_lease WHERE lease_id = ?', (lease.lease_id,))
+            if self.tokens_per_minute and lease.actual_tokens is not None:
+                refund = lease.estimated_tokens - lease.actual_tokens
+                conn.execute(
+                    'UPDATE rate_limit_bucket SET token_tokens = MIN(?, token_tokens + ?) WHERE provider = ?',
+                    (self.tokens_per_minute, refund, self.provider)
+                )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def stats(self) -> Dict:
+        """대기 시간 통계"""
+        with self._metrics_lock:
+            metrics = dict(self.metrics)
+        metrics['avg_wait'] = round(metrics['total_wait'] / metrics['waited'], 3) if metrics['waited'] else 0.0
+        metrics['total_wait'] = round(metrics['total_wait'], 3)
+        metrics['max_wait'] = round(metrics['max_wait'], 3)
+        metrics['limits'] = {
+            'requests_per_minute': self.requests_per_minute,
+            'tokens_per_minute': self.tokens_per_minute,
+            'max_concurrent': self.max_concurrent
+        }
+        return metrics
+
+
+_limiters: Dict[str, ProviderRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> Optional[ProviderRateLimiter]:
+    """공급자별 공유 속도 제한기 반환 (비활성화되었거나 설정이 없으면 None)"""
+    if not AIConfig.RATE_LIMIT_ENABLED or provider not in AIConfig.RATE_LIMITS:
+        return None
+
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limits = AIConfig.RATE_LIMITS[provider]
+            limiter = ProviderRateLimiter(
+                provider,
+                AIConfig.RATE_LIMIT_PATH,
+                requests_per_minute=limits.get('requests_per_minute', 0),
+                tokens_per_minute=limits.get('tokens_per_minute', 0),
+                max_concurrent=limits.get('max_concurrent', 0)
+            )
+            _limiters[provider] = limiter
+        return limiter
+
+
+def get_rate_limit_stats() -> Dict[str, Dict]:
+    """생성된 모든 속도 제한기의 통계"""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.provider: limiter.stats() for limiter in limiters}
+
+
+def estimate_tokens(prompt: str, max_tokens: int) -> int:
+    """예상 토큰 수 (한국어 기준 약 2글자당 1토큰 + 최대 출력 토큰)"""
+    return len(prompt) // 2 + max_tokens
+
+
+@contextmanager
+def rate_limited(provider: str, estimated_tokens: int) -> Iterator[RateLimitLease]:
+    """
+    호출 한도를 획득한 상태로 블록 실행
+
+    블록 안에서 lease.actual_tokens에 실제 사용량을 기록하면 반납 시 정산합니다.
+
+    Raises:
+        RateLimitTimeout: RATE_LIMIT_MAX_WAIT 안에 한도를 얻지 못한 경우
+    """
+    limiter = get_rate_limiter(provider)
+    if limiter is None:
+        yield RateLimitLease(None, estimated_tokens)
+        return
+
+    max_wait = AIConfig.RATE_LIMIT_MAX_WAIT
+    remaining = remaining_time()
+    if remaining is not None:
+        max_wait = min(max_wait, remaining)
+
+    lease = limiter.acquire(estimated_tokens, timeout=max_wait)
+    if lease is None:
+        raise RateLimitTimeout(f"{provider} 호출 한도 대기 시간 초과 ({max_wait:.1f}초)")
+
+    try:
+        yield lease
+    finally:
+        limiter.release(lease)
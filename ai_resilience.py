@@ -0,0 +1,199 @@
+"""
+AI API 호출 복원력 계층
+
+Claude/DeepSeek 클라이언트가 공유하는 재시도(지수 백오프 + 지터),
+Retry-After 헤더 처리, 공급자별 서킷 브레이커를 제공합니다.
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+import requests
+
+from ai_config import AIConfig
+from ai_deadline import deadline_exceeded, remaining_time
+
+# 재시도할 HTTP 상태 코드 (529: Anthropic 과부하)
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504, 529}
+
+
+class CircuitBreaker:
+    """
+    공급자별 서킷 브레이커
+
+    - closed: 정상 호출
+    - open: 연속 실패가 임계값을 넘으면 대기 시간 동안 호출 차단
+    - half_open: 대기 시간이 지나면 시험 호출 1건만 허용
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (대기 시간이 지난 open 상태는 시험 호출 1건 허용)"""
+        with self._lock:
+            if self.state == 'closed':
+                return True
+
+            if self.state == 'open':
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = 'half_open'
+                self._probe_in_flight = False
+
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def is_open(self) -> bool:
+        """상태를 바꾸지 않고 호출이 차단 중인지 확인"""
+        with self._lock:
+            return self.state == 'open' and time.monotonic() - self.opened_at < self.reset_timeout
+
+    def record_success(self):
+        """호출 성공 기록 (브레이커 닫기)"""
+        with self._lock:
+            if self.state != 'closed':
+                print(f"✅ {self.name} 서킷 브레이커 복구")
+            self.state = 'closed'
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """호출 실패 기록 (임계값 도달 또는 시험 호출 실패 시 열기)"""
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                if self.state != 'open':
+                    print(f"🚫 {self.name} 서킷 브레이커 열림: {self.reset_timeout:.0f}초 동안 호출 차단")
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+    def status(self) -> Dict:
+        """현재 상태"""
+        with self._lock:
+            return {'state': self.state, 'failures': self.failures}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """공급자별 공유 서킷 브레이커 반환"""
+    with _breakers_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                provider,
+                failure_threshold=AIConfig.CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=AIConfig.CIRCUIT_RESET_TIMEOUT
+            )
+            _breakers[provider] = breaker
+        return breaker
+
+
+def get_circuit_status() -> Dict[str, Dict]:
+    """모든 공급자의 서킷 브레이커 상태"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.status() for breaker in breakers}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더를 대기 시간(초)으로 변환
+
+    초 단위 숫자와 HTTP 날짜 형식을 모두 지원합니다.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def compute_backoff(attempt: int) -> float:
+    """지수 백오프 대기 시간 (full jitter)"""
+    ceiling = min(AIConfig.RETRY_MAX_DELAY, AIConfig.RETRY_BASE_DELAY * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+def send_with_retries(provider: str, send: Callable[[], requests.Response]) -> Optional[requests.Response]:
+    """
+    재시도와 서킷 브레이커를 적용해 API 요청 전송
+
+    Args:
+        provider: 공급자명 (claude, deepseek)
+        send: 요청을 보내고 응답을 반환하는 함수
+
+    Returns:
+        마지막 응답 (서킷이 열려 있거나 네트워크 오류로 끝나거나 시간 제한을 넘으면 None)
+    """
+    if deadline_exceeded():
+        print(f"⏰ {provider} 시간 제한 초과, 호출 생략")
+        return None
+    
+    breaker = get_circuit_breaker(provider)
+    if not breaker.allow_request():
+        print(f"🚫 {provider} 서킷 브레이커 열림, 호출 생략")
+        return None
+
+    response = None
+    for attempt in range(AIConfig.RETRY_MAX_ATTEMPTS + 1):
+        retry_after = None
+        try:
+            response = send()
+        except requests.exceptions.RequestException as e:
+            print(f"{provider} API 요청 오류 (시도 {attempt + 1}): {e}")
+            response = None
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                # 4xx 요청 오류는 공급자 장애가 아니므로 성공으로 기록
+                breaker.record_success()
+                return response
+            print(f"{provider} API 오류 (시도 {attempt + 1}): {response.status_code}")
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+
+        if attempt == AIConfig.RETRY_MAX_ATTEMPTS:
+            break
+
+        delay = retry_after if retry_after is not None else compute_backoff(attempt)
+        if delay > AIConfig.RETRY_MAX_DELAY:
+            print(f"⏳ {provider} 재시도 대기 시간({delay:.1f}초)이 너무 길어 중단")
+            break
+        remaining = remaining_time()
+        if remaining is not None and delay >= remaining:
+            print(f"⏰ {provider} 시간 제한 안에 재시도할 수 없어 중단")
+            break
+
+        if response is not None:
+            response.close()
+        time.sleep(delay)
+
+    breaker.record_failure()
+    return response
@@ -0,0 +1,109 @@
+"""
+AI 컨텐츠 카테고리별 JSON 스키마
+
+Claude tool use(구조화 출력) 모드에서 카테고리 항목 형식을 도구 입력
+스키마로 선언해, 응답이 텍스트가 아닌 구조화된 JSON으로 도착하게 합니다.
+필드 구성은 ai_json.CATEGORY_FIELDS 정규화 규칙과 같습니다.
+"""
+
+from typing import Dict, List
+
+PRIORITY_SCHEMA = {'type': 'string', 'enum': ['high', 'medium', 'low']}
+NULLABLE_STRING = {'type': ['string', 'null']}
+
+ITEM_SCHEMAS: Dict[str, Dict] = {
+    'checklist': {
+        'type': 'object',
+        'properties': {
+            'category': {'type': 'string', 'description': '출발 전, 1일차, 2일차, 3일차, 귀국 후 중 하나'},
+            'title': {'type': 'string'},
+            'priority': PRIORITY_SCHEMA,
+            'description': NULLABLE_STRING
+        },
+        'required': ['category', 'title', 'priority']
+    },
+    'items': {
+        'type': 'object',
+        'properties': {
+            'category': {'type': 'string', 'description': '서류, 의류, 용품, 약품, 전자기기 중 하나'},
+            'name': {'type': 'string'},
+            'quantity': {'type': 'integer', 'minimum': 1},
+            'notes': NULLABLE_STRING
+        },
+        'required': ['category', 'name', 'quantity']
+    },
+    'local_info': {
+        'type': 'object',
+        'properties': {
+            'category': {'type': 'string', 'description': '환율, 긴급연락처, 교통수단, 맛집, 기타 중 하나'},
+            'title': {'type': 'string'},
+            'content': {'type': 'string'},
+            'rating': {'type': ['number', 'null']},
+            'phone': NULLABLE_STRING,
+            'address': NULLABLE_STRING
+        },
+        'required': ['category', 'title', 'content']
+    },
+    'wishlist': {
+        'type': 'object',
+        'properties': {
+            'place_name': {'type': 'string'},
+            'category': {'type': 'string', 'description': '관광지, 맛집, 체험, 쇼핑, 기타 중 하나'},
+            'description': NULLABLE_STRING,
+            'priority': PRIORITY_SCHEMA,
+            'address': NULLABLE_STRING
+        },
+        'required': ['place_name', 'category', 'priority']
+    }
+}
+
+CATEGORY_LABELS = {
+    'checklist': '여행 체크리스트',
+    'items': '준비물품',
+    'local_info': '현지정보',
+    'wishlist': '위시리스트'
+}
+
+
+def build_category_tool(category: str) -> Dict:
+    """
+    카테고리 항목을 저장하는 도구 정의
+
+    Args:
+        category: 카테고리명
+
+    Returns:
+        Anthropic Messages API tools 항목 (입력: {"items": [...]})
+    """
+    return {
+        'name': f'save_{category}',
+        'description': f'생성한 {CATEGORY_LABELS[category]} 항목을 저장합니다.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {
+                'items': {'type': 'array', 'items': ITEM_SCHEMAS[category]}
+            },
+            'required': ['items']
+        }
+    }
+
+
+def build_category_tools() -> List[Dict]:
+    """네 카테고리 도구 정의 (요청마다 같은 순서로 선언해 프롬프트 캐시 접두어를 유지)"""
+    return [build_category_tool(category) for category in ITEM_SCHEMAS]
+
+
+def build_combined_tool() -> Dict:
+    """네 카테고리를 한 번에 저장하는 도구 정의 (combined 모드용)"""
+    return {
+        'name': 'save_travel_content',
+        'description': '생성한 여행 컨텐츠(체크리스트, 준비물품, 현지정보, 위시리스트)를 저장합니다.',
+        'input_schema': {
+            'type': 'object',
+            'properties': {
+                category: {'type': 'array', 'items': schema}
+                for category, schema in ITEM_SCHEMAS.items()
+            },
+            'required': list(ITEM_SCHEMAS)
+        }
+    }
@@ -0,0 +1,315 @@
+"""
+AI API 호출 계측
+
+generate_completion 호출마다 공급자/모델/카테고리, 전체 소요 시간,
+첫 바이트까지의 시간(TTFB), 입력/출력 토큰, 프롬프트 캐시 읽기/쓰기 토큰, HTTP 상태, JSON 파싱 성공 여부를
+기록하고 프로세스 안에서 집계합니다. 설정하면 호출 기록을 JSONL 파일에도 남깁니다.
+"""
+
+import bisect
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from ai_config import AIConfig
+
+# 지연시간 히스토그램 구간 상한 (초)
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60)
+
+# max_tokens에 걸려 잘린 응답의 종료 사유 (Claude stop_reason, DeepSeek finish_reason)
+TRUNCATED_STOP_REASONS = frozenset(('max_tokens', 'length'))
+
+
+class CallRecord:
+    """API 호출 1건의 측정값 (클라이언트가 호출 중에 채움)"""
+
+    def __init__(self, provider: str, model: str, category: Optional[str], max_tokens: int):
+        self.provider = provider
+        self.model = model
+        self.category = category or 'unknown'
+        self.max_tokens = max_tokens
+        self.started = time.monotonic()
+        self.wall_time: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.status: Optional[int] = None
+        self.input_tokens: Optional[int] = None
+        self.output_tokens: Optional[int] = None
+        # 공급자 프롬프트 캐시에서 읽은/새로 기록한 입력 토큰
+        self.cache_read_tokens: Optional[int] = None
+        self.cache_write_tokens: Optional[int] = None
+        self.cache_hit = False
+        self.replayed = False  # 카세트 재생 (네트워크 요청 없음)
+        self.stop_reason: Optional[str] = None  # 공급자가 알려준 응답 종료 사유
+        self.error: Optional[str] = None
+
+    def finish(self):
+        """전체 소요 시간 확정"""
+        self.wall_time = time.monotonic() - self.started
+
+    @property
+    def truncated(self) -> bool:
+        """max_tokens에 걸려 응답이 중간에 잘렸는지 여부"""
+        return self.stop_reason in TRUNCATED_STOP_REASONS
+
+    @property
+    def network_latency(self) -> Optional[float]:
+        """실제로 공급자에 보낸 성공 요청의 소요 시간 (캐시/카세트 응답, 실패한 요청이면 None)"""
+        if self.cache_hit or self.replayed or self.status != 200 or self.error:
+            return None
+        return self.wall_time
+
+    def to_dict(self) -> Dict:
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'provider': self.provider,
+            'model': self.model,
+            'category': self.category,
+            'max_tokens': self.max_tokens,
+            'wall_time': round(self.wall_time, 4) if self.wall_time is not None else None,
+            'ttfb': round(self.ttfb, 4) if self.ttfb is not None else None,
+            'status': self.status,
+            'input_tokens': self.input_tokens,
+            'output_tokens': self.output_tokens,
+            'cache_read_tokens': self.cache_read_tokens,
+            'cache_write_tokens': self.cache_write_tokens,
+            'cache_hit': self.cache_hit,
+            'stop_reason': self.stop_reason,
+            'error': self.error
+        }
+
+
+class Histogram:
+    """고정 구간 히스토그램 (백분위수는 구간 상한으로 근사)"""
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def percentile(self, percent: float) -> Optional[float]:
+        if not self.count:
+            return None
+        target = self.count * percent / 100.0
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.bounds[index] if index < len(self.bounds) else float('inf')
+        return float('inf')
+
+    def to_dict(self) -> Dict:
+        buckets = {f"le_{bound}": count for bound, count in zip(self.bounds, self.counts)}
+        buckets['inf'] = self.counts[-1]
+        return {
+            'count': self.count,
+            'avg': round(self.total / self.count, 4) if self.count else None,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'buckets': buckets
+        }
+
+
+class CallStats:
+    """(공급자, 모델, 카테고리)별 집계"""
+
+    def __init__(self):
+        self.calls = 0
+        self.cache_hits = 0
+        self.errors = 0
+        self.statuses: Dict[str, int] = {}
+        self.wall_time = Histogram()
+        self.ttfb = Histogram()
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+        self.cache_write_tokens = 0
+        self.max_output_tokens = 0
+        self.truncated = 0
+        self.parse_success = 0
+        self.parse_failure = 0
+
+    def add(self, record: CallRecord):
+        self.calls += 1
+        if record.cache_hit:
+            self.cache_hits += 1
+            return
+
+        status = str(record.status) if record.status is not None else 'no_response'
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if record.status != 200:
+            self.errors += 1
+
+        if record.wall_time is not None:
+            self.wall_time.observe(record.wall_time)
+        if record.ttfb is not None:
+            self.ttfb.observe(record.ttfb)
+        if record.input_tokens:
+            self.input_tokens += record.input_tokens
+        if record.cache_read_tokens:
+            self.cache_read_tokens += record.cache_read_tokens
+        if record.cache_write_tokens:
+            self.cache_write_tokens += record.cache_write_tokens
+        if record.output_tokens:
+            self.output_tokens += record.output_tokens
+            self.max_output_tokens = max(self.max_output_tokens, record.output_tokens)
+        if record.truncated or (record.output_tokens or 0) >= record.max_tokens:
+            # max_tokens에 걸려 잘린 응답
+            self.truncated += 1
+
+    def to_dict(self) -> Dict:
+        requests_sent = self.calls - self.cache_hits
+        parsed = self.parse_success + self.parse_failure
+        return {
+            'calls': self.calls,
+            'cache_hits': self.cache_hits,
+            'errors': self.errors,
+            'error_rate': round(self.errors / requests_sent, 4) if requests_sent else None,
+            'statuses': dict(self.statuses),
+            'wall_time': self.wall_time.to_dict(),
+            'ttfb': self.ttfb.to_dict(),
+            'input_tokens': self.input_tokens,
+            'output_tokens': self.output_tokens,
+            'cache_read_tokens': self.cache_read_tokens,
+            'cache_write_tokens': self.cache_write_tokens,
+            'avg_output_tokens': round(self.output_tokens / requests_sent, 1) if requests_sent else None,
+            'max_output_tokens': self.max_output_tokens,
+            'truncated': self.truncated,
+            'parse_success': self.parse_success,
+            'parse_failure': self.parse_failure,
+            'parse_failure_rate': round(self.parse_failure / parsed, 4) if parsed else None
+        }
+
+
+class AITelemetry:
+    """AI 호출 계측 집계기"""
+
+    def __init__(self, log_path: Optional[str] = None):
+        """
+        계측 집계기 초기화
+
+        Args:
+            log_path: 호출 기록을 추가할 JSONL 파일 경로 (None이면 저장하지 않음)
+        """
+        self.log_path = log_path
+        self.started_at = datetime.now().isoformat()
+        self._stats: Dict[Tuple[str, str, str], CallStats] = {}
+        self._lock = threading.Lock()
+
+        if log_path:
+            directory = os.path.dirname(log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+    def _get_stats(self, provider: str, model: str, category: str) -> CallStats:
+        key = (provider, model, category)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = CallStats()
+        return stats
+
+    def record_call(self, record: CallRecord):
+        """API 호출 기록"""
+        if record.wall_time is None:
+            record.finish()
+
+        with self._lock:
+            self._get_stats(record.provider, record.model, record.category).add(record)
+            if self.log_path:
+                self._append({'type': 'call', **record.to_dict()})
+
+        latency = record.network_latency
+        if latency is not None:
+            # 헤징 대기 시간(p95)은 네트워크 요청 지연시간으로만 계산
+            from ai_hedging import get_latency_tracker
+            get_latency_tracker().record(record.provider, latency)
+
+    def record_parse(self, provider: str, model: str, category: Optional[str], success: bool):
+        """응답 JSON 파싱 결과 기록"""
+        category = category or 'unknown'
+        with self._lock:
+            stats = self._get_stats(provider, model, category)
+            if success:
+                stats.parse_success += 1
+            else:
+                stats.parse_failure += 1
+            if self.log_path:
+                self._append({
+                    'type': 'parse', 'timestamp': datetime.now().isoformat(),
+                    'provider': provider, 'model': model, 'category': category, 'success': success
+                })
+
+    def _append(self, entry: Dict):
+        """JSONL 파일에 기록 추가 (기록 실패는 무시)"""
+        try:
+            with open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        except OSError as e:
+            print(f"⚠️ AI 계측 기록 저장 오류: {e}")
+
+    def snapshot(self) -> Dict:
+        """공급자/모델/카테고리별 집계 결과"""
+        with self._lock:
+            items = [(key, stats.to_dict()) for key, stats in self._stats.items()]
+
+        providers: Dict[str, Dict] = {}
+        for (provider, model, category), stats in sorted(items):
+            models = providers.setdefault(provider, {})
+            models.setdefault(model, {})[category] = stats
+        return {
+            'since': self.started_at,
+            'providers': providers
+        }
+
+    def reset(self):
+        """집계 초기화"""
+        with self._lock:
+            self._stats.clear()
+            self.started_at = datetime.now().isoformat()
+
+
+_telemetry: Optional[AITelemetry] = None
+_telemetry_lock = threading.Lock()
+
+
+def get_telemetry() -> AITelemetry:
+    """공유 계측 집계기 반환"""
+    global _telemetry
+    if _telemetry is None:
+        with _telemetry_lock:
+            if _telemetry is None:
+                _telemetry = AITelemetry(AIConfig.TELEMETRY_LOG_PATH or None)
+    return _telemetry
+
+
+def read_telemetry_log(path: str, limit: int = 1000) -> List[Dict]:
+    """
+    저장된 JSONL 기록 중 최근 limit건 읽기
+
+    파일 전체를 메모리에 올리지 않고 마지막 limit줄만 유지하며,
+    기록 중에 잘린 마지막 줄 등 파싱할 수 없는 줄은 건너뜁니다.
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        lines = deque(f, maxlen=limit)
+
+    records = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return records
@@ -8,12 +8,27 @@ AI 기반 여행 컨텐츠 생성 시스템
 import json
 import requests
 from datetime import datetime, date
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from ai_json import degraded_scope, iter_json_array_objects, parse_category_items
+from ai_parallel import notify_progress, run_category_tasks
+from gazetteer import match_destination
+
+# AI 카테고리명 -> 여행 컨텐츠(템플릿) 키
+CATEGORY_CONTENT_KEYS = {
+    'checklist': 'checklists',
+    'items': 'items',
+    'local_info': 'local_infos',
+    'wishlist': 'wishlists'
+}
 
 class AITravelAssistant:
     """AI 기반 여행 도우미"""
     
     def __init__(self):
+        # 시뮬레이션 응답이 섞였는지 여부 (캐시 저장 판단용)
+        self.simulated = False
         self.base_prompts = {
             'checklist': """
 다음 여행 정보를 바탕으로 실용적인 체크리스트를 생성해주세요:
@@ -122,16 +137,14 @@ class AITravelAssistant:
         """AI API를 사용한 컨텐츠 생성"""
         try:
             from ai_config import AIConfig
-            from deepseek_client import DeepSeekClient
-            import os
+            from ai_clients import get_ai_client
             
             # Claude API 사용 (우선순위)
             if AIConfig.AI_SERVICE == 'claude':
-                api_key = os.getenv('ANTHROPIC_API_KEY')
-                if api_key:
-                    from claude_client import ClaudeClient
-                    client = ClaudeClient(api_key)
-                    response = client.generate_completion(prompt, max_tokens=2000, temperature=0.7)
+                client = get_ai_client('claude')
+                if client:
+                    response = client.generate_completion(prompt, max_tokens=2000, temperature=0.7,
+                                                          category=category)
                     if response:
                         return response
                     else:
@@ -143,10 +156,10 @@ class AITravelAssistant:
             
             # DeepSeek API 사용
             elif AIConfig.AI_SERVICE == 'deepseek':
-                api_key = os.getenv('DEEPSEEK_API_KEY')
-                if api_key:
-                    client = DeepSeekClient(api_key)
-                    response = client.generate_completion(prompt, max_tokens=2000, temperature=0.7)
+                client = get_ai_client('deepseek')
+                if client:
+                    response = client.generate_completion(prompt, max_tokens=2000, temperature=0.7,
+                                                          category=category)
                     if response:
                         return response
                     else:
@@ -172,6 +185,8 @@ class AITravelAssistant:
     
     def simulate_ai_response(self, prompt: str) -> str:
         """AI 응답 시뮬레이션 (데모용)"""
+        self.simulated = True
+        
         # 실제로는 OpenAI, Claude, Gemini 등의 API를 사용
         # 여기서는 목적지에 따른 샘플 응답을 반환
         
@@ -212,8 +227,13 @@ class AITravelAssistant:
         
         return "[]"  # 기본값
     
-    def generate_smart_content(self, destination: str, days: int, start_date: date) -> Dict:
-        """AI 기반 스마트 컨텐츠 생성"""
+    def generate_smart_content(self, destination: str, days: int, start_date: date,
+                               progress_callback: Optional[Callable[[str, List[Dict]], None]] = None) -> Dict:
+        """
+        AI 기반 스마트 컨텐츠 생성
+        
+        progress_callback은 카테고리가 완성될 때마다 (카테고리명, 항목)으로 호출됩니다.
+        """
         season = self.get_season(start_date)
         travel_style = self.determine_travel_style(destination, days)
         
@@ -227,22 +247,32 @@ class AITravelAssistant:
         # AI 서비스별 전용 처리
         try:
             from ai_config import AIConfig
-            import os
+            from ai_clients import get_ai_client
+            from ai_resilience import get_circuit_breaker
+            
+            client = get_ai_client(AIConfig.AI_SERVICE)
+            if client and get_circuit_breaker(AIConfig.AI_SERVICE).is_open():
+                print(f"🚫 {AIConfig.AI_SERVICE} 서킷 브레이커 열림, 기본 방식으로 전환")
+                client = None
+            
+            # 헤징 모드 (보조 공급자를 사용할 수 없으면 단일 공급자 방식)
+            if AIConfig.HEDGING_ENABLED and client:
+                hedged_result = self._generate_hedged(client, context, progress_callback)
+                if hedged_result is not None and any(hedged_result.values()):
+                    print(f"✅ 헤징 AI 컨텐츠 생성 완료!")
+                    return hedged_result
             
             # Claude 전용 처리 (우선순위)
-            if AIConfig.AI_SERVICE == 'claude' and os.getenv('ANTHROPIC_API_KEY'):
+            if AIConfig.AI_SERVICE == 'claude' and client:
                 print(f"🤖 Claude AI로 {destination} 컨텐츠 생성 중...")
                 
-                from claude_client import ClaudeClient
-                api_key = os.getenv('ANTHROPIC_API_KEY')
-                client = ClaudeClient(api_key)
-                
                 # Claude 전용 메서드 사용
                 claude_result = client.generate_travel_content(
                     destination=destination,
                     days=days,
                     season=season,
-                    travel_style=travel_style
+                    travel_style=travel_style,
+                    progress_callback=progress_callback
                 )
                 
                 if any(claude_result.values()):  # 결과가 있으면
@@ -252,19 +282,16 @@ class AITravelAssistant:
                     print(f"⚠️ Claude 결과 없음, 기본 방식으로 전환")
             
             # DeepSeek 전용 처리
-            elif AIConfig.AI_SERVICE == 'deepseek' and os.getenv('DEEPSEEK_API_KEY'):
+            elif AIConfig.AI_SERVICE == 'deepseek' and client:
                 print(f"🤖 DeepSeek AI로 {destination} 컨텐츠 생성 중...")
                 
-                from deepseek_client import DeepSeekClient
-                api_key = os.getenv('DEEPSEEK_API_KEY')
-                client = DeepSeekClient(api_key)
-                
                 # DeepSeek 전용 메서드 사용
                 deepseek_result = client.generate_travel_content(
                     destination=destination,
                     days=days,
                     season=season,
-                    travel_style=travel_style
+                    travel_style=travel_style,
+                    progress_callback=progress_callback
                 )
                 
                 if any(deepseek_result.values()):  # 결과가 있으면
@@ -276,97 +303,323 @@ class AITravelAssistant:
         except Exception as e:
             print(f"❌ AI 처리 오류: {e}, 기본 방식으로 전환")
         
-        # 기본 방식 (프롬프트 기반)
-        results = {}
+        # 기본 방식 (프롬프트 기반) - 카테고리별로 동시에 생성
+        from ai_config import AIConfig
+        from ai_deadline import deadline_exceeded
         
-        # 각 카테고리별로 AI 컨텐츠 생성
-        for category, prompt_template in self.base_prompts.items():
-            try:
-                prompt = prompt_template.format(**context)
-                ai_response = self.generate_with_ai(prompt, category)
-                
-                # JSON 파싱
-                if ai_response.startswith('[') and ai_response.endswith(']'):
-                    results[category] = json.loads(ai_response)
-                else:
-                    # JSON이 아닌 경우 기본값 사용
-                    results[category] = []
-                    
-            except Exception as e:
-                print(f"AI 생성 오류 ({category}): {e}")
-                results[category] = []
+        if deadline_exceeded():
+            print(f"⏰ 시간 제한 초과, 기본 방식 생략")
+            return {}
+        
+        return run_category_tasks(
+            {category: partial(self._generate_prompt_category, prompt_template, context, category)
+             for category, prompt_template in self.base_prompts.items()},
+            max_workers=AIConfig.MAX_CONCURRENT_REQUESTS,
+            on_complete=progress_callback
+        )
+    
+    def _generate_hedged(self, client, context: Dict,
+                         progress_callback: Optional[Callable[[str, List[Dict]], None]] = None) -> Optional[Dict]:
+        """
+        주/보조 공급자 헤징으로 카테고리별 생성
         
-        return results
+        Returns:
+            생성된 컨텐츠 (보조 공급자를 사용할 수 없으면 None)
+        """
+        from ai_config import AIConfig
+        from ai_clients import get_ai_client
+        from ai_hedging import run_hedged
+        from ai_resilience import get_circuit_breaker
+        
+        primary = AIConfig.AI_SERVICE
+        secondary = AIConfig.HEDGE_SECONDARY_SERVICE or ('deepseek' if primary == 'claude' else 'claude')
+        secondary_client = get_ai_client(secondary) if secondary != primary else None
+        if secondary_client is None or get_circuit_breaker(secondary).is_open():
+            print(f"⚠️ 헤징 보조 공급자({secondary}) 사용 불가, 단일 공급자로 생성")
+            return None
+        
+        print(f"🤖 {primary} + {secondary} 헤징으로 {context['destination']} 컨텐츠 생성 중...")
+        args = (context['destination'], context['days'], context['season'], context['travel_style'])
+        primary_prompts = client.build_category_prompts(*args)
+        secondary_prompts = secondary_client.build_category_prompts(*args)
+        
+        return run_category_tasks(
+            {category: partial(
+                run_hedged,
+                partial(client._generate_category, prompt, category),
+                partial(secondary_client._generate_category, secondary_prompts[category], category),
+                primary, secondary, label=category
+            ) for category, prompt in primary_prompts.items()},
+            max_workers=AIConfig.MAX_CONCURRENT_REQUESTS,
+            on_complete=progress_callback
+        )
     
-    def enhance_existing_content(self, destination: str, existing_data: Dict) -> Dict:
-        """기존 컨텐츠를 AI로 개선"""
-        # 기존 데이터를 분석하여 부족한 부분을 AI로 보완
+    def _generate_prompt_category(self, prompt_template: str, context: Dict, category: str) -> List[Dict]:
+        """기본 프롬프트로 단일 카테고리 생성"""
+        prompt = prompt_template.format(**context)
+        ai_response = self.generate_with_ai(prompt, category)
+        
+        # 설명 문장/코드 블록이 섞이거나 일부 손상된 응답도 살릴 수 있는 항목은 사용
+        return parse_category_items(ai_response, category)
+    
+    def regenerate_category(self, destination: str, days: int, start_date: date, category: str,
+                            existing_titles: List[str]) -> List[Dict]:
+        """
+        기존 여행의 한 카테고리만 추가 생성 (AI 호출 1회)
+        
+        이미 있는 항목 이름만 제외 목록으로 보내고, 응답에 섞여 들어온
+        중복 항목도 걸러서 새 항목만 반환합니다. 사용자가 새 항목을 요청한
+        것이므로 응답 캐시를 거치지 않습니다 (제외 목록이 그대로면 프롬프트도 같아
+        캐시된 같은 응답만 반복되기 때문).
+        
+        Args:
+            destination: 목적지 (사용자 입력 형태)
+            days: 여행 일수
+            start_date: 출발일 (계절 판단용)
+            category: 카테고리명 (checklist, items, local_info, wishlist)
+            existing_titles: 이미 있는 항목 이름
+            
+        Returns:
+            새로 추가할 항목 리스트
+        """
+        from ai_config import AIConfig
+        from ai_clients import get_ai_client
+        from ai_prompts import CATEGORY_TITLE_FIELDS, build_gap_fill_prompt
+        from ai_resilience import get_circuit_breaker
+        
+        enhanced_destination = analyze_destination(destination)
+        season = self.get_season(start_date)
+        travel_style = self.determine_travel_style(destination, days)
+        
+        client = get_ai_client(AIConfig.AI_SERVICE)
+        if client and not get_circuit_breaker(AIConfig.AI_SERVICE).is_open():
+            print(f"🤖 {AIConfig.AI_SERVICE}로 {destination} {category} 추가 생성 중 (기존 {len(existing_titles)}개 제외)...")
+            prompt = client.build_gap_fill_prompt(enhanced_destination, days, season, travel_style,
+                                                  category, existing_titles)
+            items = client._generate_category(prompt, category, use_cache=False)
+        else:
+            # AI 서비스를 사용할 수 없으면 시뮬레이션 응답
+            prompt = self.base_prompts[category].format(
+                destination=enhanced_destination, days=days, season=season, travel_style=travel_style
+            ) + build_gap_fill_prompt('', '', category, existing_titles).request
+            items = parse_category_items(self.simulate_ai_response(prompt), category)
+        
+        # 제외 목록을 무시한 항목과 응답 안의 중복 제거
+        title_field = CATEGORY_TITLE_FIELDS[category]
+        seen = {' '.join(title.split()).casefold() for title in existing_titles if title}
+        new_items = []
+        for item in items:
+            key = ' '.join(str(item.get(title_field) or '').split()).casefold()
+            if key and key not in seen:
+                seen.add(key)
+                new_items.append(item)
+        
+        print(f"✅ {category} 추가 생성: 새 항목 {len(new_items)}개 (중복 {len(items) - len(new_items)}개 제외)")
+        return new_items
+    
+    def enhance_existing_content(self, destination: str, existing_data: Dict, days: int, start_date: date) -> Dict:
+        """기존 컨텐츠를 AI로 개선 (체크리스트가 너무 적으면 체크리스트만 추가 생성)"""
         enhanced = existing_data.copy()
         
-        # 예: 체크리스트가 너무 적으면 AI로 추가 생성
-        if len(enhanced.get('checklists', [])) < 5:
-            ai_checklists = self.generate_smart_content(destination, 5, date.today())
-            enhanced['checklists'].extend(ai_checklists.get('checklist', []))
+        checklists = enhanced.get('checklists', [])
+        if len(checklists) < 5:
+            titles = [checklist.get('title', '') for checklist in checklists]
+            enhanced['checklists'] = checklists + self.regenerate_category(
+                destination, days, start_date, 'checklist', titles
+            )
         
         return enhanced
 
 # AI 여행 도우미 통합 함수
-def generate_ai_travel_content(destination: str, days: int, start_date: date) -> Dict:
-    """AI 기반 여행 컨텐츠 생성 메인 함수"""
+def generate_ai_travel_content(destination: str, days: int, start_date: date,
+                               progress_callback: Optional[Callable[[str, List[Dict]], None]] = None,
+                               deadline: Optional[float] = None) -> Dict:
+    """
+    AI 기반 여행 컨텐츠 생성 메인 함수
+    
+    progress_callback은 카테고리가 완성될 때마다 (카테고리명, 항목)으로 호출됩니다.
+    deadline(초, 기본값: AIConfig.GENERATION_DEADLINE_SECONDS) 안에 끝나지 않은
+    카테고리는 목적지 템플릿 데이터로 채웁니다.
+    """
+    from ai_cache import get_bundle_cache
+    from ai_cassette import get_cassette
+    from ai_config import AIConfig
+    from ai_deadline import deadline_scope
+    
+    if deadline is None:
+        deadline = AIConfig.GENERATION_DEADLINE_SECONDS
+    
     assistant = AITravelAssistant()
     
     # 목적지별 지능형 분석
     enhanced_destination = analyze_destination(destination)
+    season = assistant.get_season(start_date)
+    travel_style = assistant.determine_travel_style(destination, days)
     
-    # AI 컨텐츠 생성
-    ai_content = assistant.generate_smart_content(enhanced_destination, days, start_date)
+    # 같은 목적지/계절/스타일/일수 구간이면 캐시된 컨텐츠 사용 (카세트 녹화/재생 중에는 사용 안 함)
+    cache = None if get_cassette() else get_bundle_cache()
+    cache_state = None
+    ai_content = None
+    if cache:
+        cache_key = cache.make_key(enhanced_destination, season, travel_style, days)
+        ai_content, cache_state = cache.get(cache_key)
+        if cache_state == 'stale':
+            cache.refresh_async(
+                cache_key, lambda: _generate_cacheable_content(enhanced_destination, days, start_date)
+            )
+    
+    # AI 컨텐츠 생성 (남은 시간이 모든 하위 호출의 타임아웃/재시도/대기를 제한)
+    if ai_content is None:
+        with deadline_scope(deadline), degraded_scope() as degraded:
+            ai_content = assistant.generate_smart_content(
+                enhanced_destination, days, start_date, progress_callback=progress_callback
+            )
+        # 시간 제한/실패로 빈 카테고리가 있거나 잘린/복구한 응답이 섞인 결과는 캐시하지 않음
+        # (템플릿 대체분이나 줄어든 항목이 7일간 고정되지 않도록)
+        if cache and _is_cacheable_bundle(ai_content, assistant, degraded):
+            cache.set(cache_key, ai_content)
+    else:
+        # 캐시에서 가져온 경우 모든 카테고리가 바로 완성됨
+        for category, items in ai_content.items():
+            notify_progress(progress_callback, category, items)
+    
+    result = {
+        content_key: ai_content.get(category, [])
+        for category, content_key in CATEGORY_CONTENT_KEYS.items()
+    }
+    
+    # 생성되지 않은 카테고리는 목적지 템플릿으로 채움
+    fallback_categories = [key for key, items in result.items() if not items]
+    if fallback_categories:
+        from destination_templates import get_destination_template
+        
+        template_data = get_destination_template(destination, days).get_template_data()
+        for key in fallback_categories:
+            result[key] = template_data.get(key, [])
+        print(f"📋 템플릿으로 채운 카테고리: {', '.join(fallback_categories)}")
     
     return {
-        'checklists': ai_content.get('checklist', []),
-        'items': ai_content.get('items', []),
-        'local_infos': ai_content.get('local_info', []),
-        'wishlists': ai_content.get('wishlist', []),
+        **result,
         'ai_generated': True,
         'generation_info': {
             'destination': enhanced_destination,
             'analyzed_season': assistant.get_season(start_date),
-            'travel_style': assistant.determine_travel_style(destination, days),
-            'generated_at': datetime.now().isoformat()
+            'travel_style': travel_style,
+            'generated_at': datetime.now().isoformat(),
+            'cache': cache_state,
+            'fallback_categories': fallback_categories
         }
     }
 
-def analyze_destination(destination: str) -> str:
-    """목적지 분석 및 표준화"""
-    # 목적지명 정규화 및 추가 정보 분석
-    destination_lower = destination.lower().strip()
-    
-    # 지역별 그룹핑
-    asia_destinations = {
-        '도쿄': 'Tokyo, Japan',
-        '오사카': 'Osaka, Japan', 
-        '서울': 'Seoul, South Korea',
-        '부산': 'Busan, South Korea',
-        '방콕': 'Bangkok, Thailand',
-        '세부': 'Cebu, Philippines',
-        '싱가포르': 'Singapore',
-        '홍콩': 'Hong Kong',
-        '타이베이': 'Taipei, Taiwan'
-    }
+def _is_cacheable_bundle(ai_content: Optional[Dict], assistant: AITravelAssistant, degraded: Set[str]) -> bool:
+    """
+    묶음 캐시 저장 조건
     
-    europe_destinations = {
-        '파리': 'Paris, France',
-        '런던': 'London, UK',
-        '로마': 'Rome, Italy',
-        '바르셀로나': 'Barcelona, Spain',
-        '암스테르담': 'Amsterdam, Netherlands'
-    }
+    네 카테고리가 모두 비어 있지 않고, 시뮬레이션 응답이 섞이지 않았으며,
+    max_tokens에 잘리거나 JSON 복구로 살린 카테고리(degraded)가 없어야 합니다.
+    """
+    if degraded:
+        print(f"⚠️ 잘리거나 복구된 카테고리({', '.join(sorted(degraded))})가 있어 묶음 캐시에 저장하지 않습니다.")
+        return False
+    return (bool(ai_content) and not assistant.simulated
+            and all(ai_content.get(category) for category in assistant.base_prompts))
+
+def _generate_cacheable_content(destination: str, days: int, start_date: date) -> Optional[Dict]:
+    """캐시 재생성/미리 채우기용 컨텐츠 생성 (묶음 캐시 저장 조건을 만족하지 않으면 None)"""
+    assistant = AITravelAssistant()
+    with degraded_scope() as degraded:
+        ai_content = assistant.generate_smart_content(destination, days, start_date)
+    if not _is_cacheable_bundle(ai_content, assistant, degraded):
+        return None
+    return ai_content
+
+def warm_bundle_cache(destination: str, days: int, start_date: date, force: bool = False,
+                      check_only: bool = False) -> str:
+    """
+    사용자 요청 전에 여행 컨텐츠 묶음 캐시 미리 채우기
+    
+    generate_ai_travel_content와 같은 캐시 키(목적지 분석 결과, 계절, 스타일,
+    일수 구간)를 사용하므로 같은 조건의 첫 사용자가 바로 캐시된 결과를 받습니다.
+    네 카테고리가 모두 생성되고 잘리거나 복구된 응답이 없는 경우에만 저장합니다.
+    
+    Args:
+        destination: 목적지 (사용자 입력 형태)
+        days: 여행 일수
+        start_date: 출발일 (계절 판단용)
+        force: 이미 신선한 캐시가 있어도 다시 생성
+        check_only: 생성하지 않고 캐시 여부만 확인
+        
+    Returns:
+        fresh(이미 캐시됨), missing(check_only에서 캐시 없음), generated(생성 후 저장),
+        failed(생성 실패), disabled(캐시 비활성)
+    """
+    from ai_cache import get_bundle_cache
+    
+    cache = get_bundle_cache()
+    if not cache:
+        return 'disabled'
     
-    # 한국어 → 영어 표준화
-    for kr_name, en_name in {**asia_destinations, **europe_destinations}.items():
-        if kr_name in destination_lower:
-            return en_name
+    assistant = AITravelAssistant()
+    enhanced_destination = analyze_destination(destination)
+    season = assistant.get_season(start_date)
+    travel_style = assistant.determine_travel_style(destination, days)
+    cache_key = cache.make_key(enhanced_destination, season, travel_style, days)
+    
+    if not force and cache.is_fresh(cache_key):
+        return 'fresh'
+    if check_only:
+        return 'missing'
+    
+    ai_content = _generate_cacheable_content(enhanced_destination, days, start_date)
+    if ai_content is None:
+        return 'failed'
     
-    return destination  # 원본 반환
+    cache.set(cache_key, ai_content)
+    return 'generated'
+
+def stream_ai_category_items(destination: str, days: int, start_date: date, category: str) -> Iterator[Dict]:
+    """
+    단일 카테고리 AI 컨텐츠를 생성되는 즉시 하나씩 반환 (스트리밍)
+    
+    AI 서비스를 사용할 수 없으면 시뮬레이션 응답으로 대체하고, 그래도 아무 항목도
+    생성되지 않으면 generate_ai_travel_content처럼 목적지 템플릿으로 채웁니다.
+    """
+    from ai_config import AIConfig
+    from ai_clients import get_ai_client
+    
+    assistant = AITravelAssistant()
+    enhanced_destination = analyze_destination(destination)
+    season = assistant.get_season(start_date)
+    travel_style = assistant.determine_travel_style(destination, days)
+    
+    client = get_ai_client(AIConfig.AI_SERVICE)
+    if client:
+        prompts = client.build_category_prompts(enhanced_destination, days, season, travel_style)
+        items = client.stream_category_items(prompts[category], category)
+    else:
+        prompt = assistant.base_prompts[category].format(
+            destination=enhanced_destination, days=days, season=season, travel_style=travel_style
+        )
+        items = iter_json_array_objects([assistant.simulate_ai_response(prompt)])
+    
+    produced = False
+    for item in items:
+        produced = True
+        yield item
+    if produced:
+        return
+    
+    # 시뮬레이션 응답이 없는 카테고리(현지 정보, 위시리스트)도 비지 않도록 템플릿으로 대체
+    print(f"📋 {category} 스트리밍 결과 없음, 목적지 템플릿으로 대체")
+    from destination_templates import get_destination_template
+    
+    template_data = get_destination_template(destination, days).get_template_data()
+    yield from template_data.get(CATEGORY_CONTENT_KEYS[category], [])
+
+def analyze_destination(destination: str) -> str:
+    """목적지 분석 및 표준화 (지명 사전의 표준 목적지명, 찾지 못하면 원본)"""
+    place = match_destination(destination)
+    return place.name if place else destination
 
 # 실시간 정보 가져오기 (선택사항)
 def get_realtime_info(destination: str) -> Dict:
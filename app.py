@@ -1,73 +1,117 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from flask import Flask, Response, abort, render_template, request, redirect, url_for, flash, jsonify, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import func, select
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
 from datetime import datetime, date
+import json
 import os
 from werkzeug.utils import secure_filename
 from config import get_config
+from query_counter import query_budget
 
-def apply_ai_content_to_trip(trip_id, ai_content):
-    """AI 생성 컨텐츠를 데이터베이스에 적용"""
-    result = {'checklists': 0, 'items': 0, 'local_infos': 0, 'wishlists': 0}
+# AI 카테고리명 -> 여행 컨텐츠 키
+AI_CATEGORY_KEYS = {
+    'checklist': 'checklists',
+    'items': 'items',
+    'local_info': 'local_infos',
+    'wishlist': 'wishlists'
+}
+
+def build_ai_content_values(content_key, trip_id, data):
+    """AI 생성/템플릿 항목 하나를 테이블 컬럼 값으로 정규화"""
+    if content_key == 'checklists':
+        return {
+            'trip_id': trip_id,
+            'category': data.get('category', '출발 전'),
+            'title': data.get('title', ''),
+            'description': data.get('description'),
+            'priority': data.get('priority', 'medium')
+        }
+    elif content_key == 'items':
+        return {
+            'trip_id': trip_id,
+            'category': data.get('category', '기타'),
+            'name': data.get('name', ''),
+            'quantity': data.get('quantity', 1),
+            'notes': data.get('notes')
+        }
+    elif content_key == 'local_infos':
+        return {
+            'trip_id': trip_id,
+            'category': data.get('category', '기타'),
+            'title': data.get('title', ''),
+            'content': data.get('content', ''),
+            'rating': data.get('rating'),
+            'phone': data.get('phone'),
+            'address': data.get('address')
+        }
+    elif content_key == 'wishlists':
+        return {
+            'trip_id': trip_id,
+            'place_name': data.get('place_name', ''),
+            'category': data.get('category', '관광지'),
+            'description': data.get('description'),
+            'priority': data.get('priority', 'medium'),
+            'address': data.get('address')
+        }
+    raise ValueError(f'알 수 없는 컨텐츠 유형: {content_key}')
+
+def build_ai_content_row(content_key, trip_id, data):
+    """AI 생성 항목 하나를 데이터베이스 모델 객체로 변환"""
+    return CONTENT_MODELS[content_key](**build_ai_content_values(content_key, trip_id, data))
+
+def bulk_insert_trip_content(trip_id, content, commit=True):
+    """
+    여행 컨텐츠를 테이블별 일괄 INSERT로 한 트랜잭션에 저장
     
-    try:
-        # 체크리스트 추가
-        for checklist_data in ai_content.get('checklists', []):
-            checklist = Checklist(
-                trip_id=trip_id,
-                category=checklist_data.get('category', '출발 전'),
-                title=checklist_data.get('title', ''),
-                description=checklist_data.get('description'),
-                priority=checklist_data.get('priority', 'medium')
-            )
-            db.session.add(checklist)
-            result['checklists'] += 1
-        
-        # 준비물품 추가
-        for item_data in ai_content.get('items', []):
-            item = Item(
-                trip_id=trip_id,
-                category=item_data.get('category', '기타'),
-                name=item_data.get('name', ''),
-                quantity=item_data.get('quantity', 1),
-                notes=item_data.get('notes')
-            )
-            db.session.add(item)
-            result['items'] += 1
-        
-        # 현지정보 추가
-        for info_data in ai_content.get('local_infos', []):
-            local_info = LocalInfo(
-                trip_id=trip_id,
-                category=info_data.get('category', '기타'),
-                title=info_data.get('title', ''),
-                content=info_data.get('content', ''),
-                rating=info_data.get('rating'),
-                phone=info_data.get('phone'),
-                address=info_data.get('address')
-            )
-            db.session.add(local_info)
-            result['local_infos'] += 1
+    ORM 객체를 행마다 만들지 않고 테이블마다 executemany 한 번으로 넣습니다.
+    
+    Args:
+        trip_id: 여행 ID
+        content: 컨텐츠 키(checklists/items/local_infos/wishlists) -> 항목 목록
+        commit: False면 커밋하지 않음 (호출자가 다른 변경과 함께 커밋)
         
-        # 위시리스트 추가
-        for wishlist_data in ai_content.get('wishlists', []):
-            wishlist = Wishlist(
-                trip_id=trip_id,
-                place_name=wishlist_data.get('place_name', ''),
-                category=wishlist_data.get('category', '관광지'),
-                description=wishlist_data.get('description'),
-                priority=wishlist_data.get('priority', 'medium'),
-                address=wishlist_data.get('address')
-            )
-            db.session.add(wishlist)
-            result['wishlists'] += 1
+    Returns:
+        테이블별 저장 개수
+    """
+    result = {}
+    
+    try:
+        for content_key, model in CONTENT_MODELS.items():
+            rows = [build_ai_content_values(content_key, trip_id, data) for data in content.get(content_key, ())]
+            if rows:
+                db.session.execute(model.__table__.insert(), rows)
+            result[content_key] = len(rows)
         
-        db.session.commit()
+        if commit:
+            db.session.commit()
         return result
         
     except Exception as e:
         db.session.rollback()
         raise e
 
+def apply_ai_content_to_trip(trip_id, ai_content, commit=True):
+    """AI 생성 컨텐츠를 데이터베이스에 적용"""
+    return bulk_insert_trip_content(trip_id, ai_content, commit=commit)
+
+# 템플릿/AI 적용 실패시 사용하는 기본 체크리스트
+DEFAULT_CHECKLISTS = [
+    {'category': '출발 전', 'title': '여권 유효기간 확인', 'priority': 'high'},
+    {'category': '출발 전', 'title': '항공권 예약 확인', 'priority': 'high'},
+    {'category': '출발 전', 'title': '숙소 예약 확인', 'priority': 'high'},
+    {'category': '출발 전', 'title': '여행자 보험 가입', 'priority': 'medium'},
+    {'category': '출발 전', 'title': '현지 화폐 환전', 'priority': 'medium'},
+    {'category': '1일차', 'title': '숙소 체크인', 'priority': 'high'},
+    {'category': '1일차', 'title': '현지 교통카드 구매', 'priority': 'medium'},
+    {'category': '귀국 후', 'title': '사진 정리', 'priority': 'low'},
+]
+
+def apply_default_checklists(trip_id, commit=True):
+    """기본 체크리스트만 여행에 추가"""
+    bulk_insert_trip_content(trip_id, {'checklists': DEFAULT_CHECKLISTS}, commit=commit)
+
 app = Flask(__name__)
 config_class = get_config()
 app.config.from_object(config_class)
@@ -78,7 +122,12 @@ os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 db = SQLAlchemy(app)
 
 # 데이터베이스 모델 정의
+# 인덱스를 추가하면 기존 데이터베이스에는 db_migrations.upgrade_database가 만들어 줌
 class Trip(db.Model):
+    __table_args__ = (
+        db.Index('ix_trip_created_at', 'created_at'),  # 홈페이지 최신순 목록
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
     destination = db.Column(db.String(100), nullable=False)
@@ -93,8 +142,16 @@ class Trip(db.Model):
     expenses = db.relationship('Expense', backref='trip', lazy=True, cascade='all, delete-orphan')
     wishlists = db.relationship('Wishlist', backref='trip', lazy=True, cascade='all, delete-orphan')
     memories = db.relationship('Memory', backref='trip', lazy=True, cascade='all, delete-orphan')
+    generation_jobs = db.relationship('GenerationJob', backref='trip', lazy=True, cascade='all, delete-orphan')
 
+# SQLite는 외래 키에 인덱스를 자동으로 만들지 않으므로 trip_id로 시작하는 인덱스를 직접 지정
+# (복합 인덱스의 첫 컬럼이 trip_id면 trip_id 단독 조회에도 사용됨)
 class Checklist(db.Model):
+    __table_args__ = (
+        db.Index('ix_checklist_trip_id_is_completed', 'trip_id', 'is_completed'),
+        db.Index('ix_checklist_trip_id_category', 'trip_id', 'category'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     trip_id = db.Column(db.Integer, db.ForeignKey('trip.id'), nullable=False)
     category = db.Column(db.String(50), nullable=False)  # 출발 전, 1일차, 2일차, 3일차, 귀국 후
@@ -105,6 +162,11 @@ class Checklist(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 class Item(db.Model):
+    __table_args__ = (
+        db.Index('ix_item_trip_id_is_packed', 'trip_id', 'is_packed'),
+        db.Index('ix_item_trip_id_category', 'trip_id', 'category'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     trip_id = db.Column(db.Integer, db.ForeignKey('trip.id'), nullable=False)
     category = db.Column(db.String(50), nullable=False)  # 서류, 의류, 용품, 약품, 전자기기
@@ -115,6 +177,10 @@ class Item(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 class LocalInfo(db.Model):
+    __table_args__ = (
+        db.Index('ix_local_info_trip_id_category', 'trip_id', 'category'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     trip_id = db.Column(db.Integer, db.ForeignKey('trip.id'), nullable=False)
     category = db.Column(db.String(50), nullable=False)  # 환율, 긴급연락처, 교통수단, 맛집
@@ -127,6 +193,10 @@ class LocalInfo(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 class Expense(db.Model):
+    __table_args__ = (
+        db.Index('ix_expense_trip_id', 'trip_id'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     trip_id = db.Column(db.Integer, db.ForeignKey('trip.id'), nullable=False)
     category = db.Column(db.String(50), nullable=False)  # 교통비, 숙박비, 식비, 쇼핑, 관광, 기타
@@ -137,6 +207,11 @@ class Expense(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 class Wishlist(db.Model):
+    __table_args__ = (
+        db.Index('ix_wishlist_trip_id_is_visited', 'trip_id', 'is_visited'),
+        db.Index('ix_wishlist_trip_id_category', 'trip_id', 'category'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     trip_id = db.Column(db.Integer, db.ForeignKey('trip.id'), nullable=False)
     place_name = db.Column(db.String(100), nullable=False)
@@ -151,6 +226,10 @@ class Wishlist(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 class Memory(db.Model):
+    __table_args__ = (
+        db.Index('ix_memory_trip_id', 'trip_id'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     trip_id = db.Column(db.Integer, db.ForeignKey('trip.id'), nullable=False)
     title = db.Column(db.String(100), nullable=False)
@@ -160,6 +239,140 @@ class Memory(db.Model):
     location = db.Column(db.String(100))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+class GenerationJob(db.Model):
+    __table_args__ = (
+        db.Index('ix_generation_job_status_id', 'status', 'id'),  # 대기 작업 가져오기
+        db.Index('ix_generation_job_trip_id_id', 'trip_id', 'id'),  # 여행의 최근 작업 조회
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    trip_id = db.Column(db.Integer, db.ForeignKey('trip.id'), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='queued')  # queued, running, completed, failed
+    progress = db.Column(db.Text)  # 카테고리별 진행 상황 (JSON)
+    result = db.Column(db.Text)  # 카테고리별 생성 개수 (JSON)
+    error = db.Column(db.Text)
+    attempts = db.Column(db.Integer, default=0)
+    worker = db.Column(db.String(50))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+# 여행 컨텐츠 키 -> 모델 (bulk_insert_trip_content 저장 순서)
+CONTENT_MODELS = {
+    'checklists': Checklist,
+    'items': Item,
+    'local_infos': LocalInfo,
+    'wishlists': Wishlist
+}
+
+# 여행 상세 화면 진행률 집계 (키 -> 모델, 완료 여부 컬럼)
+TRIP_PROGRESS_COLUMNS = {
+    'checklist': (Checklist, Checklist.is_completed),
+    'packing': (Item, Item.is_packed),
+    'wishlist': (Wishlist, Wishlist.is_visited)
+}
+
+# 여행 + 진행률 집계 + 하위 항목 6종(JSON 배열)을 SELECT 한 번으로
+TRIP_DETAIL_QUERY_BUDGET = 1
+
+# 여행 상세 화면에서 함께 로드하는 하위 항목
+TRIP_DETAIL_COLLECTIONS = ('checklists', 'items', 'local_infos', 'expenses', 'wishlists', 'memories')
+
+def trip_aggregate_query(trip_id):
+    """여행 + 진행률 집계(카테고리별 완료 수, 전체 수 순서) SELECT 문"""
+    columns = []
+    for model, done_column in TRIP_PROGRESS_COLUMNS.values():
+        columns.append(select(func.count(model.id)).where(model.trip_id == Trip.id, done_column.is_(True))
+                       .correlate(Trip).scalar_subquery())
+        columns.append(select(func.count(model.id)).where(model.trip_id == Trip.id)
+                       .correlate(Trip).scalar_subquery())
+    return select(Trip, *columns).where(Trip.id == trip_id)
+
+def _collection_json_column(name):
+    """하위 항목 한 종류의 모든 행을 JSON 배열 하나로 묶는 상관 서브쿼리 (SQLite json1)"""
+    model = getattr(Trip, name).property.mapper.class_
+    fields = [arg for column in model.__table__.columns for arg in (column.key, column)]
+    return (select(func.json_group_array(func.json_object(*fields)))
+            .where(model.trip_id == Trip.id).correlate(Trip).scalar_subquery())
+
+def trip_detail_query(trip_id):
+    """여행 + 진행률 집계 + 하위 항목 JSON 배열(TRIP_DETAIL_COLLECTIONS 순서) SELECT 문"""
+    return trip_aggregate_query(trip_id).add_columns(
+        *(_collection_json_column(name) for name in TRIP_DETAIL_COLLECTIONS)
+    )
+
+def _load_collection(trip, name, rows_json):
+    """
+    JSON 배열로 받은 하위 항목을 세션의 영속 객체로 만들어 trip 컬렉션에 채움
+    
+    컬럼 타입의 결과 변환기(날짜/불리언 등)를 그대로 적용하고, 컬렉션과 역참조는
+    로드된 값으로 지정하므로 이후 접근해도 추가 SELECT가 없습니다.
+    """
+    model = getattr(Trip, name).property.mapper.class_
+    dialect = db.session.get_bind().dialect
+    processors = {
+        column.key: column.type.dialect_impl(dialect).result_processor(dialect, None)
+        for column in model.__table__.columns
+    }
+    
+    objects = []
+    # json_group_array는 인덱스 순서로 모으므로 selectinload와 같은 id 순으로 정렬
+    for values in sorted(json.loads(rows_json or '[]'), key=lambda values: values['id']):
+        obj = model(**{
+            key: processors[key](value) if processors[key] and value is not None else value
+            for key, value in values.items()
+        })
+        make_transient_to_detached(obj)
+        obj = db.session.merge(obj, load=False)
+        set_committed_value(obj, 'trip', trip)
+        objects.append(obj)
+    set_committed_value(trip, name, objects)
+    return objects
+
+def load_trip_aggregate(trip_id):
+    """
+    여행 상세 화면 데이터를 여행 크기와 관계없이 SELECT 한 번으로 로드
+    
+    여행, 진행률 집계(완료/전체 수), 하위 항목 6종을 상관 서브쿼리로 한 SELECT에서
+    가져옵니다. 하위 항목은 종류마다 JSON 배열 하나로 받아 ORM 객체로 바꿉니다.
+    
+    Args:
+        trip_id: 여행 ID
+        
+    Returns:
+        {'trip', 'checklists', 'items', 'local_infos', 'expenses', 'wishlists', 'memories',
+         'progress': {키: {'completed', 'total', 'percent'}}} (여행이 없으면 None)
+    """
+    row = db.session.execute(trip_detail_query(trip_id)).first()
+    if row is None:
+        return None
+    
+    trip = row[0]
+    counts = row[1:1 + len(TRIP_PROGRESS_COLUMNS) * 2]
+    collections = row[1 + len(TRIP_PROGRESS_COLUMNS) * 2:]
+    for name, rows_json in zip(TRIP_DETAIL_COLLECTIONS, collections):
+        _load_collection(trip, name, rows_json)
+    
+    progress = {}
+    for index, key in enumerate(TRIP_PROGRESS_COLUMNS):
+        completed, total = counts[index * 2], counts[index * 2 + 1]
+        progress[key] = {
+            'completed': completed,
+            'total': total,
+            'percent': (completed / total * 100) if total > 0 else 0
+        }
+    
+    return {
+        'trip': trip,
+        'checklists': trip.checklists,
+        'items': trip.items,
+        'local_infos': trip.local_infos,
+        'expenses': trip.expenses,
+        'wishlists': trip.wishlists,
+        'memories': trip.memories,
+        'progress': progress
+    }
+
 # 라우트 정의
 @app.route('/')
 def index():
@@ -167,41 +380,25 @@ def index():
     return render_template('index.html', trips=trips)
 
 @app.route('/trip/<int:trip_id>')
+@query_budget(TRIP_DETAIL_QUERY_BUDGET)
 def trip_detail(trip_id):
-    trip = Trip.query.get_or_404(trip_id)
-    
-    # 각 카테고리별 데이터 가져오기
-    checklists = Checklist.query.filter_by(trip_id=trip_id).all()
-    items = Item.query.filter_by(trip_id=trip_id).all()
-    local_infos = LocalInfo.query.filter_by(trip_id=trip_id).all()
-    expenses = Expense.query.filter_by(trip_id=trip_id).all()
-    wishlists = Wishlist.query.filter_by(trip_id=trip_id).all()
-    memories = Memory.query.filter_by(trip_id=trip_id).all()
-    
-    # 진행률 계산
-    total_checklists = len(checklists)
-    completed_checklists = len([c for c in checklists if c.is_completed])
-    checklist_progress = (completed_checklists / total_checklists * 100) if total_checklists > 0 else 0
-    
-    total_items = len(items)
-    packed_items = len([i for i in items if i.is_packed])
-    packing_progress = (packed_items / total_items * 100) if total_items > 0 else 0
-    
-    total_wishlist = len(wishlists)
-    visited_places = len([w for w in wishlists if w.is_visited])
-    wishlist_progress = (visited_places / total_wishlist * 100) if total_wishlist > 0 else 0
+    # 여행 + 진행률 집계 + 하위 항목을 고정된 쿼리 수로 로드
+    aggregate = load_trip_aggregate(trip_id)
+    if aggregate is None:
+        abort(404)
+    progress = aggregate['progress']
     
     return render_template('trip_detail.html', 
-                         trip=trip,
-                         checklists=checklists,
-                         items=items,
-                         local_infos=local_infos,
-                         expenses=expenses,
-                         wishlists=wishlists,
-                         memories=memories,
-                         checklist_progress=checklist_progress,
-                         packing_progress=packing_progress,
-                         wishlist_progress=wishlist_progress)
+                         trip=aggregate['trip'],
+                         checklists=aggregate['checklists'],
+                         items=aggregate['items'],
+                         local_infos=aggregate['local_infos'],
+                         expenses=aggregate['expenses'],
+                         wishlists=aggregate['wishlists'],
+                         memories=aggregate['memories'],
+                         checklist_progress=progress['checklist']['percent'],
+                         packing_progress=progress['packing']['percent'],
+                         wishlist_progress=progress['wishlist']['percent'])
 
 @app.route('/edit_trip/<int:trip_id>', methods=['GET', 'POST'])
 def edit_trip(trip_id):
@@ -255,17 +452,13 @@ def create_trip():
         
         try:
             if use_ai:
-                # AI 기반 컨텐츠 생성
-                from ai_travel_assistant import generate_ai_travel_content
-                ai_content = generate_ai_travel_content(trip.destination, days, start_date)
-                result = apply_ai_content_to_trip(trip.id, ai_content)
+                # AI 기반 컨텐츠 생성은 백그라운드 작업으로 처리
+                from ai_jobs import enqueue_generation_job
+                enqueue_generation_job(trip.id)
                 
-                flash(f'🤖 AI가 여행 계획을 생성했습니다! ✨\n'
-                      f'📋 체크리스트: {result["checklists"]}개\n'
-                      f'🎒 준비물품: {result["items"]}개\n'
-                      f'ℹ️ 현지정보: {result["local_infos"]}개\n'
-                      f'❤️ 위시리스트: {result["wishlists"]}개\n'
-                      f'{trip.destination}에 특화된 AI 추천이 적용되었습니다!', 'success')
+                flash(f'🤖 AI가 여행 계획을 생성하고 있습니다! ✨\n'
+                      f'잠시 후 체크리스트, 준비물품, 현지정보, 위시리스트가 추가됩니다.\n'
+                      f'{trip.destination}에 특화된 AI 추천이 곧 적용됩니다!', 'success')
             else:
                 # 기존 템플릿 방식
                 from destination_templates import apply_template_to_trip
@@ -280,27 +473,8 @@ def create_trip():
                   
         except Exception as e:
             # 템플릿 적용 실패시 기본 체크리스트만 생성
-            default_checklists = [
-                {'category': '출발 전', 'title': '여권 유효기간 확인', 'priority': 'high'},
-                {'category': '출발 전', 'title': '항공권 예약 확인', 'priority': 'high'},
-                {'category': '출발 전', 'title': '숙소 예약 확인', 'priority': 'high'},
-                {'category': '출발 전', 'title': '여행자 보험 가입', 'priority': 'medium'},
-                {'category': '출발 전', 'title': '현지 화폐 환전', 'priority': 'medium'},
-                {'category': '1일차', 'title': '숙소 체크인', 'priority': 'high'},
-                {'category': '1일차', 'title': '현지 교통카드 구매', 'priority': 'medium'},
-                {'category': '귀국 후', 'title': '사진 정리', 'priority': 'low'},
-            ]
-            
-            for item in default_checklists:
-                checklist = Checklist(
-                    trip_id=trip.id,
-                    category=item['category'],
-                    title=item['title'],
-                    priority=item['priority']
-                )
-                db.session.add(checklist)
-            
-            db.session.commit()
+            db.session.rollback()
+            apply_default_checklists(trip.id)
             flash('여행 계획이 생성되었습니다! (기본 템플릿 적용)', 'success')
         
         return redirect(url_for('trip_detail', trip_id=trip.id))
@@ -443,15 +617,136 @@ def add_item():
         db.session.rollback()
         return jsonify({'success': False, 'message': f'오류가 발생했습니다: {str(e)}'})
 
+@app.route('/api/trip/<int:trip_id>/generation_status')
+def generation_status(trip_id):
+    """AI 생성 작업의 카테고리별 진행 상황"""
+    Trip.query.get_or_404(trip_id)
+    
+    from ai_jobs import get_generation_status
+    return jsonify(get_generation_status(trip_id))
+
+def format_sse(event, data):
+    """Server-Sent Events 메시지 형식으로 변환"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.route('/api/trip/<int:trip_id>/stream/<category>', methods=['GET', 'POST'])
+def stream_trip_content(trip_id, category):
+    """
+    AI 생성 항목을 Server-Sent Events로 실시간 전송
+    
+    GET은 저장하지 않는 미리보기라 프리페치나 EventSource 재연결에도 안전합니다.
+    POST는 저장 권한(GenerationJob 행)을 원자적으로 가져온 요청만 항목을 저장하고,
+    이미 항목이 있거나 다른 생성 작업이 진행 중이면 미리보기로만 전송합니다
+    (추가 생성은 /api/trip/<id>/regenerate/<category>).
+    """
+    if category not in AI_CATEGORY_KEYS:
+        return jsonify({'success': False, 'message': '잘못된 카테고리입니다.'}), 400
+    
+    trip = Trip.query.get_or_404(trip_id)
+    destination, start_date = trip.destination, trip.start_date
+    days = (trip.end_date - start_date).days + 1
+    content_key = AI_CATEGORY_KEYS[category]
+    
+    from ai_jobs import claim_stream_job, finish_stream_job
+    from ai_travel_assistant import stream_ai_category_items
+    
+    job_id = None
+    if request.method == 'POST':
+        job_id = claim_stream_job(trip_id, category, app.config['GENERATION_JOB_STALE_SECONDS'])
+    persist = job_id is not None
+    
+    def generate():
+        count = 0
+        finished = not persist
+        try:
+            for data in stream_ai_category_items(destination, days, start_date, category):
+                row_id = None
+                if persist:
+                    row = build_ai_content_row(content_key, trip_id, data)
+                    db.session.add(row)
+                    db.session.commit()
+                    row_id = row.id
+                count += 1
+                yield format_sse('item', {'id': row_id, **data})
+            
+            if persist:
+                finish_stream_job(job_id, category, count)
+                finished = True
+            yield format_sse('done', {'category': category, 'count': count, 'saved': persist})
+            
+        except Exception as e:
+            db.session.rollback()
+            if not finished:
+                finish_stream_job(job_id, category, count, error=str(e))
+                finished = True
+            yield format_sse('error', {'message': f'오류가 발생했습니다: {str(e)}'})
+        
+        finally:
+            if not finished:
+                # 클라이언트 연결이 끊겨 중단된 경우 (저장된 항목은 유지)
+                finish_stream_job(job_id, category, count, error='스트리밍 연결이 끊어졌습니다.')
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/api/trip/<int:trip_id>/regenerate/<category>', methods=['POST'])
+def regenerate_trip_category(trip_id, category):
+    """기존 여행의 한 카테고리만 AI로 추가 생성 (기존 항목과 겹치지 않는 새 항목만 저장)"""
+    if category not in AI_CATEGORY_KEYS:
+        return jsonify({'success': False, 'message': '잘못된 카테고리입니다.'}), 400
+    
+    trip = Trip.query.get_or_404(trip_id)
+    days = (trip.end_date - trip.start_date).days + 1
+    content_key = AI_CATEGORY_KEYS[category]
+    
+    try:
+        from ai_prompts import CATEGORY_TITLE_FIELDS
+        from ai_travel_assistant import AITravelAssistant
+        
+        # 기존 항목은 이름 컬럼만 조회
+        title_column = getattr(CONTENT_MODELS[content_key], CATEGORY_TITLE_FIELDS[category])
+        existing_titles = [title for (title,) in db.session.query(title_column).filter_by(trip_id=trip_id)]
+        
+        new_items = AITravelAssistant().regenerate_category(
+            trip.destination, days, trip.start_date, category, existing_titles
+        )
+        result = bulk_insert_trip_content(trip_id, {content_key: new_items})
+        
+        return jsonify({
+            'success': True,
+            'category': category,
+            'added': result[content_key],
+            'items': new_items,
+            'message': f'새 항목 {result[content_key]}개가 추가되었습니다.'
+        })
+    
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': f'오류가 발생했습니다: {str(e)}'})
+
 @app.route('/api/ai_status')
 def ai_status():
     """AI 서비스 상태 확인"""
     try:
         from ai_config import AIConfig
+        from ai_cache import get_completion_cache
+        from ai_resilience import get_circuit_status
+        from ai_ratelimit import get_rate_limit_stats
+        from ai_hedging import get_latency_tracker
+        from destination_templates import template_cache_stats
+        cache = get_completion_cache()
         return jsonify({
             'available': AIConfig.is_ai_available(),
             'service': AIConfig.AI_SERVICE,
-            'status': AIConfig.get_service_status()
+            'status': AIConfig.get_service_status(),
+            'cache': cache.stats() if cache else None,
+            'circuits': get_circuit_status(),
+            'rate_limits': get_rate_limit_stats(),
+            'latency': get_latency_tracker().stats(),
+            'templates': template_cache_stats()
         })
     except Exception as e:
         return jsonify({
@@ -460,6 +755,21 @@ def ai_status():
             'status': '🤖 시뮬레이션 모드 (데모용)'
         })
 
+@app.route('/api/ai_metrics')
+def ai_metrics():
+    """AI 호출 계측 집계 (지연시간 분포, 토큰 사용량, 파싱 실패율)"""
+    from ai_config import AIConfig
+    from ai_telemetry import get_telemetry, read_telemetry_log
+    
+    metrics = get_telemetry().snapshot()
+    
+    # ?recent=N: 저장된 최근 호출 기록 (AI_TELEMETRY_LOG 설정 시)
+    recent = request.args.get('recent', type=int)
+    if recent and AIConfig.TELEMETRY_LOG_PATH:
+        metrics['recent'] = read_telemetry_log(AIConfig.TELEMETRY_LOG_PATH, limit=min(recent, 1000))
+    
+    return jsonify(metrics)
+
 @app.route('/manifest.json')
 def manifest():
     return {
@@ -531,6 +841,12 @@ def internal_error(error):
     return render_template('500.html'), 500
 
 if __name__ == '__main__':
+    from db_migrations import upgrade_database
     with app.app_context():
-        db.create_all()
+        upgrade_database()
+    
+    # 디버그 리로더의 감시 프로세스에서는 워커를 시작하지 않음
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        from ai_jobs import start_generation_workers
+        start_generation_workers(app)
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,128 @@
+"""
+AI 응답 JSON 추출 마이크로벤치마크
+
+기존 방식(split('```') + json.loads 한 번)과 ai_json의 추출(extract_json_array),
+추출 + 필드 정규화(parse_category_items)의 처리 시간과 항목 복구율을 비교합니다.
+
+코퍼스:
+- LLM 응답 캐시(AIConfig.COMPLETION_CACHE_PATH)에 저장된 실제 응답 (있을 때)
+- 실제 응답 형태를 본뜬 내장 샘플 (설명 문장, 코드 블록, 후행 쉼표,
+  max_tokens로 잘린 응답, 둥근 따옴표)
+
+사용법:
+    python benchmarks/bench_json_extract.py [반복 횟수]
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from ai_config import AIConfig  # noqa: E402
+from ai_json import extract_json_array, parse_category_items  # noqa: E402
+
+CHECKLIST = [
+    {"category": "출발 전", "title": f"확인 항목 {i}", "priority": "high", "description": "6개월 이상 남아있는지 확인"}
+    for i in range(12)
+]
+ITEMS = [
+    {"category": "의류", "name": f"준비물 {i}", "quantity": 2, "notes": "우기철 필수품"}
+    for i in range(15)
+]
+LOCAL_INFO = [
+    {"category": "맛집", "title": f"현지 식당 {i}", "content": "현지인 추천 맛집, 점심 11시-15시", "rating": 4.5,
+     "phone": None, "address": "시내 중심가"}
+    for i in range(10)
+]
+
+
+def _sample_corpus():
+    """실제 응답 형태를 본뜬 (카테고리, 응답) 목록"""
+    checklist = json.dumps(CHECKLIST, ensure_ascii=False, indent=2)
+    items = json.dumps(ITEMS, ensure_ascii=False, indent=2)
+    local_info = json.dumps(LOCAL_INFO, ensure_ascii=False, indent=2)
+
+    return [
+        ('checklist', checklist),
+        ('items', items),
+        ('local_info', local_info),
+        ('checklist', f"다음은 요청하신 체크리스트입니다.\n\n```json\n{checklist}\n```\n\n즐거운 여행 되세요!"),
+        ('items', f"```\n{items}\n```"),
+        ('items', items.replace('"notes": "우기철 필수품"\n', '"notes": "우기철 필수품",\n')),  # 후행 쉼표
+        ('local_info', local_info[:int(len(local_info) * 0.8)]),  # max_tokens로 잘린 응답
+        ('checklist', checklist.replace('"확인 항목 3"', '“확인 항목 3”')),  # 둥근 따옴표
+        ('items', items.replace('"quantity": 2', '"quantity": "2개"')),  # 문자열 수량
+    ]
+
+
+def _cached_corpus():
+    """응답 캐시에 저장된 실제 카테고리 응답"""
+    path = AIConfig.COMPLETION_CACHE_PATH
+    if not os.path.exists(path):
+        return []
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT category, response FROM completion_cache "
+            "WHERE category IN ('checklist', 'items', 'local_info', 'wishlist')"
+        ).fetchall()
+    except sqlite3.Error:
+        return []
+    finally:
+        conn.close()
+    return [(category, response) for category, response in rows]
+
+
+def legacy_parse(response, category):
+    """기존 클라이언트의 _parse_json_response 방식 (비교용)"""
+    try:
+        response = response.strip()
+        if '```json' in response:
+            response = response.split('```json')[1].split('```')[0]
+        elif '```' in response:
+            parts = response.split('```')
+            if len(parts) >= 2:
+                response = parts[1]
+            else:
+                response = response.replace('```', '')
+        start_idx = response.find('[')
+        end_idx = response.rfind(']')
+        if start_idx != -1 and end_idx != -1:
+            response = response[start_idx:end_idx + 1]
+        parsed = json.loads(response.strip())
+        return parsed if isinstance(parsed, list) else []
+    except Exception:
+        return []
+
+
+def bench(name, parse, corpus, repeat):
+    """corpus 전체를 repeat번 파싱한 시간과 복구한 항목 수"""
+    recovered = sum(len(parse(response, category)) for category, response in corpus)
+    empty = sum(1 for category, response in corpus if not parse(response, category))
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for category, response in corpus:
+            parse(response, category)
+    elapsed = time.perf_counter() - started
+
+    per_call = elapsed / (repeat * len(corpus)) * 1e6
+    print(f"{name:<10} {per_call:9.1f} µs/응답   항목 {recovered:5d}개   빈 결과 {empty:3d}/{len(corpus)}")
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    cached = _cached_corpus()
+    corpus = cached + _sample_corpus()
+    print(f"코퍼스: 캐시된 실제 응답 {len(cached)}개 + 샘플 {len(corpus) - len(cached)}개, 반복 {repeat}회\n")
+
+    bench('legacy', legacy_parse, corpus, repeat)
+    bench('extract', lambda response, category: extract_json_array(response), corpus, repeat)
+    bench('coerce', parse_category_items, corpus, repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+여행 컨텐츠 저장 벤치마크
+
+1,000행 규모의 AI 컨텐츠 묶음을 기존 방식(행마다 ORM 객체 생성 후 session.add)과
+bulk_insert_trip_content(테이블별 executemany 한 번, 한 트랜잭션)로 저장해
+소요 시간을 비교합니다. 데이터베이스는 임시 SQLite 파일을 사용합니다.
+
+사용법:
+    python benchmarks/bench_materialize.py [--rows 1000] [--runs 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# 앱 설정보다 먼저 임시 데이터베이스 지정
+_db_dir = tempfile.mkdtemp(prefix='bench_materialize_')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def _summary(name, values):
+    print(f"{name:<10} 평균 {statistics.mean(values) * 1000:8.1f}ms   "
+          f"중앙값 {statistics.median(values) * 1000:8.1f}ms   p95 {_percentile(values, 95) * 1000:8.1f}ms")
+
+
+def build_bundle(rows):
+    """카테고리별로 rows/4개씩인 AI 컨텐츠 묶음"""
+    per_category = max(1, rows // 4)
+    return {
+        'checklists': [
+            {'category': f'{i % 5 + 1}일차', 'title': f'체크리스트 항목 {i}', 'description': '설명', 'priority': 'medium'}
+            for i in range(per_category)
+        ],
+        'items': [
+            {'category': '용품', 'name': f'준비물 {i}', 'quantity': i % 3 + 1, 'notes': '메모'}
+            for i in range(per_category)
+        ],
+        'local_infos': [
+            {'category': '맛집', 'title': f'현지 정보 {i}', 'content': '내용', 'rating': 4.5,
+             'phone': '+81-3-0000-0000', 'address': '주소'}
+            for i in range(per_category)
+        ],
+        'wishlists': [
+            {'place_name': f'장소 {i}', 'category': '관광지', 'description': '설명', 'priority': 'high'}
+            for i in range(per_category)
+        ],
+    }
+
+
+def orm_insert(trip_id, content):
+    """기존 방식: 행마다 ORM 객체를 만들어 세션에 추가"""
+    from app import build_ai_content_row, db
+
+    result = {}
+    for content_key in ('checklists', 'items', 'local_infos', 'wishlists'):
+        for data in content.get(content_key, []):
+            db.session.add(build_ai_content_row(content_key, trip_id, data))
+        result[content_key] = len(content.get(content_key, []))
+    db.session.commit()
+    return result
+
+
+def run(rows, runs):
+    """방식별로 새 여행에 묶음을 runs번 저장해 소요 시간 반환"""
+    from app import Trip, app, bulk_insert_trip_content, db
+
+    bundle = build_bundle(rows)
+    timings = {'orm': [], 'bulk': []}
+    with app.app_context():
+        db.create_all()
+        for _ in range(runs):
+            for name, writer in (('orm', orm_insert), ('bulk', bulk_insert_trip_content)):
+                trip = Trip(name=f"{name} 벤치마크", destination='도쿄',
+                            start_date=date(2024, 10, 15), end_date=date(2024, 10, 15) + timedelta(days=4))
+                db.session.add(trip)
+                db.session.commit()
+
+                started = time.perf_counter()
+                counts = writer(trip.id, bundle)
+                timings[name].append(time.perf_counter() - started)
+                assert sum(counts.values()) == sum(len(items) for items in bundle.values())
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='여행 컨텐츠 저장 벤치마크 (ORM vs 일괄 INSERT)')
+    parser.add_argument('--rows', type=int, default=1000, help='묶음당 전체 행 수 (4개 카테고리에 나눔)')
+    parser.add_argument('--runs', type=int, default=20, help='방식별 반복 횟수')
+    args = parser.parse_args()
+
+    print(f"💾 {args.rows}행 묶음 x {args.runs}회 ({os.environ['DATABASE_URL']})\n")
+    timings = run(args.rows, args.runs)
+    for name, values in timings.items():
+        _summary(name, values)
+    print(f"\n일괄 INSERT 속도 향상: {statistics.median(timings['orm']) / statistics.median(timings['bulk']):.1f}배")
+
+
+if __name__ == '__main__':
+    main()
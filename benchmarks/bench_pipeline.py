@@ -0,0 +1,106 @@
+"""
+AI 여행 컨텐츠 파이프라인 종단 벤치마크
+
+generate_ai_travel_content -> apply_ai_content_to_trip 전체 경로를 카세트
+(ai_cassette) 재생으로 네트워크 없이 반복 실행하고 단계별 소요 시간을 측정합니다.
+데이터베이스는 임시 SQLite 파일을 사용합니다.
+
+사용법:
+    # 1) 카세트 녹화 (실제 API 또는 mock_llm_server.py에 연결)
+    ANTHROPIC_API_KEY=... python benchmarks/bench_pipeline.py --record
+
+    # 2) 재생 (기본: 기록된 속도, --speed 0이면 즉시)
+    python benchmarks/bench_pipeline.py [--runs 10] [--speed 0]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# 앱 설정보다 먼저 임시 데이터베이스 지정
+_db_dir = tempfile.mkdtemp(prefix='bench_pipeline_')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_db_dir, 'bench.db')}"
+
+from ai_config import AIConfig  # noqa: E402
+
+TRIPS = [
+    ('도쿄', 5, date(2024, 10, 15)),
+    ('파리', 7, date(2024, 6, 1)),
+    ('제주도', 3, date(2024, 8, 10)),
+]
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def _summary(name, values):
+    print(f"{name:<10} 평균 {statistics.mean(values) * 1000:8.1f}ms   "
+          f"중앙값 {statistics.median(values) * 1000:8.1f}ms   p95 {_percentile(values, 95) * 1000:8.1f}ms")
+
+
+def run(runs):
+    """여행마다 생성 -> 적용을 runs번 반복해 단계별 소요 시간 반환"""
+    from ai_travel_assistant import generate_ai_travel_content
+    from app import Trip, app, apply_ai_content_to_trip, db
+
+    timings = {'generate': [], 'apply': [], 'total': []}
+    fallbacks = 0
+    with app.app_context():
+        db.create_all()
+        for _ in range(runs):
+            for destination, days, start_date in TRIPS:
+                trip = Trip(name=f"{destination} 벤치마크", destination=destination,
+                            start_date=start_date, end_date=start_date + timedelta(days=days - 1))
+                db.session.add(trip)
+                db.session.commit()
+
+                started = time.perf_counter()
+                content = generate_ai_travel_content(destination, days, start_date)
+                generated = time.perf_counter()
+                apply_ai_content_to_trip(trip.id, content)
+                applied = time.perf_counter()
+
+                fallbacks += len(content['generation_info']['fallback_categories'])
+                timings['generate'].append(generated - started)
+                timings['apply'].append(applied - generated)
+                timings['total'].append(applied - started)
+    return timings, fallbacks
+
+
+def main():
+    parser = argparse.ArgumentParser(description='AI 파이프라인 종단 벤치마크 (카세트 재생)')
+    parser.add_argument('--record', action='store_true', help='실제 API 호출을 카세트에 녹화')
+    parser.add_argument('--cassette', default=os.path.join('benchmarks', 'cassettes', 'pipeline.jsonl.gz'))
+    parser.add_argument('--runs', type=int, default=5, help='여행별 반복 횟수 (녹화 시 1회)')
+    parser.add_argument('--speed', type=float, default=1.0, help='재생 속도 배율 (0이면 즉시)')
+    args = parser.parse_args()
+
+    AIConfig.CASSETTE_MODE = 'record' if args.record else 'replay'
+    AIConfig.CASSETTE_PATH = args.cassette
+    AIConfig.CASSETTE_SPEED = args.speed
+    if not args.record and not os.path.exists(args.cassette):
+        print(f"❌ 카세트 파일이 없습니다: {args.cassette} (--record로 먼저 녹화하세요)")
+        return
+
+    runs = 1 if args.record else args.runs
+    print(f"📼 {AIConfig.CASSETTE_MODE} 모드, 서비스 {AIConfig.AI_SERVICE}, 여행 {len(TRIPS)}개 x {runs}회\n")
+    timings, fallbacks = run(runs)
+
+    from ai_cassette import get_cassette
+    print()
+    for name, values in timings.items():
+        _summary(name, values)
+    print(f"\n템플릿으로 채운 카테고리: {fallbacks}개")
+    print(f"카세트: {get_cassette().stats()}")
+
+
+if __name__ == '__main__':
+    main()
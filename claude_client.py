@@ -6,23 +6,49 @@ Anthropic의 Claude AI 모델을 활용하여
 """
 
 import json
+import time
 import requests
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 from datetime import datetime
+from functools import partial
+
+from ai_cache import CompletionCache, get_completion_cache
+from ai_cassette import get_cassette
+from ai_config import AIConfig
+from ai_json import (coerce_item, coerce_items, extract_json_category_arrays, has_category_items,
+                     iter_json_array_objects, mark_degraded, parse_category_items)
+from ai_clients import get_http_session
+from ai_deadline import bounded_timeout
+from ai_parallel import notify_progress, run_category_tasks
+from ai_prompts import (SegmentedPrompt, build_category_prompts, build_combined_prompt, build_gap_fill_prompt,
+                        build_instructions)
+from ai_ratelimit import RateLimitTimeout, estimate_tokens, rate_limited
+from ai_resilience import send_with_retries
+from ai_schemas import build_category_tool, build_category_tools, build_combined_tool
+from ai_telemetry import CallRecord, get_telemetry
 
 class ClaudeClient:
     """Claude AI API 클라이언트"""
     
-    def __init__(self, api_key: str, base_url: str = "https://api.anthropic.com"):
+    # 모든 요청에 공통인 정적 지침 (system 프롬프트, 프롬프트 캐시 대상)
+    INSTRUCTIONS = build_instructions(
+        "당신은 여행 전문가입니다. 여행자가 알려주는 여행 정보에 맞춰 실용적인 맞춤형 추천을 JSON 형태로 제공합니다."
+    )
+    
+    def __init__(self, api_key: str, base_url: str = "https://api.anthropic.com",
+                 session: Optional[requests.Session] = None):
         """
         Claude 클라이언트 초기화
         
         Args:
             api_key: Anthropic API 키
             base_url: API 베이스 URL
+            session: 사용할 HTTP 세션 (기본값: 베이스 URL별 공유 연결 풀)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
+        self.session = session or get_http_session(self.base_url)
+        self.timeout = AIConfig.REQUEST_TIMEOUT
         self.headers = {
             'x-api-key': api_key,
             'Content-Type': 'application/json',
@@ -30,18 +56,61 @@ class ClaudeClient:
         }
         self.model = "claude-3-haiku-20240307"  # Claude의 빠른 모델
     
-    def generate_completion(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.7) -> str:
+    def generate_completion(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.7,
+                            category: Optional[str] = None, tool: Optional[Dict] = None,
+                            use_cache: bool = True) -> str:
         """
         Claude API를 사용하여 텍스트 생성
         
+        동일한 프롬프트/옵션의 응답은 로컬 캐시에서 반환합니다.
+        정상 종료되고(max_tokens에 잘리지 않음) 항목을 하나 이상 파싱할 수 있는 응답만 캐시합니다.
+        카세트 녹화/재생 중에는 응답 캐시를 거치지 않습니다.
+        
         Args:
             prompt: 입력 프롬프트
             max_tokens: 최대 토큰 수
             temperature: 생성 창의성 (0.0-1.0)
+            category: 컨텐츠 카테고리 (캐시 TTL 결정용)
+            tool: 도구 정의 (지정하면 tool use로 구조화된 입력을 받아 JSON 텍스트로 반환)
+            use_cache: False면 응답 캐시를 읽지도 저장하지도 않음 (새로 생성해야 하는 요청)
             
         Returns:
             생성된 텍스트
         """
+        call = CallRecord('claude', self.model, category, max_tokens)
+        cache_key = CompletionCache.make_key(self._cache_provider(tool), self.model, temperature, max_tokens, prompt)
+        
+        cassette = get_cassette()
+        if cassette and cassette.replaying:
+            text = cassette.replay(cache_key, call)
+            get_telemetry().record_call(call)
+            if call.truncated:
+                mark_degraded(category, 'max_tokens 잘림')
+            return text
+        
+        cache = None if cassette or not use_cache else get_completion_cache()
+        if cache:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                call.cache_hit = True
+                get_telemetry().record_call(call)
+                return cached
+        
+        text = self._request_completion(prompt, max_tokens, temperature, call, tool)
+        get_telemetry().record_call(call)
+        if call.truncated:
+            mark_degraded(category, 'max_tokens 잘림')
+        if cassette:
+            cassette.record(cache_key, call, text)
+        
+        if cache and not call.truncated and has_category_items(text, category):
+            cache.set(cache_key, text, 'claude', self.model, category)
+        
+        return text
+    
+    def _request_completion(self, prompt: str, max_tokens: int, temperature: float,
+                            call: Optional[CallRecord] = None, tool: Optional[Dict] = None) -> str:
+        """Claude API 호출 (캐시 미적용, call이 있으면 상태/TTFB/토큰 사용량 기록)"""
         try:
             payload = {
                 "model": self.model,
@@ -54,241 +123,403 @@ class ClaudeClient:
                     }
                 ]
             }
+            self._apply_prompt_cache(payload, prompt)
+            self._apply_tool(payload, tool)
             
-            response = requests.post(
-                f"{self.base_url}/v1/messages",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                # Claude API 응답 구조에 맞춰 텍스트 추출
-                content = result.get('content', [])
-                if content and len(content) > 0:
-                    return content[0].get('text', '').strip()
-                return ""
-            else:
-                print(f"Claude API 오류: {response.status_code} - {response.text}")
-                return ""
+            # 공유 호출 한도 획득 후 재시도/서킷 브레이커 적용 (열려 있으면 바로 None)
+            with rate_limited('claude', estimate_tokens(prompt, max_tokens)) as lease:
+                response = send_with_retries('claude', lambda: self.session.post(
+                    f"{self.base_url}/v1/messages",
+                    headers=self.headers,
+                    json=payload,
+                    timeout=bounded_timeout(self.timeout)
+                ))
+                if response is None:
+                    return ""
                 
+                if call:
+                    call.status = response.status_code
+                    # 요청 전송부터 응답 헤더 수신까지의 시간
+                    call.ttfb = response.elapsed.total_seconds()
+                
+                if response.status_code == 200:
+                    result = response.json()
+                    usage = result.get('usage') or {}
+                    if call:
+                        call.stop_reason = result.get('stop_reason')
+                    if usage:
+                        lease.actual_tokens = usage.get('input_tokens', 0) + usage.get('output_tokens', 0)
+                        if call:
+                            call.input_tokens = usage.get('input_tokens')
+                            call.output_tokens = usage.get('output_tokens')
+                            call.cache_read_tokens = usage.get('cache_read_input_tokens')
+                            call.cache_write_tokens = usage.get('cache_creation_input_tokens')
+                    # Claude API 응답 구조에 맞춰 텍스트 추출
+                    content = result.get('content', [])
+                    if tool:
+                        # tool use: 도구 입력은 이미 구조화된 JSON
+                        for block in content:
+                            if block.get('type') == 'tool_use' and block.get('name') == tool['name']:
+                                return json.dumps(block.get('input') or {}, ensure_ascii=False)
+                        print(f"⚠️ Claude 응답에 {tool['name']} 도구 호출이 없습니다.")
+                        return ""
+                    if content and len(content) > 0:
+                        return content[0].get('text', '').strip()
+                    return ""
+                else:
+                    print(f"Claude API 오류: {response.status_code} - {response.text}")
+                    return ""
+                
+        except RateLimitTimeout as e:
+            print(f"⏳ {e}")
+            if call:
+                call.error = 'rate_limit_timeout'
+            return ""
         except requests.exceptions.RequestException as e:
             print(f"Claude API 요청 오류: {e}")
+            if call:
+                call.error = str(e)
             return ""
         except Exception as e:
             print(f"Claude 처리 오류: {e}")
+            if call:
+                call.error = str(e)
             return ""
     
-    def generate_travel_content(self, destination: str, days: int, season: str, travel_style: str) -> Dict:
+    def generate_completion_stream(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.7,
+                                   category: Optional[str] = None, tool: Optional[Dict] = None) -> Iterator[str]:
         """
-        여행 컨텐츠 생성
+        Claude API 스트리밍 텍스트 생성
+        
+        응답 텍스트를 도착하는 대로 조각 단위로 반환합니다.
+        캐시된 응답이 있으면 한 번에 반환합니다. message_stop까지 받은 정상 종료
+        응답만 캐시합니다 (generate_completion과 같은 기준).
         
         Args:
-            destination: 목적지
-            days: 여행 일수
-            season: 계절
-            travel_style: 여행 스타일
+            prompt: 입력 프롬프트
+            max_tokens: 최대 토큰 수
+            temperature: 생성 창의성 (0.0-1.0)
+            category: 컨텐츠 카테고리 (캐시 TTL 결정용)
+            tool: 도구 정의 (지정하면 도구 입력 JSON 조각을 반환)
             
-        Returns:
-            생성된 여행 컨텐츠
+        Yields:
+            생성된 텍스트 조각
+        """
+        cache_key = CompletionCache.make_key(self._cache_provider(tool), self.model, temperature, max_tokens, prompt)
+        
+        cassette = get_cassette()
+        if cassette and cassette.replaying:
+            call = CallRecord('claude', self.model, category, max_tokens)
+            try:
+                yield from cassette.replay_stream(cache_key, call)
+            finally:
+                get_telemetry().record_call(call)
+            return
+        
+        cache = None if cassette else get_completion_cache()
+        if cache:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                call = CallRecord('claude', self.model, category, max_tokens)
+                call.cache_hit = True
+                get_telemetry().record_call(call)
+                yield cached
+                return
+        
+        payload = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        }
+        self._apply_prompt_cache(payload, prompt)
+        self._apply_tool(payload, tool)
+        
+        call = CallRecord('claude', self.model, category, max_tokens)
+        parts = []
+        finished = False
+        # 녹화 중이면 조각별 도착 시각도 기록
+        chunks = [] if cassette else None
+        try:
+            # 스트리밍이 끝날 때까지 동시 요청 슬롯 유지
+            with rate_limited('claude', estimate_tokens(prompt, max_tokens)) as lease:
+                response = send_with_retries('claude', lambda: self.session.post(
+                    f"{self.base_url}/v1/messages",
+                    headers=self.headers,
+                    json=payload,
+                    timeout=bounded_timeout(self.timeout),
+                    stream=True
+                ))
+                if response is None:
+                    return
+            
+                call.status = response.status_code
+                with response:
+                    if response.status_code != 200:
+                        print(f"Claude API 오류: {response.status_code} - {response.text}")
+                        return
+                
+                    # Server-Sent Events: "data: {...}" 줄 단위로 이벤트 수신
+                    for raw_line in response.iter_lines():
+                        line = raw_line.decode('utf-8')
+                        if not line.startswith('data:'):
+                            continue
+                    
+                        try:
+                            event = json.loads(line[5:].strip())
+                        except ValueError:
+                            # 손상/잘린 이벤트 한 줄 때문에 스트림 전체를 끊지 않음
+                            print(f"⚠️ Claude 스트리밍 이벤트 파싱 실패, 건너뜀: {line[:100]}")
+                            continue
+                        if not isinstance(event, dict):
+                            continue
+                        
+                        if event.get('type') == 'content_block_delta':
+                            delta = event.get('delta', {})
+                            # 텍스트는 text_delta, 도구 입력은 input_json_delta로 도착
+                            text = delta.get('partial_json', '') if tool else delta.get('text', '')
+                            if text:
+                                if call.ttfb is None:
+                                    call.ttfb = time.monotonic() - call.started
+                                parts.append(text)
+                                if chunks is not None:
+                                    chunks.append((time.monotonic() - call.started, text))
+                                yield text
+                        elif event.get('type') == 'message_start':
+                            usage = event.get('message', {}).get('usage') or {}
+                            call.input_tokens = usage.get('input_tokens')
+                            call.cache_read_tokens = usage.get('cache_read_input_tokens')
+                            call.cache_write_tokens = usage.get('cache_creation_input_tokens')
+                        elif event.get('type') == 'message_delta':
+                            call.stop_reason = (event.get('delta') or {}).get('stop_reason', call.stop_reason)
+                            usage = event.get('usage') or {}
+                            call.output_tokens = usage.get('output_tokens', call.output_tokens)
+                            if call.output_tokens is not None:
+                                # 최종 사용량으로 예약한 분당 토큰 정산
+                                lease.actual_tokens = (call.input_tokens or 0) + call.output_tokens
+                        elif event.get('type') == 'message_stop':
+                            finished = True
+                            break
+                        elif event.get('type') == 'error':
+                            print(f"Claude 스트리밍 오류: {event.get('error')}")
+                            return
+                        
+        except RateLimitTimeout as e:
+            print(f"⏳ {e}")
+            call.error = 'rate_limit_timeout'
+            return
+        except requests.exceptions.RequestException as e:
+            print(f"Claude API 요청 오류: {e}")
+            call.error = str(e)
+            return
+        finally:
+            # 중간에 스트림을 닫아도 기록
+            get_telemetry().record_call(call)
+        
+        text = ''.join(parts).strip()
+        if cassette:
+            cassette.record(cache_key, call, text, chunks)
+        if cache and finished and not call.truncated and has_category_items(text, category):
+            cache.set(cache_key, text, 'claude', self.model, category)
+    
+    def stream_category_items(self, prompt: str, category: str) -> Iterator[Dict]:
         """
+        카테고리 항목을 생성되는 즉시 하나씩 반환
         
+        Args:
+            prompt: 카테고리 프롬프트
+            category: 카테고리명
+            
+        Yields:
+            완성된 항목 (JSON 객체)
+        """
+        stream = self.generate_completion_stream(prompt, category=category, tool=self._output_tool(category))
+        for item in iter_json_array_objects(stream):
+            item = coerce_item(item, category)
+            if item is not None:
+                yield item
+    
+    def _build_base_context(self, destination: str, days: int, season: str, travel_style: str) -> str:
+        """모든 카테고리 프롬프트가 공유하는 여행 컨텍스트"""
         # Claude는 더 자연스러운 대화형 프롬프트를 선호함
-        base_context = f"""
-안녕하세요! 여행 전문가로서 다음 여행에 대한 맞춤형 추천을 부탁드립니다:
+        return f"""안녕하세요! 다음 여행에 대한 맞춤형 추천을 부탁드립니다:
 
 📍 목적지: {destination}
 📅 여행 기간: {days}일
 🌤️ 계절: {season}
 🎯 여행 스타일: {travel_style}
 
-각 카테고리별로 JSON 형태로 응답해주세요.
-"""
-        
-        # 체크리스트 생성 프롬프트
-        checklist_prompt = f"""{base_context}
-
-**체크리스트 요청:**
-여행 준비를 위한 단계별 체크리스트를 만들어주세요.
-
-다음 카테고리로 분류해주세요:
-- 출발 전 (3-4개): 여행 전 필수 준비사항
-- 1일차 (2-3개): 도착 후 첫날 할 일
-- 2일차 (여행이 3일 이상인 경우, 1-2개)
-- 3일차 (여행이 5일 이상인 경우, 1-2개)  
-- 귀국 후 (1-2개): 여행 후 정리사항
-
-다음 JSON 형식으로만 응답해주세요:
-[
-    {{"category": "출발 전", "title": "여권 유효기간 확인", "priority": "high", "description": "6개월 이상 남아있는지 확인"}},
-    {{"category": "1일차", "title": "현지 심카드 구매", "priority": "medium", "description": "공항이나 편의점에서 구매"}}
-]
-
-목적지의 특성과 계절을 고려한 실용적인 체크리스트를 만들어주세요.
-다른 설명 없이 JSON 배열만 응답해주세요.
 """
-
-        # 준비물품 생성 프롬프트
-        items_prompt = f"""{base_context}
-
-**준비물품 요청:**
-여행에 필요한 준비물품을 카테고리별로 추천해주세요.
-
-다음 카테고리로 분류해주세요:
-- 서류 (여권, 비자, 보험 등)
-- 의류 (현지 날씨와 문화 고려)
-- 용품 (현지에서 구하기 어려운 것들)
-- 약품 (현지 특성 고려)
-- 전자기기 (현지 전압, 인터넷 등 고려)
-
-다음 JSON 형식으로만 응답해주세요:
-[
-    {{"category": "의류", "name": "방수 재킷", "quantity": 1, "notes": "우기철 필수품"}},
-    {{"category": "전자기기", "name": "멀티 어댑터", "quantity": 1, "notes": "현지 콘센트 형태 확인"}}
-]
-
-현지 특성을 반영한 실용적인 물품들을 추천해주세요.
-다른 설명 없이 JSON 배열만 응답해주세요.
-"""
-
-        # 현지정보 생성 프롬프트
-        local_info_prompt = f"""{base_context}
-
-**현지정보 요청:**
-여행지에서 유용한 현지 정보를 제공해주세요.
-
-다음 카테고리로 분류해주세요:
-- 환율 (현재 환율 정보 및 팁)
-- 긴급연락처 (영사관, 응급실, 경찰 등)
-- 교통수단 (추천 앱, 교통카드, 택시 팁 등)
-- 맛집 (현지 특색 음식 2-3곳)
-- 기타 (팁 문화, 주의사항, 에티켓 등)
-
-다음 JSON 형식으로만 응답해주세요:
-[
-    {{"category": "환율", "title": "현지 화폐 정보", "content": "1달러 = 1300원 (변동)", "rating": null, "phone": null, "address": null}},
-    {{"category": "맛집", "title": "현지 특색 음식점", "content": "현지인 추천 맛집", "rating": 4.8, "phone": "+82-2-1234-5678", "address": "서울시 중구 명동"}}
-]
-
-최신이고 정확한 정보를 제공해주세요.
-다른 설명 없이 JSON 배열만 응답해주세요.
-"""
-
-        # 위시리스트 생성 프롬프트
-        wishlist_prompt = f"""{base_context}
-
-**위시리스트 요청:**
-여행자들이 꼭 가봐야 할 장소들을 추천해주세요.
-
-다음 카테고리로 분류해주세요:
-- 관광지 (대표 명소, 박물관 등)
-- 맛집 (현지 특색 음식점)
-- 체험 (현지만의 특별한 활동)
-- 쇼핑 (기념품, 특산품 구매처)
-- 기타 (숨은 명소, 포토스팟 등)
-
-여행 기간 {days}일에 맞게 우선순위를 설정해주세요.
-
-다음 JSON 형식으로만 응답해주세요:
-[
-    {{"place_name": "에펠탑", "category": "관광지", "description": "파리의 상징적 랜드마크", "priority": "high", "address": "파리 7구"}},
-    {{"place_name": "현지 전통시장", "category": "쇼핑", "description": "현지 문화 체험 가능", "priority": "medium", "address": "시장 주소"}}
-]
-
-현지인들도 추천하는 진정성 있는 장소들을 포함해주세요.
-다른 설명 없이 JSON 배열만 응답해주세요.
-"""
-
-        # 각 카테고리별 컨텐츠 생성
-        result = {}
+    
+    def build_category_prompts(self, destination: str, days: int, season: str, travel_style: str) -> Dict[str, str]:
+        """
+        카테고리별 프롬프트 생성
         
-        print(f"🤖 Claude AI로 {destination} 여행 컨텐츠 생성 중...")
+        정적 지침 + 여행 컨텍스트 + 짧은 카테고리 요청으로 나뉜 프롬프트로,
+        앞의 두 부분은 프롬프트 캐시로 재사용됩니다.
         
-        try:
-            # 체크리스트 생성
-            print("📋 체크리스트 생성 중...")
-            checklist_response = self.generate_completion(checklist_prompt)
-            result['checklist'] = self._parse_json_response(checklist_response, 'checklist')
-            
-            # 준비물품 생성
-            print("🎒 준비물품 생성 중...")
-            items_response = self.generate_completion(items_prompt)
-            result['items'] = self._parse_json_response(items_response, 'items')
-            
-            # 현지정보 생성
-            print("ℹ️ 현지정보 생성 중...")
-            local_info_response = self.generate_completion(local_info_prompt)
-            result['local_info'] = self._parse_json_response(local_info_response, 'local_info')
-            
-            # 위시리스트 생성
-            print("❤️ 위시리스트 생성 중...")
-            wishlist_response = self.generate_completion(wishlist_prompt)
-            result['wishlist'] = self._parse_json_response(wishlist_response, 'wishlist')
+        Args:
+            destination: 목적지
+            days: 여행 일수
+            season: 계절
+            travel_style: 여행 스타일
             
-            print(f"✅ Claude AI 컨텐츠 생성 완료!")
+        Returns:
+            카테고리명 -> 프롬프트
+        """
+        base_context = self._build_base_context(destination, days, season, travel_style)
+        return build_category_prompts(self.INSTRUCTIONS, base_context)
+    
+    def build_combined_prompt(self, destination: str, days: int, season: str, travel_style: str) -> str:
+        """네 카테고리를 하나의 JSON 객체로 요청하는 통합 프롬프트 생성"""
+        base_context = self._build_base_context(destination, days, season, travel_style)
+        return build_combined_prompt(self.INSTRUCTIONS, base_context)
+    
+    def build_gap_fill_prompt(self, destination: str, days: int, season: str, travel_style: str,
+                              category: str, exclusions: List[str]) -> str:
+        """기존 항목(exclusions)과 겹치지 않는 한 카테고리 추가 생성 프롬프트"""
+        base_context = self._build_base_context(destination, days, season, travel_style)
+        return build_gap_fill_prompt(self.INSTRUCTIONS, base_context, category, exclusions)
+    
+    def generate_travel_content(self, destination: str, days: int, season: str, travel_style: str,
+                                progress_callback: Optional[Callable[[str, List[Dict]], None]] = None) -> Dict:
+        """
+        여행 컨텐츠 생성
+        
+        Args:
+            destination: 목적지
+            days: 여행 일수
+            season: 계절
+            travel_style: 여행 스타일
+            progress_callback: 카테고리가 완성될 때마다 (카테고리명, 항목)으로 호출
             
-        except Exception as e:
-            print(f"❌ Claude 컨텐츠 생성 오류: {e}")
-            # 기본값 반환
-            result = {
-                'checklist': [],
-                'items': [],
-                'local_info': [],
-                'wishlist': []
-            }
+        Returns:
+            생성된 여행 컨텐츠
+        """
+        prompts = self.build_category_prompts(destination, days, season, travel_style)
+        
+        print(f"🤖 Claude AI로 {destination} 여행 컨텐츠 생성 중...")
+        started = time.monotonic()
+        
+        result = {}
+        if AIConfig.GENERATION_MODE == 'combined':
+            # 한 번의 요청으로 네 카테고리를 모두 생성
+            combined_prompt = self.build_combined_prompt(destination, days, season, travel_style)
+            combined_response = self.generate_completion(
+                combined_prompt, max_tokens=AIConfig.COMBINED_MAX_TOKENS, category='all',
+                tool=self._output_tool('all')
+            )
+            arrays = extract_json_category_arrays(combined_response, prompts)
+            result = {category: coerce_items(items, category) for category, items in arrays.items()}
+            if combined_response:
+                get_telemetry().record_parse('claude', self.model, 'all', bool(result))
+                print("✅ 통합 응답 파싱: " + ", ".join(f"{k} {len(v)}개" for k, v in result.items()))
+            for category, items in result.items():
+                if items:
+                    notify_progress(progress_callback, category, items)
+        
+        # 남은 카테고리를 동시에 생성 (카테고리별로 독립적으로 실패)
+        missing = {category: prompt for category, prompt in prompts.items() if not result.get(category)}
+        if AIConfig.PROMPT_CACHE_PRIME_FIRST and len(missing) > 1:
+            # 첫 카테고리로 프롬프트 캐시를 먼저 만든 뒤 나머지는 캐시를 읽으며 동시에 생성
+            category, prompt = next(iter(missing.items()))
+            result[category] = self._generate_category(prompt, category)
+            notify_progress(progress_callback, category, result[category])
+            del missing[category]
+        if missing:
+            result.update(run_category_tasks(
+                {category: partial(self._generate_category, prompt, category)
+                 for category, prompt in missing.items()},
+                max_workers=AIConfig.MAX_CONCURRENT_REQUESTS,
+                on_complete=progress_callback
+            ))
+        result = {category: result.get(category, []) for category in prompts}
+        
+        elapsed = time.monotonic() - started
+        print(f"✅ Claude AI 컨텐츠 생성 완료! ({AIConfig.GENERATION_MODE} 모드, {elapsed:.1f}초)")
         
         return result
     
-    def _parse_json_response(self, response: str, category: str) -> List[Dict]:
+    def _generate_category(self, prompt: str, category: str, use_cache: bool = True) -> List[Dict]:
         """
-        AI 응답을 JSON으로 파싱
+        단일 카테고리 컨텐츠 생성
         
         Args:
-            response: AI 응답 텍스트
-            category: 카테고리명 (로깅용)
+            prompt: 카테고리 프롬프트
+            category: 카테고리명
+            use_cache: False면 응답 캐시를 거치지 않음
             
         Returns:
-            파싱된 JSON 리스트
+            파싱된 항목 리스트
         """
-        try:
-            # JSON 부분만 추출 (```json 등 제거)
-            response = response.strip()
-            
-            # 마크다운 코드 블록 제거
-            if '```json' in response:
-                response = response.split('```json')[1].split('```')[0]
-            elif '```' in response:
-                parts = response.split('```')
-                if len(parts) >= 2:
-                    response = parts[1]
-                else:
-                    response = response.replace('```', '')
-            
-            # JSON 시작과 끝 찾기
-            start_idx = response.find('[')
-            end_idx = response.rfind(']')
-            
-            if start_idx != -1 and end_idx != -1:
-                response = response[start_idx:end_idx+1]
-            
-            # JSON 파싱
-            parsed = json.loads(response.strip())
-            
-            if isinstance(parsed, list):
-                print(f"✅ {category} 파싱 성공: {len(parsed)}개 항목")
-                return parsed
-            else:
-                print(f"⚠️ {category} 응답이 배열이 아닙니다.")
-                return []
-                
-        except json.JSONDecodeError as e:
-            print(f"❌ {category} JSON 파싱 오류: {e}")
-            print(f"응답 내용: {response[:200]}...")
-            return []
-        except Exception as e:
-            print(f"❌ {category} 처리 오류: {e}")
+        response = self.generate_completion(prompt, category=category, tool=self._output_tool(category),
+                                            use_cache=use_cache)
+        if not response:
             return []
+        
+        items = parse_category_items(response, category)
+        get_telemetry().record_parse('claude', self.model, category, bool(items))
+        if items:
+            print(f"✅ {category} 파싱 성공: {len(items)}개 항목")
+        else:
+            print(f"❌ {category} 응답에서 항목을 찾을 수 없습니다: {response[:200]}...")
+        return items
+    
+    def _output_tool(self, category: str) -> Optional[Dict]:
+        """tool 출력 모드일 때 카테고리 도구 정의 (text 모드면 None)"""
+        if AIConfig.CLAUDE_OUTPUT_MODE != 'tool':
+            return None
+        if category == 'all':
+            return build_combined_tool()
+        return build_category_tool(category)
+    
+    def _apply_tool(self, payload: Dict, tool: Optional[Dict]):
+        """
+        요청에 도구를 선언하고 해당 도구 호출을 강제
+        
+        카테고리 요청은 네 카테고리 도구를 항상 같은 순서로 모두 선언해
+        도구 정의가 프롬프트 캐시 접두어를 바꾸지 않게 합니다.
+        """
+        if tool:
+            category_tools = build_category_tools()
+            if any(category_tool['name'] == tool['name'] for category_tool in category_tools):
+                payload["tools"] = category_tools
+            else:
+                payload["tools"] = [tool]
+            payload["tool_choice"] = {"type": "tool", "name": tool['name']}
+    
+    def _apply_prompt_cache(self, payload: Dict, prompt: str):
+        """
+        분할 프롬프트의 정적 지침(system)과 여행 컨텍스트에 cache_control 지정
+        
+        캐시 순서는 tools -> system -> messages이므로 모든 여행에 공통인 지침은
+        system에, 같은 여행의 카테고리끼리 공통인 컨텍스트는 첫 사용자 블록에 둡니다.
+        """
+        if not (AIConfig.PROMPT_CACHE_ENABLED and isinstance(prompt, SegmentedPrompt)):
+            return
+        
+        payload["system"] = [
+            {"type": "text", "text": prompt.instructions, "cache_control": {"type": "ephemeral"}}
+        ]
+        payload["messages"] = [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt.context, "cache_control": {"type": "ephemeral"}},
+                    {"type": "text", "text": prompt.request}
+                ]
+            }
+        ]
+    
+    def _cache_provider(self, tool: Optional[Dict]) -> str:
+        """캐시 키용 공급자명 (텍스트 응답과 도구 응답을 구분)"""
+        return f"claude:{tool['name']}" if tool else 'claude'
     
     def test_connection(self) -> bool:
         """
@@ -324,7 +555,8 @@ def test_claude_client():
         print("$env:ANTHROPIC_API_KEY=\"your-claude-api-key\"")
         return False
     
-    client = ClaudeClient(api_key)
+    # ANTHROPIC_BASE_URL로 모의 서버(mock_llm_server.py)를 지정할 수 있음
+    client = ClaudeClient(api_key, base_url=AIConfig.ANTHROPIC_BASE_URL)
     
     # 연결 테스트
     if not client.test_connection():
@@ -27,6 +27,15 @@ class Config:
     MAX_CONTENT_LENGTH = int(os.environ.get('MAX_CONTENT_LENGTH', 16 * 1024 * 1024))  # 16MB
     ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
     
+    # AI 생성 작업 설정
+    GENERATION_WORKERS = int(os.environ.get('GENERATION_WORKERS', 2))  # 프로세스당 워커 스레드 수
+    GENERATION_JOB_POLL_INTERVAL = float(os.environ.get('GENERATION_JOB_POLL_INTERVAL', 2.0))  # 초
+    GENERATION_JOB_MAX_ATTEMPTS = int(os.environ.get('GENERATION_JOB_MAX_ATTEMPTS', 3))
+    GENERATION_JOB_STALE_SECONDS = int(os.environ.get('GENERATION_JOB_STALE_SECONDS', 600))  # 이 시간 넘게 실행 중이면 재시도
+    
+    # 시작할 때 대표 쿼리의 인덱스 사용 확인 (전체 스캔이면 시작 중단, db_migrations.py 참고)
+    INDEX_CHECK_ON_STARTUP = os.environ.get('INDEX_CHECK_ON_STARTUP', 'false').lower() == 'true'
+    
     # 세션 설정
     PERMANENT_SESSION_LIFETIME = timedelta(days=31)
     SESSION_COOKIE_SECURE = False  # HTTPS에서는 True로 설정
@@ -53,6 +62,7 @@ class DevelopmentConfig(Config):
     """개발 환경 설정"""
     DEBUG = True
     DEVELOPMENT = True
+    INDEX_CHECK_ON_STARTUP = True
     
     # 개발 환경에서는 더 관대한 설정
     SESSION_COOKIE_SECURE = False
@@ -62,6 +72,7 @@ class TestingConfig(Config):
     """테스트 환경 설정"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    INDEX_CHECK_ON_STARTUP = True
     WTF_CSRF_ENABLED = False
     
     # 테스트용 임시 업로드 폴더
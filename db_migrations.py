@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+데이터베이스 스키마 업그레이드와 인덱스 사용 확인
+
+db.create_all()은 없는 테이블만 만들고 기존 테이블에 새로 정의한 인덱스는
+추가하지 않습니다. upgrade_database()는 테이블을 만든 뒤 모델에 정의된
+인덱스 중 빠진 것을 CREATE INDEX IF NOT EXISTS로 추가하므로 앱/워커를
+시작할 때마다 호출해도 안전합니다.
+
+check_index_usage()는 앱이 실행하는 대표 쿼리를 SQLite의 EXPLAIN QUERY PLAN으로
+확인해 인덱스 없이 테이블 전체를 읽는(SCAN) 쿼리를 찾습니다. INDEX_CHECK_ON_STARTUP
+설정(개발/테스트 기본값)이 켜져 있으면 upgrade_database()가 끝난 뒤 자동으로 확인하고,
+전체 스캔으로 바뀐 쿼리가 있으면 RuntimeError로 시작을 중단합니다.
+
+사용법:
+    python db_migrations.py           # 빠진 테이블/인덱스 추가
+    python db_migrations.py --check   # 인덱스 사용 확인 (전체 스캔이 있으면 종료 코드 1)
+"""
+
+import argparse
+import sys
+from typing import List, Tuple
+
+from sqlalchemy import inspect, select
+from sqlalchemy.schema import CreateIndex
+
+
+def upgrade_database() -> List[str]:
+    """
+    테이블 생성 + 기존 데이터베이스에 빠진 인덱스 추가 (앱 컨텍스트 안에서 호출)
+
+    Returns:
+        새로 만든 인덱스 이름 목록
+
+    Raises:
+        RuntimeError: INDEX_CHECK_ON_STARTUP이 켜져 있고 대표 쿼리가 전체 스캔할 때
+    """
+    from app import app, db
+
+    db.create_all()
+
+    created = []
+    with db.engine.begin() as conn:
+        inspector = inspect(conn)
+        for table in db.metadata.sorted_tables:
+            existing = {index['name'] for index in inspector.get_indexes(table.name)}
+            for index in sorted(table.indexes, key=lambda index: index.name):
+                if index.name not in existing:
+                    # 여러 프로세스가 동시에 시작해도 충돌하지 않도록 IF NOT EXISTS
+                    conn.execute(CreateIndex(index, if_not_exists=True))
+                    created.append(index.name)
+
+        if created and conn.dialect.name == 'sqlite':
+            # 쿼리 플래너가 새 인덱스의 선택도를 알 수 있도록 통계 갱신
+            conn.exec_driver_sql('ANALYZE')
+
+    if created:
+        print(f"🗂️ 인덱스 {len(created)}개 추가: {', '.join(created)}")
+
+    if app.config.get('INDEX_CHECK_ON_STARTUP') and db.engine.dialect.name == 'sqlite':
+        verify_index_usage()
+    return created
+
+
+def representative_queries(trip_id: int = 1) -> List[Tuple[str, object]]:
+    """인덱스를 사용해야 하는 대표 쿼리 (이름, SELECT 문)"""
+    from app import (Checklist, Expense, GenerationJob, Item, LocalInfo, Memory, Trip, Wishlist,
+                     trip_detail_query)
+
+    queries = [
+        ('여행 목록 (최신순)', select(Trip).order_by(Trip.created_at.desc())),
+        ('여행 상세 (진행률 집계 + 하위 항목)', trip_detail_query(trip_id)),
+    ]
+    # 하위 항목 trip_id별 조회 (삭제, 재생성 제외 목록 등)
+    for model in (Checklist, Item, LocalInfo, Expense, Wishlist, Memory):
+        queries.append((f'{model.__tablename__} 여행별 조회', select(model).where(model.trip_id.in_([trip_id]))))
+    queries += [
+        ('준비물 카테고리별 조회', select(Item).where(Item.trip_id == trip_id, Item.category == '의류')),
+        ('체크리스트 미완료 항목', select(Checklist).where(Checklist.trip_id == trip_id,
+                                                      Checklist.is_completed.is_(False))),
+        ('위시리스트 이름 (재생성 제외 목록)', select(Wishlist.place_name).where(Wishlist.trip_id == trip_id)),
+        ('대기 중인 생성 작업', select(GenerationJob.id).where(GenerationJob.status == 'queued')
+         .order_by(GenerationJob.id).limit(1)),
+        ('여행의 최근 생성 작업', select(GenerationJob).where(GenerationJob.trip_id == trip_id)
+         .order_by(GenerationJob.id.desc()).limit(1)),
+    ]
+    return queries
+
+
+def _is_full_scan(detail: str) -> bool:
+    """EXPLAIN QUERY PLAN 단계가 인덱스 없이 테이블 전체를 읽는지 여부"""
+    return detail.startswith('SCAN ') and 'USING' not in detail
+
+
+def check_index_usage(trip_id: int = 1) -> List[Tuple[str, List[str], bool]]:
+    """
+    대표 쿼리의 실행 계획 확인 (SQLite 전용, 앱 컨텍스트 안에서 호출)
+
+    Returns:
+        (쿼리 이름, 실행 계획 단계 목록, 인덱스 사용 여부) 목록
+    """
+    from app import db
+
+    results = []
+    with db.engine.connect() as conn:
+        if conn.dialect.name != 'sqlite':
+            raise RuntimeError(f"EXPLAIN QUERY PLAN 확인은 SQLite만 지원합니다 ({conn.dialect.name})")
+
+        for name, statement in representative_queries(trip_id):
+            sql = str(statement.compile(dialect=conn.dialect, compile_kwargs={'literal_binds': True}))
+            plan = [row[-1] for row in conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + sql)]
+            results.append((name, plan, not any(_is_full_scan(detail) for detail in plan)))
+    return results
+
+
+def full_scan_queries(results: List[Tuple[str, List[str], bool]]) -> List[str]:
+    """check_index_usage 결과 중 전체 스캔하는 쿼리 이름"""
+    return [name for name, _, uses_index in results if not uses_index]
+
+
+def verify_index_usage(trip_id: int = 1):
+    """
+    대표 쿼리가 모두 인덱스를 사용하는지 확인 (앱 컨텍스트 안에서 호출)
+
+    Raises:
+        RuntimeError: 전체 스캔하는 쿼리가 있을 때 (쿼리 이름과 실행 계획 포함)
+    """
+    results = check_index_usage(trip_id)
+    scans = full_scan_queries(results)
+    if scans:
+        plans = '; '.join(f"{name}: {' / '.join(plan)}" for name, plan, uses_index in results if not uses_index)
+        raise RuntimeError(f"인덱스를 사용하지 않는 쿼리 {len(scans)}개 ({plans})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='데이터베이스 업그레이드 및 인덱스 사용 확인')
+    parser.add_argument('--check', action='store_true', help='EXPLAIN QUERY PLAN으로 대표 쿼리의 인덱스 사용 확인')
+    args = parser.parse_args()
+
+    from app import app
+
+    with app.app_context():
+        print(f"💾 데이터베이스: {app.config['SQLALCHEMY_DATABASE_URI']}")
+        if not args.check:
+            created = upgrade_database()
+            print(f"✅ 데이터베이스 업그레이드 완료 (새 인덱스 {len(created)}개)")
+            return
+
+        results = check_index_usage()
+        for name, plan, uses_index in results:
+            print(f"{'✅' if uses_index else '❌'} {name}")
+            for detail in plan:
+                print(f"     {detail}")
+
+        scans = full_scan_queries(results)
+        if scans:
+            print(f"\n❌ 전체 테이블 스캔 {len(scans)}개: {', '.join(scans)} (python db_migrations.py로 인덱스를 추가하세요)")
+            sys.exit(1)
+        print(f"\n✅ 대표 쿼리 {len(results)}개 모두 인덱스 사용")
+
+
+if __name__ == '__main__':
+    main()
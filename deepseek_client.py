@@ -6,41 +6,106 @@ DeepSeek의 강력한 AI 모델을 활용하여
 """
 
 import json
+import time
 import requests
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 from datetime import datetime
+from functools import partial
+
+from ai_cache import CompletionCache, get_completion_cache
+from ai_cassette import get_cassette
+from ai_config import AIConfig
+from ai_json import (coerce_item, coerce_items, extract_json_category_arrays, has_category_items,
+                     iter_json_array_objects, mark_degraded, parse_category_items)
+from ai_clients import get_http_session
+from ai_deadline import bounded_timeout
+from ai_parallel import notify_progress, run_category_tasks
+from ai_prompts import build_category_prompts, build_combined_prompt, build_gap_fill_prompt, build_instructions
+from ai_ratelimit import RateLimitTimeout, estimate_tokens, rate_limited
+from ai_resilience import send_with_retries
+from ai_telemetry import CallRecord, get_telemetry
 
 class DeepSeekClient:
     """DeepSeek AI API 클라이언트"""
     
-    def __init__(self, api_key: str, base_url: str = "https://api.deepseek.com"):
+    # 모든 요청에 공통인 정적 지침 (자동 접두어 캐시 대상)
+    INSTRUCTIONS = build_instructions(
+        "다음 여행 정보를 바탕으로 실용적인 여행 준비 정보를 JSON 형태로 생성해주세요."
+    )
+    
+    def __init__(self, api_key: str, base_url: str = "https://api.deepseek.com",
+                 session: Optional[requests.Session] = None):
         """
         DeepSeek 클라이언트 초기화
         
         Args:
             api_key: DeepSeek API 키
             base_url: API 베이스 URL
+            session: 사용할 HTTP 세션 (기본값: 베이스 URL별 공유 연결 풀)
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
+        self.session = session or get_http_session(self.base_url)
+        self.timeout = AIConfig.REQUEST_TIMEOUT
         self.headers = {
             'Authorization': f'Bearer {api_key}',
             'Content-Type': 'application/json'
         }
         self.model = "deepseek-chat"  # DeepSeek의 기본 모델
     
-    def generate_completion(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.7) -> str:
+    def generate_completion(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.7,
+                            category: Optional[str] = None, use_cache: bool = True) -> str:
         """
         DeepSeek API를 사용하여 텍스트 생성
         
+        동일한 프롬프트/옵션의 응답은 로컬 캐시에서 반환합니다.
+        정상 종료되고(길이 제한에 잘리지 않음) 항목을 하나 이상 파싱할 수 있는 응답만 캐시합니다.
+        카세트 녹화/재생 중에는 응답 캐시를 거치지 않습니다.
+        
         Args:
             prompt: 입력 프롬프트
             max_tokens: 최대 토큰 수
             temperature: 생성 창의성 (0.0-1.0)
+            category: 컨텐츠 카테고리 (캐시 TTL 결정용)
+            use_cache: False면 응답 캐시를 읽지도 저장하지도 않음 (새로 생성해야 하는 요청)
             
         Returns:
             생성된 텍스트
         """
+        call = CallRecord('deepseek', self.model, category, max_tokens)
+        cache_key = CompletionCache.make_key('deepseek', self.model, temperature, max_tokens, prompt)
+        
+        cassette = get_cassette()
+        if cassette and cassette.replaying:
+            text = cassette.replay(cache_key, call)
+            get_telemetry().record_call(call)
+            if call.truncated:
+                mark_degraded(category, 'max_tokens 잘림')
+            return text
+        
+        cache = None if cassette or not use_cache else get_completion_cache()
+        if cache:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                call.cache_hit = True
+                get_telemetry().record_call(call)
+                return cached
+        
+        text = self._request_completion(prompt, max_tokens, temperature, call)
+        get_telemetry().record_call(call)
+        if call.truncated:
+            mark_degraded(category, 'max_tokens 잘림')
+        if cassette:
+            cassette.record(cache_key, call, text)
+        
+        if cache and not call.truncated and has_category_items(text, category):
+            cache.set(cache_key, text, 'deepseek', self.model, category)
+        
+        return text
+    
+    def _request_completion(self, prompt: str, max_tokens: int, temperature: float,
+                            call: Optional[CallRecord] = None) -> str:
+        """DeepSeek API 호출 (캐시 미적용, call이 있으면 상태/TTFB/토큰 사용량 기록)"""
         try:
             payload = {
                 "model": self.model,
@@ -55,220 +120,327 @@ class DeepSeekClient:
                 "stream": False
             }
             
-            response = requests.post(
-                f"{self.base_url}/v1/chat/completions",
-                headers=self.headers,
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result['choices'][0]['message']['content'].strip()
-            else:
-                print(f"DeepSeek API 오류: {response.status_code} - {response.text}")
-                return ""
+            # 공유 호출 한도 획득 후 재시도/서킷 브레이커 적용 (열려 있으면 바로 None)
+            with rate_limited('deepseek', estimate_tokens(prompt, max_tokens)) as lease:
+                response = send_with_retries('deepseek', lambda: self.session.post(
+                    f"{self.base_url}/v1/chat/completions",
+                    headers=self.headers,
+                    json=payload,
+                    timeout=bounded_timeout(self.timeout)
+                ))
+                if response is None:
+                    return ""
+                
+                if call:
+                    call.status = response.status_code
+                    # 요청 전송부터 응답 헤더 수신까지의 시간
+                    call.ttfb = response.elapsed.total_seconds()
                 
+                if response.status_code == 200:
+                    result = response.json()
+                    usage = result.get('usage') or {}
+                    if 'total_tokens' in usage:
+                        lease.actual_tokens = usage['total_tokens']
+                    if call:
+                        call.input_tokens = usage.get('prompt_tokens')
+                        call.output_tokens = usage.get('completion_tokens')
+                        call.cache_read_tokens = usage.get('prompt_cache_hit_tokens')
+                        call.cache_write_tokens = usage.get('prompt_cache_miss_tokens')
+                        call.stop_reason = result['choices'][0].get('finish_reason')
+                    return result['choices'][0]['message']['content'].strip()
+                else:
+                    print(f"DeepSeek API 오류: {response.status_code} - {response.text}")
+                    return ""
+                
+        except RateLimitTimeout as e:
+            print(f"⏳ {e}")
+            if call:
+                call.error = 'rate_limit_timeout'
+            return ""
         except requests.exceptions.RequestException as e:
             print(f"DeepSeek API 요청 오류: {e}")
+            if call:
+                call.error = str(e)
             return ""
         except Exception as e:
             print(f"DeepSeek 처리 오류: {e}")
+            if call:
+                call.error = str(e)
             return ""
     
-    def generate_travel_content(self, destination: str, days: int, season: str, travel_style: str) -> Dict:
+    def generate_completion_stream(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.7,
+                                   category: Optional[str] = None) -> Iterator[str]:
         """
-        여행 컨텐츠 생성
+        DeepSeek API 스트리밍 텍스트 생성
+        
+        응답 텍스트를 도착하는 대로 조각 단위로 반환합니다.
+        캐시된 응답이 있으면 한 번에 반환합니다. [DONE]까지 받은 정상 종료
+        응답만 캐시합니다 (generate_completion과 같은 기준).
         
         Args:
-            destination: 목적지
-            days: 여행 일수
-            season: 계절
-            travel_style: 여행 스타일
+            prompt: 입력 프롬프트
+            max_tokens: 최대 토큰 수
+            temperature: 생성 창의성 (0.0-1.0)
+            category: 컨텐츠 카테고리 (캐시 TTL 결정용)
             
-        Returns:
-            생성된 여행 컨텐츠
+        Yields:
+            생성된 텍스트 조각
         """
+        cache_key = CompletionCache.make_key('deepseek', self.model, temperature, max_tokens, prompt)
         
-        # 체크리스트 생성 프롬프트
-        checklist_prompt = f"""
-다음 여행 정보를 바탕으로 실용적인 체크리스트를 JSON 형태로 생성해주세요:
-
-목적지: {destination}
-여행 기간: {days}일
-계절: {season}
-여행 스타일: {travel_style}
-
-다음 카테고리별로 체크리스트를 만들어주세요:
-1. 출발 전 (3-4개)
-2. 1일차 (2-3개)
-3. 2일차 (여행이 3일 이상인 경우, 1-2개)
-4. 3일차 (여행이 5일 이상인 경우, 1-2개)
-5. 귀국 후 (1-2개)
-
-각 항목은 다음 JSON 형식으로 반환해주세요:
-[
-    {{"category": "출발 전", "title": "여권 유효기간 확인", "priority": "high", "description": "6개월 이상 남아있는지 확인"}},
-    {{"category": "1일차", "title": "현지 심카드 구매", "priority": "medium", "description": "공항이나 편의점에서 구매"}}
-]
-
-목적지의 특성과 계절을 고려한 실용적인 체크리스트를 만들어주세요.
-JSON 배열만 반환하고 다른 텍스트는 포함하지 마세요.
-"""
-
-        # 준비물품 생성 프롬프트
-        items_prompt = f"""
-다음 여행 정보를 바탕으로 필수 준비물품을 JSON 형태로 생성해주세요:
-
-목적지: {destination}
-여행 기간: {days}일
-계절: {season}
-여행 스타일: {travel_style}
-
-다음 카테고리별로 준비물을 추천해주세요:
-1. 서류 (여권, 비자 등)
-2. 의류 (현지 날씨와 문화 고려)
-3. 용품 (현지에서 구하기 어려운 것들)
-4. 약품 (현지 특성 고려)
-5. 전자기기 (현지 전압, 인터넷 등 고려)
-
-각 항목은 다음 JSON 형식으로 반환해주세요:
-[
-    {{"category": "의류", "name": "방수 재킷", "quantity": 1, "notes": "우기철 필수품"}},
-    {{"category": "전자기기", "name": "멀티 어댑터", "quantity": 1, "notes": "현지 콘센트 형태 확인"}}
-]
-
-현지 특성을 반영한 실용적인 물품들을 추천해주세요.
-JSON 배열만 반환하고 다른 텍스트는 포함하지 마세요.
-"""
-
-        # 현지정보 생성 프롬프트
-        local_info_prompt = f"""
-다음 목적지에 대한 실용적인 현지 정보를 JSON 형태로 제공해주세요:
-
-목적지: {destination}
-여행 기간: {days}일
-계절: {season}
-
-다음 카테고리별로 정보를 제공해주세요:
-1. 환율 (현재 환율 정보)
-2. 긴급연락처 (영사관, 응급실 등)
-3. 교통수단 (추천 앱, 교통카드 등)
-4. 맛집 (현지 특색 음식 2-3곳)
-5. 기타 (팁 문화, 주의사항 등)
-
-각 정보는 다음 JSON 형식으로 반환해주세요:
-[
-    {{"category": "환율", "title": "현지 화폐", "content": "1달러 = 1300원 (변동)", "rating": null, "phone": null, "address": null}},
-    {{"category": "맛집", "title": "현지 특색 음식점", "content": "현지인 추천 맛집", "rating": 4.8, "phone": "+82-2-1234-5678", "address": "서울시 중구 명동"}}
-]
-
-최신이고 정확한 정보를 제공해주세요.
-JSON 배열만 반환하고 다른 텍스트는 포함하지 마세요.
-"""
-
-        # 위시리스트 생성 프롬프트
-        wishlist_prompt = f"""
-다음 목적지의 여행자들이 꼭 가봐야 할 장소들을 JSON 형태로 추천해주세요:
-
+        cassette = get_cassette()
+        if cassette and cassette.replaying:
+            call = CallRecord('deepseek', self.model, category, max_tokens)
+            try:
+                yield from cassette.replay_stream(cache_key, call)
+            finally:
+                get_telemetry().record_call(call)
+            return
+        
+        cache = None if cassette else get_completion_cache()
+        if cache:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                call = CallRecord('deepseek', self.model, category, max_tokens)
+                call.cache_hit = True
+                get_telemetry().record_call(call)
+                yield cached
+                return
+        
+        payload = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user", 
+                    "content": prompt
+                }
+            ],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+            # 마지막 조각에 토큰 사용량 포함
+            "stream_options": {"include_usage": True}
+        }
+        
+        call = CallRecord('deepseek', self.model, category, max_tokens)
+        parts = []
+        finished = False
+        # 녹화 중이면 조각별 도착 시각도 기록
+        chunks = [] if cassette else None
+        try:
+            # 스트리밍이 끝날 때까지 동시 요청 슬롯 유지
+            with rate_limited('deepseek', estimate_tokens(prompt, max_tokens)) as lease:
+                response = send_with_retries('deepseek', lambda: self.session.post(
+                    f"{self.base_url}/v1/chat/completions",
+                    headers=self.headers,
+                    json=payload,
+                    timeout=bounded_timeout(self.timeout),
+                    stream=True
+                ))
+                if response is None:
+                    return
+            
+                call.status = response.status_code
+                with response:
+                    if response.status_code != 200:
+                        print(f"DeepSeek API 오류: {response.status_code} - {response.text}")
+                        return
+                
+                    # Server-Sent Events: "data: {...}" 줄 단위로 수신, "data: [DONE]"으로 종료
+                    for raw_line in response.iter_lines():
+                        line = raw_line.decode('utf-8')
+                        if not line.startswith('data:'):
+                            continue
+                    
+                        data = line[5:].strip()
+                        if data == '[DONE]':
+                            finished = True
+                            break
+                    
+                        try:
+                            chunk = json.loads(data)
+                        except ValueError:
+                            # 손상/잘린 이벤트 한 줄 때문에 스트림 전체를 끊지 않음
+                            print(f"⚠️ DeepSeek 스트리밍 이벤트 파싱 실패, 건너뜀: {line[:100]}")
+                            continue
+                        if not isinstance(chunk, dict):
+                            continue
+                        
+                        usage = chunk.get('usage') or {}
+                        if 'total_tokens' in usage:
+                            # 최종 사용량으로 예약한 분당 토큰 정산
+                            lease.actual_tokens = usage['total_tokens']
+                            call.input_tokens = usage.get('prompt_tokens')
+                            call.output_tokens = usage.get('completion_tokens')
+                            call.cache_read_tokens = usage.get('prompt_cache_hit_tokens')
+                            call.cache_write_tokens = usage.get('prompt_cache_miss_tokens')
+                        
+                        choices = chunk.get('choices') or [{}]
+                        call.stop_reason = choices[0].get('finish_reason') or call.stop_reason
+                        text = (choices[0].get('delta') or {}).get('content') or ''
+                        if text:
+                            if call.ttfb is None:
+                                call.ttfb = time.monotonic() - call.started
+                            parts.append(text)
+                            if chunks is not None:
+                                chunks.append((time.monotonic() - call.started, text))
+                            yield text
+                        
+        except RateLimitTimeout as e:
+            print(f"⏳ {e}")
+            call.error = 'rate_limit_timeout'
+            return
+        except requests.exceptions.RequestException as e:
+            print(f"DeepSeek API 요청 오류: {e}")
+            call.error = str(e)
+            return
+        finally:
+            # 중간에 스트림을 닫아도 기록
+            get_telemetry().record_call(call)
+        
+        text = ''.join(parts).strip()
+        if cassette:
+            cassette.record(cache_key, call, text, chunks)
+        if cache and finished and not call.truncated and has_category_items(text, category):
+            cache.set(cache_key, text, 'deepseek', self.model, category)
+    
+    def stream_category_items(self, prompt: str, category: str) -> Iterator[Dict]:
+        """
+        카테고리 항목을 생성되는 즉시 하나씩 반환
+        
+        Args:
+            prompt: 카테고리 프롬프트
+            category: 카테고리명
+            
+        Yields:
+            완성된 항목 (JSON 객체)
+        """
+        for item in iter_json_array_objects(self.generate_completion_stream(prompt, category=category)):
+            item = coerce_item(item, category)
+            if item is not None:
+                yield item
+    
+    def _build_base_context(self, destination: str, days: int, season: str, travel_style: str) -> str:
+        """모든 카테고리 프롬프트가 공유하는 여행 정보"""
+        return f"""여행 정보:
 목적지: {destination}
 여행 기간: {days}일
 계절: {season}
 여행 스타일: {travel_style}
 
-다음 카테고리별로 추천해주세요:
-1. 관광지 (대표 명소)
-2. 맛집 (현지 특색 음식점)
-3. 체험 (현지만의 특별한 활동)
-4. 쇼핑 (기념품, 특산품)
-5. 기타 (숨은 명소)
-
-여행 기간 {days}일에 맞게 우선순위를 설정해주세요.
-
-각 장소는 다음 JSON 형식으로 반환해주세요:
-[
-    {{"place_name": "에펠탑", "category": "관광지", "description": "파리의 상징적 랜드마크", "priority": "high", "address": "파리 7구"}},
-    {{"place_name": "현지 전통시장", "category": "쇼핑", "description": "현지 문화 체험 가능", "priority": "medium", "address": "시장 주소"}}
-]
-
-현지인들도 추천하는 진정성 있는 장소들을 포함해주세요.
-JSON 배열만 반환하고 다른 텍스트는 포함하지 마세요.
 """
-
-        # 각 카테고리별 컨텐츠 생성
-        result = {}
+    
+    def build_category_prompts(self, destination: str, days: int, season: str, travel_style: str) -> Dict[str, str]:
+        """
+        카테고리별 프롬프트 생성
         
-        print(f"🤖 DeepSeek AI로 {destination} 여행 컨텐츠 생성 중...")
+        정적 지침 + 여행 정보 + 짧은 카테고리 요청 순서로 구성해
+        DeepSeek의 자동 접두어 캐시가 앞부분을 재사용하게 합니다.
         
-        try:
-            # 체크리스트 생성
-            checklist_response = self.generate_completion(checklist_prompt)
-            result['checklist'] = self._parse_json_response(checklist_response, 'checklist')
-            
-            # 준비물품 생성
-            items_response = self.generate_completion(items_prompt)
-            result['items'] = self._parse_json_response(items_response, 'items')
-            
-            # 현지정보 생성
-            local_info_response = self.generate_completion(local_info_prompt)
-            result['local_info'] = self._parse_json_response(local_info_response, 'local_info')
-            
-            # 위시리스트 생성
-            wishlist_response = self.generate_completion(wishlist_prompt)
-            result['wishlist'] = self._parse_json_response(wishlist_response, 'wishlist')
+        Args:
+            destination: 목적지
+            days: 여행 일수
+            season: 계절
+            travel_style: 여행 스타일
             
-            print(f"✅ DeepSeek AI 컨텐츠 생성 완료!")
+        Returns:
+            카테고리명 -> 프롬프트
+        """
+        base_context = self._build_base_context(destination, days, season, travel_style)
+        return build_category_prompts(self.INSTRUCTIONS, base_context)
+    
+    def build_combined_prompt(self, destination: str, days: int, season: str, travel_style: str) -> str:
+        """네 카테고리를 하나의 JSON 객체로 요청하는 통합 프롬프트 생성"""
+        base_context = self._build_base_context(destination, days, season, travel_style)
+        return build_combined_prompt(self.INSTRUCTIONS, base_context)
+    
+    def build_gap_fill_prompt(self, destination: str, days: int, season: str, travel_style: str,
+                              category: str, exclusions: List[str]) -> str:
+        """기존 항목(exclusions)과 겹치지 않는 한 카테고리 추가 생성 프롬프트"""
+        base_context = self._build_base_context(destination, days, season, travel_style)
+        return build_gap_fill_prompt(self.INSTRUCTIONS, base_context, category, exclusions)
+    
+    def generate_travel_content(self, destination: str, days: int, season: str, travel_style: str,
+                                progress_callback: Optional[Callable[[str, List[Dict]], None]] = None) -> Dict:
+        """
+        여행 컨텐츠 생성
+        
+        Args:
+            destination: 목적지
+            days: 여행 일수
+            season: 계절
+            travel_style: 여행 스타일
+            progress_callback: 카테고리가 완성될 때마다 (카테고리명, 항목)으로 호출
             
-        except Exception as e:
-            print(f"❌ DeepSeek 컨텐츠 생성 오류: {e}")
-            # 기본값 반환
-            result = {
-                'checklist': [],
-                'items': [],
-                'local_info': [],
-                'wishlist': []
-            }
+        Returns:
+            생성된 여행 컨텐츠
+        """
+        prompts = self.build_category_prompts(destination, days, season, travel_style)
+        
+        print(f"🤖 DeepSeek AI로 {destination} 여행 컨텐츠 생성 중...")
+        started = time.monotonic()
+        
+        result = {}
+        if AIConfig.GENERATION_MODE == 'combined':
+            # 한 번의 요청으로 네 카테고리를 모두 생성
+            combined_prompt = self.build_combined_prompt(destination, days, season, travel_style)
+            combined_response = self.generate_completion(
+                combined_prompt, max_tokens=AIConfig.COMBINED_MAX_TOKENS, category='all'
+            )
+            arrays = extract_json_category_arrays(combined_response, prompts)
+            result = {category: coerce_items(items, category) for category, items in arrays.items()}
+            if combined_response:
+                get_telemetry().record_parse('deepseek', self.model, 'all', bool(result))
+                print("✅ 통합 응답 파싱: " + ", ".join(f"{k} {len(v)}개" for k, v in result.items()))
+            for category, items in result.items():
+                if items:
+                    notify_progress(progress_callback, category, items)
+        
+        # 남은 카테고리를 동시에 생성 (카테고리별로 독립적으로 실패)
+        missing = {category: prompt for category, prompt in prompts.items() if not result.get(category)}
+        if AIConfig.PROMPT_CACHE_PRIME_FIRST and len(missing) > 1:
+            # 첫 카테고리로 프롬프트 캐시를 먼저 만든 뒤 나머지는 캐시를 읽으며 동시에 생성
+            category, prompt = next(iter(missing.items()))
+            result[category] = self._generate_category(prompt, category)
+            notify_progress(progress_callback, category, result[category])
+            del missing[category]
+        if missing:
+            result.update(run_category_tasks(
+                {category: partial(self._generate_category, prompt, category)
+                 for category, prompt in missing.items()},
+                max_workers=AIConfig.MAX_CONCURRENT_REQUESTS,
+                on_complete=progress_callback
+            ))
+        result = {category: result.get(category, []) for category in prompts}
+        
+        elapsed = time.monotonic() - started
+        print(f"✅ DeepSeek AI 컨텐츠 생성 완료! ({AIConfig.GENERATION_MODE} 모드, {elapsed:.1f}초)")
         
         return result
     
-    def _parse_json_response(self, response: str, category: str) -> List[Dict]:
+    def _generate_category(self, prompt: str, category: str, use_cache: bool = True) -> List[Dict]:
         """
-        AI 응답을 JSON으로 파싱
+        단일 카테고리 컨텐츠 생성
         
         Args:
-            response: AI 응답 텍스트
-            category: 카테고리명 (로깅용)
+            prompt: 카테고리 프롬프트
+            category: 카테고리명
+            use_cache: False면 응답 캐시를 거치지 않음
             
         Returns:
-            파싱된 JSON 리스트
+            파싱된 항목 리스트
         """
-        try:
-            # JSON 부분만 추출 (```json 등 제거)
-            response = response.strip()
-            
-            # 마크다운 코드 블록 제거
-            if '```json' in response:
-                response = response.split('```json')[1].split('```')[0]
-            elif '```' in response:
-                response = response.split('```')[1].split('```')[0]
-            
-            # JSON 파싱
-            parsed = json.loads(response.strip())
-            
-            if isinstance(parsed, list):
-                print(f"✅ {category} 파싱 성공: {len(parsed)}개 항목")
-                return parsed
-            else:
-                print(f"⚠️ {category} 응답이 배열이 아닙니다.")
-                return []
-                
-        except json.JSONDecodeError as e:
-            print(f"❌ {category} JSON 파싱 오류: {e}")
-            print(f"응답 내용: {response[:200]}...")
-            return []
-        except Exception as e:
-            print(f"❌ {category} 처리 오류: {e}")
+        response = self.generate_completion(prompt, category=category, use_cache=use_cache)
+        if not response:
             return []
+        
+        items = parse_category_items(response, category)
+        get_telemetry().record_parse('deepseek', self.model, category, bool(items))
+        if items:
+            print(f"✅ {category} 파싱 성공: {len(items)}개 항목")
+        else:
+            print(f"❌ {category} 응답에서 항목을 찾을 수 없습니다: {response[:200]}...")
+        return items
     
     def test_connection(self) -> bool:
         """
@@ -304,7 +476,8 @@ def test_deepseek_client():
         print("$env:DEEPSEEK_API_KEY=\"your-deepseek-api-key\"")
         return False
     
-    client = DeepSeekClient(api_key)
+    # DEEPSEEK_BASE_URL로 모의 서버(mock_llm_server.py)를 지정할 수 있음
+    client = DeepSeekClient(api_key, base_url=AIConfig.DEEPSEEK_BASE_URL)
     
     # 연결 테스트
     if not client.test_connection():
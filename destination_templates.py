@@ -2,298 +2,300 @@
 목적지별 여행 템플릿 시스템
 
 목적지와 여행일수에 따라 자동으로 체크리스트, 준비물품, 현지정보, 위시리스트를 생성합니다.
+
+템플릿 내용은 data/templates/*.json에 있습니다. 파일 이름(확장자 제외)이 지명 사전
+장소 ID이고, _base.json은 모든 템플릿 앞에 붙는 기본 항목입니다. 처음 사용할 때
+모든 파일을 한 번 읽어 변경할 수 없는 튜플로 바꿔 두고 프로세스 전체가 공유합니다.
+
+파일 형식:
+    {
+      "name": "도쿄(일본) 여행 템플릿",
+      "places": ["japan"],
+      "checklists": [{"category": "2일차", "title": "...", "priority": "medium", "min_days": 3}],
+      "items": [...], "local_infos": [...], "wishlists": [...], "expenses": [...]
+    }
+
+- places: 같은 템플릿을 사용할 다른 장소 ID (선택, 예: 국가 ID)
+- min_days: 여행일수가 이 값 이상일 때만 포함 (선택)
+- 문자열 값의 {days}는 여행일수로 바뀜 (예: "{days}일 여행용")
+- {"per_day": 1, "max": 7} 형식의 값은 min(여행일수 × per_day, max)
 """
 
-from datetime import date, timedelta
+import json
+import os
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from gazetteer import match_destination
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'templates')
+BASE_TEMPLATE_ID = '_base'
+
+# 템플릿 데이터 구역 (get_template_data 키 순서)
+TEMPLATE_SECTIONS = ('checklists', 'items', 'local_infos', 'wishlists', 'expenses')
+
+# 메모이즈할 (템플릿, 일수) 묶음 최대 수
+TEMPLATE_BUNDLE_CACHE_SIZE = 1024
+
+
+class PerDay(NamedTuple):
+    """여행일수에 비례하는 값 (min(일수 × per_day, max))"""
+    per_day: int
+    max: Optional[int]
+
+
+class TemplateEntry(NamedTuple):
+    """템플릿 항목 1개 (변경 불가)"""
+    min_days: int
+    fields: Tuple[Tuple[str, Any], ...]
+    dynamic: bool  # {days} 또는 PerDay 값 포함 여부
+
+    def render(self, days: int) -> Dict[str, Any]:
+        """여행일수를 반영한 새 dict (호출자가 수정해도 공유 데이터는 그대로)"""
+        if not self.dynamic:
+            return dict(self.fields)
+        return {key: _render_value(value, days) for key, value in self.fields}
+
+
+class TemplateSpec(NamedTuple):
+    """파싱된 목적지 템플릿 (변경 불가)"""
+    id: str
+    name: str
+    places: Tuple[str, ...]
+    sections: Tuple[Tuple[TemplateEntry, ...], ...]  # TEMPLATE_SECTIONS 순서
+
+
+def _render_value(value: Any, days: int) -> Any:
+    if isinstance(value, PerDay):
+        quantity = days * value.per_day
+        return quantity if value.max is None else min(quantity, value.max)
+    if isinstance(value, str):
+        return value.replace('{days}', str(days))
+    return value
+
+
+def _freeze_entry(raw: Dict[str, Any], path: str, section: str) -> TemplateEntry:
+    """JSON 항목 -> TemplateEntry"""
+    if not isinstance(raw, dict):
+        raise ValueError(f"{path}: {section} 항목은 객체여야 합니다: {raw!r}")
+
+    fields = []
+    dynamic = False
+    for key, value in raw.items():
+        if key == 'min_days':
+            continue
+        if isinstance(value, dict):
+            if 'per_day' not in value:
+                raise ValueError(f"{path}: {section}.{key} 값 형식 오류: {value!r}")
+            value = PerDay(value['per_day'], value.get('max'))
+            dynamic = True
+        elif isinstance(value, list):
+            raise ValueError(f"{path}: {section}.{key} 값은 목록일 수 없습니다")
+        elif isinstance(value, str) and '{days}' in value:
+            dynamic = True
+        fields.append((key, value))
+    return TemplateEntry(int(raw.get('min_days', 0)), tuple(fields), dynamic)
+
+
+def load_template_file(path: str) -> TemplateSpec:
+    """템플릿 JSON 파일 1개 파싱"""
+    template_id = os.path.splitext(os.path.basename(path))[0]
+    with open(path, encoding='utf-8') as f:
+        try:
+            raw = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}: JSON 형식 오류: {e}") from e
+
+    unknown = set(raw) - {'name', 'places', *TEMPLATE_SECTIONS}
+    if unknown:
+        raise ValueError(f"{path}: 알 수 없는 키 {sorted(unknown)}")
+
+    sections = tuple(
+        tuple(_freeze_entry(entry, path, section) for entry in raw.get(section, []))
+        for section in TEMPLATE_SECTIONS
+    )
+    return TemplateSpec(template_id, raw.get('name', template_id), tuple(raw.get('places', [])), sections)
+
+
+class TemplateRegistry:
+    """목적지 템플릿 저장소 (처음 사용할 때 디렉터리 전체를 한 번 파싱)"""
+
+    def __init__(self, directory: str = TEMPLATE_DIR):
+        self.directory = directory
+        self._templates: Optional[Dict[str, TemplateSpec]] = None
+        self._by_place: Dict[str, TemplateSpec] = {}
+        self._lock = threading.Lock()
+
+    def _loaded(self) -> Dict[str, TemplateSpec]:
+        if self._templates is None:
+            with self._lock:
+                if self._templates is None:
+                    self._load()
+        return self._templates
+
+    def _load(self):
+        templates = {}
+        by_place = {}
+        for filename in sorted(os.listdir(self.directory)):
+            if not filename.endswith('.json'):
+                continue
+            spec = load_template_file(os.path.join(self.directory, filename))
+            templates[spec.id] = spec
+            if spec.id == BASE_TEMPLATE_ID:
+                continue
+            for place_id in (spec.id, *spec.places):
+                if place_id in by_place:
+                    raise ValueError(f"장소 {place_id}에 템플릿이 중복 지정됨: {by_place[place_id].id}, {spec.id}")
+                by_place[place_id] = spec
+
+        if BASE_TEMPLATE_ID not in templates:
+            templates[BASE_TEMPLATE_ID] = TemplateSpec(
+                BASE_TEMPLATE_ID, '기본 여행 템플릿', (), tuple(() for _ in TEMPLATE_SECTIONS)
+            )
+        self._by_place = by_place
+        # 마지막에 할당해 다른 스레드가 채우는 중인 사전을 보지 않도록 함
+        self._templates = templates
+        print(f"🗺️ 목적지 템플릿 로드: {len(templates) - 1}개 ({self.directory})")
+
+    def __len__(self) -> int:
+        return len(self._loaded()) - 1
+
+    @property
+    def base(self) -> TemplateSpec:
+        """모든 템플릿 앞에 붙는 기본 항목"""
+        return self._loaded()[BASE_TEMPLATE_ID]
+
+    def get(self, template_id: str) -> Optional[TemplateSpec]:
+        """템플릿 ID로 조회"""
+        return self._loaded().get(template_id)
+
+    def for_place(self, place_id: str) -> Optional[TemplateSpec]:
+        """지명 사전 장소 ID에 지정된 템플릿 (없으면 None)"""
+        self._loaded()
+        return self._by_place.get(place_id)
+
+    def ids(self) -> List[str]:
+        """기본 템플릿을 제외한 템플릿 ID 목록"""
+        return [template_id for template_id in self._loaded() if template_id != BASE_TEMPLATE_ID]
+
+
+_registry: Optional[TemplateRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_template_registry() -> TemplateRegistry:
+    """공유 템플릿 저장소 반환"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = TemplateRegistry()
+    return _registry
+
+
+def _template_specs(template_id: Optional[str]) -> Tuple[TemplateSpec, ...]:
+    """기본 템플릿 + 목적지 템플릿 (template_id가 None이면 기본만)"""
+    registry = get_template_registry()
+    spec = registry.get(template_id) if template_id else None
+    return (registry.base, spec) if spec else (registry.base,)
+
+
+@lru_cache(maxsize=TEMPLATE_BUNDLE_CACHE_SIZE)
+def _frozen_bundle(template_id: Optional[str], days: int) -> Mapping[str, Tuple[Mapping[str, Any], ...]]:
+    """
+    (템플릿, 여행일수)별 읽기 전용 템플릿 묶음 (구역 -> 항목 튜플)
+
+    기본 템플릿의 {days}/per_day 항목 때문에 결과가 일수마다 달라지므로 일수 그대로 캐시합니다.
+    여행일수는 대부분 1~30일이라 목적지 수 × 일수 정도면 캐시에 모두 들어갑니다.
+    """
+    specs = _template_specs(template_id)
+    return MappingProxyType({
+        section: tuple(
+            MappingProxyType(entry.render(days))
+            for spec in specs
+            for entry in spec.sections[index]
+            if days >= entry.min_days
+        )
+        for index, section in enumerate(TEMPLATE_SECTIONS)
+    })
+
+
+def template_cache_stats() -> Dict[str, Any]:
+    """템플릿 묶음 캐시 적중 통계"""
+    info = _frozen_bundle.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'hit_rate': round(info.hits / lookups, 3) if lookups else None,
+        'size': info.currsize,
+        'max_size': info.maxsize
+    }
+
 
 class DestinationTemplate:
-    """목적지별 템플릿 기본 클래스"""
+    """목적지 템플릿 (기본 항목 + 목적지 항목을 여행일수에 맞게 펼침)"""
     
-    def __init__(self, destination, days):
+    def __init__(self, destination, days, spec: Optional[TemplateSpec] = None):
         self.destination = destination.lower()
         self.days = days
+        self.spec = spec
+    
+    @property
+    def name(self):
+        return self.spec.name if self.spec else get_template_registry().base.name
+    
+    def get_template_bundle(self):
+        """
+        읽기 전용 템플릿 데이터 (프로세스 전체가 공유하는 캐시, 수정 불가)
+        
+        Returns:
+            구역 -> 항목(MappingProxyType) 튜플
+        """
+        template_id = self.spec.id if self.spec else None
+        return _frozen_bundle(template_id, self.days)
     
     def get_template_data(self):
-        """템플릿 데이터를 반환합니다"""
-        return {
-            'checklists': self.get_checklists(),
-            'items': self.get_items(),
-            'local_infos': self.get_local_infos(),
-            'wishlists': self.get_wishlists(),
-            'expenses': self.get_sample_expenses()
-        }
+        """템플릿 데이터를 반환합니다 (수정 가능한 복사본)"""
+        return {section: [dict(row) for row in rows] for section, rows in self.get_template_bundle().items()}
+    
+    def _section(self, section):
+        return [dict(row) for row in self.get_template_bundle()[section]]
     
     def get_checklists(self):
         """기본 체크리스트 + 목적지 특화 체크리스트"""
-        base_checklists = [
-            {'category': '출발 전', 'title': '여권 유효기간 확인', 'priority': 'high'},
-            {'category': '출발 전', 'title': '항공권 예약 확인', 'priority': 'high'},
-            {'category': '출발 전', 'title': '숙소 예약 확인', 'priority': 'high'},
-            {'category': '출발 전', 'title': '여행자 보험 가입', 'priority': 'medium'},
-            {'category': '출발 전', 'title': '현지 화폐 환전', 'priority': 'medium'},
-            {'category': '1일차', 'title': '숙소 체크인', 'priority': 'high'},
-            {'category': '귀국 후', 'title': '사진 정리', 'priority': 'low'},
-        ]
-        
-        # 여행일수에 따른 추가 체크리스트
-        if self.days >= 3:
-            base_checklists.extend([
-                {'category': '1일차', 'title': '현지 교통카드/패스 구매', 'priority': 'medium'},
-                {'category': '2일차', 'title': '주요 관광지 방문', 'priority': 'high'},
-            ])
-        
-        if self.days >= 5:
-            base_checklists.extend([
-                {'category': '3일차', 'title': '현지 맛집 탐방', 'priority': 'medium'},
-                {'category': '3일차', 'title': '쇼핑 및 기념품 구매', 'priority': 'low'},
-            ])
-        
-        if self.days >= 7:
-            base_checklists.append(
-                {'category': '출발 전', 'title': '장기여행용 약품 준비', 'priority': 'medium'}
-            )
-        
-        return base_checklists + self.get_destination_checklists()
-    
-    def get_destination_checklists(self):
-        """목적지별 특화 체크리스트"""
-        return []
+        return self._section('checklists')
     
     def get_items(self):
         """기본 준비물품 + 목적지 특화 물품"""
-        base_items = [
-            {'category': '서류', 'name': '여권', 'quantity': 1, 'notes': '유효기간 6개월 이상'},
-            {'category': '서류', 'name': '항공권', 'quantity': 1, 'notes': '모바일 체크인 완료'},
-            {'category': '전자기기', 'name': '휴대폰 충전기', 'quantity': 1, 'notes': ''},
-            {'category': '약품', 'name': '개인상비약', 'quantity': 1, 'notes': '소화제, 두통약 등'},
-        ]
-        
-        # 여행일수에 따른 의류 수량 조정
-        clothing_qty = min(self.days, 7)  # 최대 7벌
-        base_items.append({
-            'category': '의류', 'name': '여행용 옷', 'quantity': clothing_qty, 
-            'notes': f'{self.days}일 여행용'
-        })
-        
-        return base_items + self.get_destination_items()
-    
-    def get_destination_items(self):
-        """목적지별 특화 준비물품"""
-        return []
+        return self._section('items')
     
     def get_local_infos(self):
         """목적지별 현지정보"""
-        return []
+        return self._section('local_infos')
     
     def get_wishlists(self):
         """목적지별 추천 위시리스트"""
-        return []
+        return self._section('wishlists')
     
     def get_sample_expenses(self):
         """목적지별 예상 지출"""
-        return []
-
-class CebuTemplate(DestinationTemplate):
-    """세부(필리핀) 여행 템플릿"""
-    
-    def get_destination_checklists(self):
-        lists = [
-            {'category': '출발 전', 'title': '수영복 준비', 'priority': 'high'},
-            {'category': '출발 전', 'title': '선크림 구매 (SPF50+)', 'priority': 'high'},
-            {'category': '1일차', 'title': '심카드 또는 로밍 설정', 'priority': 'medium'},
-        ]
-        
-        if self.days >= 2:
-            lists.append({'category': '2일차', 'title': '오슬롭 고래상어 투어 예약', 'priority': 'high'})
-        
-        return lists
-    
-    def get_destination_items(self):
-        return [
-            {'category': '의류', 'name': '수영복', 'quantity': 2, 'notes': '해변 활동용'},
-            {'category': '의류', 'name': '썬글라스', 'quantity': 1, 'notes': '자외선 차단'},
-            {'category': '용품', 'name': '선크림', 'quantity': 1, 'notes': 'SPF 50 이상'},
-            {'category': '용품', 'name': '수건', 'quantity': 2, 'notes': '속건성 여행용'},
-            {'category': '용품', 'name': '스노클링 장비', 'quantity': 1, 'notes': '선택사항'},
-            {'category': '전자기기', 'name': '방수카메라', 'quantity': 1, 'notes': '수중 촬영용'},
-        ]
-    
-    def get_local_infos(self):
-        return [
-            {'category': '환율', 'title': '필리핀 페소 환율', 'content': '1 PHP ≈ 22원 (변동)', 'rating': None},
-            {'category': '긴급연락처', 'title': '한국 총영사관', 'content': '세부 한국 총영사관', 
-             'phone': '+63-32-231-0909', 'address': 'Cebu City'},
-            {'category': '교통수단', 'title': 'Grab 앱', 'content': '동남아 대표 택시 앱', 'rating': 4.5},
-            {'category': '맛집', 'title': '렉촌 맛집', 'content': '필리핀 전통 돼지고기 요리', 'rating': 4.8},
-            {'category': '기타', 'title': '날씨', 'content': '열대성 기후, 연중 26-32도, 우기 6-11월', 'rating': None},
-        ]
-    
-    def get_wishlists(self):
-        basic_list = [
-            {'place_name': '오슬롭 고래상어 투어', 'category': '체험', 'description': '고래상어와 스노클링', 'priority': 'high'},
-            {'place_name': '카와산 폭포', 'category': '관광지', 'description': '캐녀닝과 폭포수영', 'priority': 'high'},
-            {'place_name': '템플 오브 리아', 'category': '관광지', 'description': '힌두 사원', 'priority': 'medium'},
-        ]
-        
-        if self.days >= 4:
-            basic_list.extend([
-                {'place_name': '보홀 초콜릿 힐', 'category': '관광지', 'description': '보홀섬 당일치기', 'priority': 'medium'},
-                {'place_name': 'SM 시티 세부', 'category': '쇼핑', 'description': '대형 쇼핑몰', 'priority': 'low'},
-            ])
-        
-        return basic_list
-
-class TokyoTemplate(DestinationTemplate):
-    """도쿄(일본) 여행 템플릿"""
-    
-    def get_destination_checklists(self):
-        lists = [
-            {'category': '출발 전', 'title': '엔화 환전', 'priority': 'high'},
-            {'category': '출발 전', 'title': '포켓와이파이 예약', 'priority': 'medium'},
-            {'category': '1일차', 'title': 'IC카드(Suica/Pasmo) 구매', 'priority': 'high'},
-        ]
-        
-        if self.days >= 3:
-            lists.append({'category': '2일차', 'title': '디즈니랜드/디즈니시 티켓 예약', 'priority': 'medium'})
-        
-        return lists
-    
-    def get_destination_items(self):
-        # 계절별 의류 (간단화: 봄/가을 기준)
-        return [
-            {'category': '의류', 'name': '가벼운 외투', 'quantity': 1, 'notes': '일교차 대비'},
-            {'category': '의류', 'name': '편한 운동화', 'quantity': 1, 'notes': '많이 걸어야 함'},
-            {'category': '전자기기', 'name': '포켓와이파이', 'quantity': 1, 'notes': '인터넷 연결용'},
-            {'category': '용품', 'name': '에코백', 'quantity': 1, 'notes': '비닐봉지 유료'},
-        ]
-    
-    def get_local_infos(self):
-        return [
-            {'category': '환율', 'title': '엔화 환율', 'content': '1 JPY ≈ 9원 (변동)', 'rating': None},
-            {'category': '교통수단', 'title': 'JR 패스', 'content': '외국인 전용 무제한 교통패스', 'rating': 4.8},
-            {'category': '맛집', 'title': '스시 잔마이', 'content': '유명 스시 체인점', 'rating': 4.5},
-            {'category': '기타', 'title': '팁 문화', 'content': '일본은 팁 문화가 없음', 'rating': None},
-        ]
-    
-    def get_wishlists(self):
-        return [
-            {'place_name': '센소지 절', 'category': '관광지', 'description': '아사쿠사 전통 사원', 'priority': 'high'},
-            {'place_name': '도쿄 스카이트리', 'category': '관광지', 'description': '도쿄 랜드마크', 'priority': 'high'},
-            {'place_name': '시부야 교차로', 'category': '관광지', 'description': '세계 최대 횡단보도', 'priority': 'medium'},
-            {'place_name': '츠키지 시장', 'category': '맛집', 'description': '신선한 해산물', 'priority': 'high'},
-        ]
-
-class JejuTemplate(DestinationTemplate):
-    """제주도 여행 템플릿"""
-    
-    def get_destination_checklists(self):
-        lists = [
-            {'category': '출발 전', 'title': '렌터카 예약', 'priority': 'high'},
-            {'category': '1일차', 'title': '렌터카 인수', 'priority': 'high'},
-        ]
-        
-        if self.days >= 2:
-            lists.append({'category': '2일차', 'title': '한라산 등반 준비', 'priority': 'medium'})
-        
-        return lists
-    
-    def get_destination_items(self):
-        return [
-            {'category': '서류', 'name': '운전면허증', 'quantity': 1, 'notes': '렌터카 이용시'},
-            {'category': '의류', 'name': '등산화', 'quantity': 1, 'notes': '한라산 등반용'},
-            {'category': '의류', 'name': '바람막이', 'quantity': 1, 'notes': '제주 바람 대비'},
-            {'category': '용품', 'name': '등산 배낭', 'quantity': 1, 'notes': '당일치기용'},
-        ]
-    
-    def get_local_infos(self):
-        return [
-            {'category': '교통수단', 'title': '렌터카 업체', 'content': '제주공항 내 다수 업체', 'rating': 4.0},
-            {'category': '맛집', 'title': '흑돼지 맛집', 'content': '제주 특산품', 'rating': 4.7},
-            {'category': '기타', 'title': '날씨', 'content': '바람이 강함, 우산보다 바람막이 추천', 'rating': None},
-        ]
-    
-    def get_wishlists(self):
-        return [
-            {'place_name': '성산일출봉', 'category': '관광지', 'description': 'UNESCO 세계자연유산', 'priority': 'high'},
-            {'place_name': '한라산', 'category': '관광지', 'description': '대한민국 최고봉', 'priority': 'high'},
-            {'place_name': '섭지코지', 'category': '관광지', 'description': '아름다운 해안절벽', 'priority': 'medium'},
-            {'place_name': '제주 올레길', 'category': '체험', 'description': '트레킹 코스', 'priority': 'medium'},
-        ]
+        return self._section('expenses')
 
 # 템플릿 팩토리
 def get_destination_template(destination, days):
     """목적지에 따른 적절한 템플릿을 반환합니다"""
-    destination_lower = destination.lower()
-    
-    if any(keyword in destination_lower for keyword in ['세부', 'cebu']):
-        return CebuTemplate(destination, days)
-    elif any(keyword in destination_lower for keyword in ['도쿄', 'tokyo', '일본', 'japan']):
-        return TokyoTemplate(destination, days)
-    elif any(keyword in destination_lower for keyword in ['제주', 'jeju']):
-        return JejuTemplate(destination, days)
-    else:
-        # 기본 템플릿
-        return DestinationTemplate(destination, days)
+    place = match_destination(destination)
+    # 전용 템플릿이 없으면 기본 항목만 사용
+    spec = get_template_registry().for_place(place.id) if place else None
+    return DestinationTemplate(destination, days, spec)
 
 def apply_template_to_trip(trip_id, destination, days):
-    """여행에 템플릿을 적용합니다"""
-    from app import app, db, Checklist, Item, LocalInfo, Wishlist
+    """여행에 템플릿을 적용합니다 (호출하는 쪽의 앱 컨텍스트 안에서 실행)"""
+    from app import bulk_insert_trip_content
     
     template = get_destination_template(destination, days)
-    template_data = template.get_template_data()
-    
-    with app.app_context():
-        # 체크리스트 추가
-        for checklist_data in template_data['checklists']:
-            checklist = Checklist(
-                trip_id=trip_id,
-                category=checklist_data['category'],
-                title=checklist_data['title'],
-                priority=checklist_data['priority']
-            )
-            db.session.add(checklist)
-        
-        # 준비물품 추가
-        for item_data in template_data['items']:
-            item = Item(
-                trip_id=trip_id,
-                category=item_data['category'],
-                name=item_data['name'],
-                quantity=item_data['quantity'],
-                notes=item_data['notes']
-            )
-            db.session.add(item)
-        
-        # 현지정보 추가
-        for info_data in template_data['local_infos']:
-            local_info = LocalInfo(
-                trip_id=trip_id,
-                category=info_data['category'],
-                title=info_data['title'],
-                content=info_data['content'],
-                rating=info_data.get('rating'),
-                phone=info_data.get('phone'),
-                address=info_data.get('address')
-            )
-            db.session.add(local_info)
-        
-        # 위시리스트 추가
-        for wishlist_data in template_data['wishlists']:
-            from app import Wishlist
-            wishlist = Wishlist(
-                trip_id=trip_id,
-                place_name=wishlist_data['place_name'],
-                category=wishlist_data['category'],
-                description=wishlist_data['description'],
-                priority=wishlist_data['priority']
-            )
-            db.session.add(wishlist)
-        
-        db.session.commit()
-        
-        return {
-            'checklists': len(template_data['checklists']),
-            'items': len(template_data['items']),
-            'local_infos': len(template_data['local_infos']),
-            'wishlists': len(template_data['wishlists'])
-        }
+    # 읽기만 하므로 복사하지 않고 공유 묶음을 그대로 사용
+    return bulk_insert_trip_content(trip_id, template.get_template_bundle())
@@ -0,0 +1,314 @@
+"""
+목적지 지명 사전 (gazetteer)
+
+도시/지역/국가의 한국어, 영어, 현지어/로마자 별칭을 data/gazetteer.tsv에서
+한 번만 읽어 Aho-Corasick 자동자로 컴파일합니다. 사용자가 입력한 목적지
+문자열을 유니코드 정규화한 뒤 모든 별칭을 한 번에 찾고, 가장 구체적인
+장소의 표준 ID를 반환합니다. 일치하는 별칭이 없으면 difflib로 오타를 보정합니다.
+
+analyze_destination(표준 목적지명)과 get_destination_template(템플릿 선택)이
+같은 장소 ID를 사용합니다.
+
+데이터 형식 (탭 구분, #으로 시작하는 줄은 주석):
+    id  name  ko  country  kind  popular  aliases
+    tokyo  Tokyo, Japan  도쿄  JP  city  1  도쿄|동경|東京|tokyo|tōkyō
+
+- kind: city, region, country (같은 위치에서 겹치면 city/region이 country보다 우선)
+- popular: 1이면 사전 생성(pregenerate.py) 기본 대상
+- aliases: | 구분, ~로 시작하는 별칭은 일반 단어와 겹치는 약한 별칭
+  (다른 별칭이 하나도 없을 때만 사용, 예: ~nice), ko도 ~로 시작할 수 있음
+- 두 글자 이하 영문 별칭(la, sf)은 대문자로 쓰였거나(LA) 같은 나라의 다른 별칭이
+  함께 있을 때만 일치 (스페인어 관사 la 등과 구분)
+"""
+
+import difflib
+import os
+import threading
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'gazetteer.tsv')
+
+# 장소 종류별 우선순위 (낮을수록 구체적)
+KIND_RANK = {'city': 0, 'region': 1, 'country': 2}
+
+# 오타 보정 대상 최소 길이 / 유사도
+FUZZY_MIN_LENGTH = 4
+FUZZY_CUTOFF = 0.8
+
+# 이 길이 이하 영문 별칭은 대문자 표기 또는 같은 나라 별칭이 있어야 일치
+SHORT_ALIAS_LENGTH = 2
+
+
+class Place(NamedTuple):
+    """지명 사전 항목"""
+    id: str
+    name: str
+    ko: str
+    country: str
+    kind: str
+    popular: bool
+
+
+def normalize(text: str) -> str:
+    """
+    비교용 정규화
+
+    NFKC(전각/호환 문자 통일) -> 소문자 -> 발음 구별 기호 제거(tōkyō -> tokyo)
+    -> 문자/숫자가 아닌 기호는 공백 하나로 통일
+    """
+    text = unicodedata.normalize('NFKC', text).casefold()
+    decomposed = unicodedata.normalize('NFKD', text)
+    # 결합 부호만 제거하고 한글은 NFC로 다시 조합
+    text = unicodedata.normalize('NFC', ''.join(ch for ch in decomposed if not unicodedata.combining(ch)))
+    return ' '.join(''.join(ch if ch.isalnum() else ' ' for ch in text).split())
+
+
+def _is_hangul(ch: str) -> bool:
+    return '가' <= ch <= '힣'
+
+
+def _uppercase_words(text: str) -> set:
+    """원문에서 대문자로만 쓴 영문 단어 (정규화 전, 예: "LA 여행" -> {"LA"})"""
+    text = unicodedata.normalize('NFKC', text)
+    words = ''.join(ch if ch.isalnum() else ' ' for ch in text).split()
+    return {word for word in words if word.isascii() and word.isupper()}
+
+
+def _needs_boundary(alias: str) -> Tuple[bool, bool]:
+    """
+    별칭의 (왼쪽, 오른쪽) 단어 경계 필요 여부
+
+    - 라틴 문자 별칭: 양쪽 모두 (rome가 romeo에 걸리지 않도록)
+    - 두 글자 이하 한글 별칭: 왼쪽만 (니스가 비즈니스에 걸리지 않고, 니스여행은 허용)
+    """
+    if alias.isascii():
+        return True, True
+    if len(alias) <= 2:
+        return True, False
+    return False, False
+
+
+class _Automaton:
+    """Aho-Corasick 다중 패턴 매처"""
+
+    def __init__(self, patterns: List[str]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+        for index, pattern in enumerate(patterns):
+            node = 0
+            for ch in pattern:
+                next_node = self.goto[node].get(ch)
+                if next_node is None:
+                    next_node = len(self.goto)
+                    self.goto[node][ch] = next_node
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                node = next_node
+            self.output[node].append(index)
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        queue = list(self.goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for ch, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[child] = target if target != child else 0
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def iter_matches(self, text: str):
+        """(끝 위치(포함하지 않음), 패턴 번호) 반환"""
+        node = 0
+        for position, ch in enumerate(text):
+            while node and ch not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(ch, 0)
+            for index in self.output[node]:
+                yield position + 1, index
+
+
+class Gazetteer:
+    """컴파일된 지명 사전"""
+
+    def __init__(self, rows: List[Tuple[Place, List[str]]]):
+        """
+        지명 사전 컴파일
+
+        Args:
+            rows: (장소, 별칭 목록) 목록 (~로 시작하는 별칭은 약한 별칭)
+        """
+        self._places: Dict[str, Place] = {}
+        self._aliases: List[str] = []
+        self._alias_places: List[Tuple[Place, bool]] = []
+        alias_index: Dict[Tuple[str, str], int] = {}
+
+        for place, aliases in rows:
+            self._places[place.id] = place
+            # 약한 별칭을 먼저 등록해 같은 이름의 강한 별칭(ko)보다 우선
+            for alias in [*aliases, place.name, place.ko]:
+                weak = alias.startswith('~')
+                alias = normalize(alias.lstrip('~'))
+                if not alias or (alias, place.id) in alias_index:
+                    continue
+                alias_index[(alias, place.id)] = len(self._aliases)
+                self._aliases.append(alias)
+                self._alias_places.append((place, weak))
+
+        self._automaton = _Automaton(self._aliases)
+        # 오타 보정 후보 (약한 별칭 제외, 첫 글자별로 나눠 비교 대상을 줄임)
+        self._fuzzy_aliases: Dict[str, int] = {}
+        self._fuzzy_buckets: Dict[str, List[str]] = {}
+        for index, alias in enumerate(self._aliases):
+            if len(alias) >= FUZZY_MIN_LENGTH and not self._alias_places[index][1]:
+                if alias not in self._fuzzy_aliases:
+                    self._fuzzy_aliases[alias] = index
+                    self._fuzzy_buckets.setdefault(alias[0], []).append(alias)
+
+    @classmethod
+    def load(cls, path: str = GAZETTEER_PATH) -> 'Gazetteer':
+        """TSV 파일에서 지명 사전 로드"""
+        rows = []
+        with open(path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.rstrip('\r\n')
+                if not line.strip() or line.startswith('#'):
+                    continue
+                fields = line.split('\t')
+                if len(fields) != 7:
+                    raise ValueError(f"{path}:{line_number}: 열 개수 오류 ({len(fields)}개, 7개 필요)")
+                place_id, name, ko, country, kind, popular, aliases = fields
+                if kind not in KIND_RANK:
+                    raise ValueError(f"{path}:{line_number}: 알 수 없는 종류 {kind}")
+                aliases = [alias for alias in aliases.split('|') if alias]
+                if ko.startswith('~'):
+                    # 일반 단어와 겹치는 한국어 이름 (예: ~나라)
+                    aliases.insert(0, ko)
+                    ko = ko[1:]
+                place = Place(place_id, name, ko, country, kind, popular == '1')
+                rows.append((place, aliases))
+        return cls(rows)
+
+    def __len__(self) -> int:
+        return len(self._places)
+
+    @property
+    def alias_count(self) -> int:
+        return len(self._aliases)
+
+    def get(self, place_id: str) -> Optional[Place]:
+        """ID로 장소 조회"""
+        return self._places.get(place_id)
+
+    def places(self, kind: Optional[str] = None, popular: Optional[bool] = None) -> List[Place]:
+        """장소 목록 (종류/인기 여부로 필터)"""
+        return [
+            place for place in self._places.values()
+            if (kind is None or place.kind == kind) and (popular is None or place.popular == popular)
+        ]
+
+    def find_all(self, text: str) -> List[Tuple[int, int, Place, bool]]:
+        """
+        정규화한 text에서 일치하는 모든 별칭
+
+        Returns:
+            (시작, 끝, 장소, 약한 별칭 여부) 목록
+        """
+        uppercase = _uppercase_words(text)
+        text = normalize(text)
+        matches = []
+        short = []
+        for end, index in self._automaton.iter_matches(text):
+            alias = self._aliases[index]
+            start = end - len(alias)
+            left, right = _needs_boundary(alias)
+            if left and start > 0 and (text[start - 1].isalnum() if alias.isascii() else _is_hangul(text[start - 1])):
+                continue
+            place, weak = self._alias_places[index]
+            # 약한 별칭은 단어 전체로만 일치 (사파가 사파리에 걸리지 않도록)
+            if (right or weak) and end < len(text) and text[end].isalnum():
+                continue
+            if alias.isascii() and len(alias) <= SHORT_ALIAS_LENGTH:
+                # 대문자 표기나 같은 나라 별칭으로 확인된 짧은 별칭은 약한 별칭이라도 우선 사용
+                if alias.upper() not in uppercase:
+                    short.append((start, end, place, False))
+                    continue
+                weak = False
+            matches.append((start, end, place, weak))
+
+        # 소문자 짧은 별칭은 같은 나라의 다른 별칭이 있을 때만 (예: "la usa")
+        countries = {match[2].country for match in matches}
+        matches.extend(match for match in short if match[2].country in countries)
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+    def match(self, text: str) -> Optional[Place]:
+        """
+        목적지 문자열에 해당하는 가장 구체적인 장소
+
+        도시/지역이 국가보다, 긴 별칭이 짧은 별칭보다, 앞에 나온 별칭이 뒤의 것보다 우선합니다.
+        약한 별칭은 다른 일치가 없을 때만 사용하고, 일치가 전혀 없으면 오타 보정을 시도합니다.
+        """
+        matches = self.find_all(text)
+        strong = [match for match in matches if not match[3]]
+        candidates = strong or matches
+        if candidates:
+            start, end, place, _ = min(
+                candidates, key=lambda match: (KIND_RANK[match[2].kind], -(match[1] - match[0]), match[0])
+            )
+            return place
+        return self._fuzzy_match(text)
+
+    def _fuzzy_match(self, text: str) -> Optional[Place]:
+        """
+        정규화한 전체 문자열과 가장 비슷한 별칭 찾기
+
+        단어 단위로는 비교하지 않고(문장 속 일반 단어가 지명으로 바뀌지 않도록),
+        첫 글자가 같은 별칭만 비교합니다 (오타는 대부분 첫 글자 뒤에서 생김).
+        별칭 뒤에 글자가 더 붙은 입력(romeo -> rome)은 다른 단어로 보고 제외합니다.
+        """
+        normalized = normalize(text)
+        if len(normalized) < FUZZY_MIN_LENGTH:
+            return None
+        bucket = self._fuzzy_buckets.get(normalized[0])
+        if not bucket:
+            return None
+        for alias in difflib.get_close_matches(normalized, bucket, n=3, cutoff=FUZZY_CUTOFF):
+            if not normalized.startswith(alias):
+                return self._alias_places[self._fuzzy_aliases[alias]][0]
+        return None
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_lock = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    """공유 지명 사전 반환 (처음 호출할 때 한 번 로드)"""
+    global _gazetteer
+    if _gazetteer is None:
+        with _gazetteer_lock:
+            if _gazetteer is None:
+                _gazetteer = Gazetteer.load()
+    return _gazetteer
+
+
+@lru_cache(maxsize=4096)
+def match_destination(destination: str) -> Optional[Place]:
+    """목적지 문자열 -> 장소 (결과 캐시)"""
+    return get_gazetteer().match(destination)
+
+
+def resolve_destination_id(destination: str) -> Optional[str]:
+    """목적지 문자열 -> 표준 장소 ID (찾지 못하면 None)"""
+    place = match_destination(destination)
+    return place.id if place else None
@@ -59,8 +59,9 @@ def create_database():
     try:
         # Flask 앱 컨텍스트에서 데이터베이스 생성
         from app import app, db
+        from db_migrations import upgrade_database
         with app.app_context():
-            db.create_all()
+            upgrade_database()
             print("✅ 데이터베이스 테이블 생성 완료")
             
             # 샘플 데이터 생성 여부 확인
@@ -0,0 +1,634 @@
+#!/usr/bin/env python3
+"""
+AI API 모의 서버 (부하 테스트 / 장애 재현용)
+
+실제 API 키 없이 AI 파이프라인을 실행할 수 있도록 Anthropic `/v1/messages`와
+DeepSeek `/v1/chat/completions` 응답 형태(스트리밍 포함)를 흉내 냅니다.
+프롬프트에서 목적지/여행 기간/카테고리를 읽어 그럴듯한 JSON 항목을 만들고,
+지연시간 분포, 429/5xx 오류, 잘린 JSON, 느린 스트리밍, 연결 끊김을 주입할 수 있습니다.
+
+사용법:
+    python mock_llm_server.py                                   # 127.0.0.1:8765, 장애 없음
+    python mock_llm_server.py --latency lognormal:1.5,0.5 --tokens-per-second 80
+    python mock_llm_server.py --rate-limit-rate 0.1 --error-rate 0.05 --truncate-rate 0.1
+    python mock_llm_server.py --drip-rate 0.2 --drip-delay 0.5 --disconnect-rate 0.05
+
+클라이언트 연결 (API 키는 아무 값이나 사용):
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 DEEPSEEK_BASE_URL=http://127.0.0.1:8765 python app.py
+
+실행 중 설정 변경 / 통계:
+    POST /mock/config  {"error_rate": 0.2, "latency": "uniform:0.5,2"}
+    GET  /mock/stats
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+CATEGORIES = ('checklist', 'items', 'local_info', 'wishlist')
+
+# 프롬프트 캐시 유지 시간 (Anthropic ephemeral 캐시와 같은 5분)
+PROMPT_CACHE_TTL = 300
+
+
+class LatencyDistribution:
+    """
+    응답 헤더까지의 지연시간 분포
+
+    형식: fixed:S | uniform:A,B | normal:MU,SIGMA | lognormal:MEDIAN,SIGMA
+    """
+
+    def __init__(self, spec: str):
+        self.spec = spec
+        kind, _, args = spec.partition(':')
+        values = [float(value) for value in args.split(',') if value.strip()]
+        expected = {'fixed': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2}
+        if kind not in expected or len(values) != expected[kind]:
+            raise ValueError(f"지연시간 분포 형식 오류: {spec}")
+        self.kind = kind
+        self.values = values
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == 'fixed':
+            value = self.values[0]
+        elif self.kind == 'uniform':
+            value = rng.uniform(*self.values)
+        elif self.kind == 'normal':
+            value = rng.gauss(*self.values)
+        else:
+            median, sigma = self.values
+            value = median * rng.lognormvariate(0, sigma)
+        return max(0.0, value)
+
+
+class MockConfig:
+    """장애 주입 설정 (POST /mock/config로 실행 중 변경 가능)"""
+
+    FIELDS = {
+        'latency': str,
+        'tokens_per_second': float,
+        'rate_limit_rate': float,
+        'retry_after': float,
+        'error_rate': float,
+        'error_statuses': list,
+        'truncate_rate': float,
+        'drip_rate': float,
+        'drip_delay': float,
+        'disconnect_rate': float,
+        'chunk_size': int
+    }
+
+    def __init__(self, **options):
+        self.latency = LatencyDistribution('fixed:0')
+        self.tokens_per_second = 0.0
+        self.rate_limit_rate = 0.0
+        self.retry_after = 1.0
+        self.error_rate = 0.0
+        self.error_statuses = [500, 502, 503]
+        self.truncate_rate = 0.0
+        self.drip_rate = 0.0
+        self.drip_delay = 0.5
+        self.disconnect_rate = 0.0
+        self.chunk_size = 24
+        self.update(options)
+
+    def update(self, options: Dict):
+        """설정 갱신 (알 수 없는 키는 ValueError)"""
+        for key, value in options.items():
+            if value is None:
+                continue
+            if key not in self.FIELDS:
+                raise ValueError(f"알 수 없는 설정: {key}")
+            if key == 'latency':
+                value = LatencyDistribution(value)
+            elif key == 'error_statuses':
+                value = [int(status) for status in value]
+            else:
+                value = self.FIELDS[key](value)
+            setattr(self, key, value)
+
+    def to_dict(self) -> Dict:
+        result = {key: getattr(self, key) for key in self.FIELDS}
+        result['latency'] = self.latency.spec
+        return result
+
+
+class MockState:
+    """설정, 난수, 요청 통계, 프롬프트 캐시 상태 (요청 스레드 간 공유)"""
+
+    def __init__(self, config: MockConfig, seed: Optional[int] = None):
+        self.config = config
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats: Dict[str, int] = {}
+        self._cached_prefixes: Dict[str, float] = {}
+        self._recent_prompts: List[str] = []
+
+    def count(self, key: str):
+        with self.lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def chance(self, rate: float) -> bool:
+        with self.lock:
+            return rate > 0 and self.rng.random() < rate
+
+    def choice(self, values):
+        with self.lock:
+            return self.rng.choice(values)
+
+    def latency(self) -> float:
+        with self.lock:
+            return self.config.latency.sample(self.rng)
+
+    def anthropic_cache(self, blocks: List[str]) -> Tuple[int, int]:
+        """
+        cache_control이 붙은 접두어들의 (읽기, 쓰기) 토큰 수
+
+        Args:
+            blocks: cache_control 지점까지의 누적 접두어 목록 (짧은 것부터)
+        """
+        now = time.monotonic()
+        read = write = 0
+        previous = 0
+        with self.lock:
+            for prefix in blocks:
+                tokens = estimate_tokens(prefix) - previous
+                key = hashlib.sha256(prefix.encode('utf-8')).hexdigest()
+                if self._cached_prefixes.get(key, 0) > now:
+                    read += tokens
+                else:
+                    write += tokens
+                self._cached_prefixes[key] = now + PROMPT_CACHE_TTL
+                previous += tokens
+        return read, write
+
+    def deepseek_cache(self, prompt: str) -> int:
+        """최근 프롬프트와 공통 접두어의 캐시 적중 토큰 수 (64토큰 단위)"""
+        with self.lock:
+            common = 0
+            for previous in self._recent_prompts:
+                length = 0
+                for a, b in zip(previous, prompt):
+                    if a != b:
+                        break
+                    length += 1
+                common = max(common, length)
+            self._recent_prompts = (self._recent_prompts + [prompt])[-32:]
+        return estimate_tokens(prompt[:common]) // 64 * 64
+
+
+def estimate_tokens(text: str) -> int:
+    """한국어 위주 텍스트의 대략적인 토큰 수"""
+    return len(text) // 2
+
+
+# ===== 응답 내용 생성 =====
+
+def parse_trip(prompt: str) -> Tuple[str, int]:
+    """프롬프트에서 (목적지, 여행 일수) 추출"""
+    destination_match = re.search(r'목적지:\s*(.+)', prompt)
+    days_match = re.search(r'여행 기간:\s*(\d+)', prompt)
+    destination = destination_match.group(1).strip() if destination_match else '여행지'
+    days = int(days_match.group(1)) if days_match else 3
+    return destination, days
+
+
+def detect_category(prompt: str) -> Optional[str]:
+    """
+    요청 카테고리 판별 ('all'이면 네 카테고리 통합, None이면 일반 대화)
+
+    지침에는 모든 카테고리 이름이 들어 있으므로 프롬프트에서 가장 뒤에 나온 표시를 사용합니다.
+    """
+    markers = {f'({category})': category for category in CATEGORIES}
+    markers['(checklist, items, local_info, wishlist)'] = 'all'
+    positions = {category: prompt.rfind(marker) for marker, category in markers.items()}
+    category, position = max(positions.items(), key=lambda entry: entry[1])
+    return category if position >= 0 else None
+
+
+def build_items(category: str, destination: str, days: int) -> List[Dict]:
+    """카테고리 항목 생성 (여행 기간에 따라 개수 변화)"""
+    if category == 'checklist':
+        day_steps = [f'{day}일차' for day in range(1, min(days, 3) + 1)]
+        steps = ['출발 전'] * 3 + day_steps + ['귀국 후']
+        return [
+            {"category": step, "title": f"{destination} {step} 준비 {index + 1}",
+             "priority": ('high', 'medium', 'low')[index % 3], "description": f"{destination} 여행을 위한 확인 사항"}
+            for index, step in enumerate(steps)
+        ]
+    if category == 'items':
+        groups = ['서류', '의류', '용품', '약품', '전자기기']
+        return [
+            {"category": group, "name": f"{group} 준비물 {index + 1}", "quantity": 1 + index % max(1, days // 2),
+             "notes": f"{destination} 현지 사정 고려"}
+            for index, group in enumerate(groups * 2)
+        ]
+    if category == 'local_info':
+        groups = ['환율', '긴급연락처', '교통수단', '맛집', '맛집', '기타']
+        return [
+            {"category": group, "title": f"{destination} {group} 정보", "content": f"{destination}의 {group} 안내",
+             "rating": 4.5 if group == '맛집' else None,
+             "phone": "+82-2-000-0000" if group == '긴급연락처' else None,
+             "address": f"{destination} 시내" if group == '맛집' else None}
+            for group in groups
+        ]
+    groups = ['관광지', '맛집', '체험', '쇼핑', '기타']
+    count = min(12, 3 + days)
+    return [
+        {"place_name": f"{destination} {groups[index % 5]} {index + 1}", "category": groups[index % 5],
+         "description": f"{destination}에서 꼭 가봐야 할 곳", "priority": ('high', 'medium', 'low')[index % 3],
+         "address": f"{destination}"}
+        for index in range(count)
+    ]
+
+
+def build_content(category: Optional[str], destination: str, days: int):
+    """요청 카테고리의 응답 데이터 (일반 대화는 문자열)"""
+    if category is None:
+        return "연결 성공"
+    if category == 'all':
+        return {name: build_items(name, destination, days) for name in CATEGORIES}
+    return build_items(category, destination, days)
+
+
+def truncate(text: str, rng_value: float) -> str:
+    """JSON 텍스트를 60~90% 지점에서 자름 (max_tokens 도달 흉내)"""
+    return text[:max(1, int(len(text) * (0.6 + 0.3 * rng_value)))]
+
+
+def split_chunks(text: str, size: int) -> List[str]:
+    return [text[index:index + size] for index in range(0, len(text), size)] or ['']
+
+
+# ===== HTTP 처리 =====
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    """Anthropic / DeepSeek API 모의 요청 처리기"""
+
+    protocol_version = 'HTTP/1.1'
+    state: MockState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    # --- 공통 ---
+
+    def _read_json(self) -> Dict:
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'{}')
+
+    def _send_json(self, status: int, body: Dict, headers: Optional[Dict] = None):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _start_stream(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+    def _write_chunk(self, text: str):
+        data = text.encode('utf-8')
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+    def _end_stream(self):
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def _inject_fault(self, provider: str) -> bool:
+        """
+        지연시간 적용 후 429/5xx 오류 주입
+
+        Returns:
+            오류 응답을 보냈으면 True
+        """
+        state = self.state
+        config = state.config
+        time.sleep(state.latency())
+
+        if state.chance(config.rate_limit_rate):
+            state.count(f'{provider}.429')
+            message = "모의 서버 호출 한도 초과"
+            body = ({"type": "error", "error": {"type": "rate_limit_error", "message": message}}
+                    if provider == 'anthropic' else
+                    {"error": {"message": message, "type": "rate_limit_reached_error"}})
+            self._send_json(429, body, {'Retry-After': f"{config.retry_after:g}"})
+            return True
+
+        if state.chance(config.error_rate):
+            status = state.choice(config.error_statuses)
+            state.count(f'{provider}.{status}')
+            message = f"모의 서버 오류 ({status})"
+            body = ({"type": "error", "error": {"type": "api_error", "message": message}}
+                    if provider == 'anthropic' else
+                    {"error": {"message": message, "type": "server_error"}})
+            self._send_json(status, body)
+            return True
+
+        return False
+
+    def _generation_delay(self, output_tokens: int) -> float:
+        speed = self.state.config.tokens_per_second
+        return output_tokens / speed if speed > 0 else 0.0
+
+    def _stream_plan(self, chunks: List[str]) -> Tuple[float, Optional[int]]:
+        """(조각당 지연, 연결을 끊을 조각 위치)"""
+        state = self.state
+        config = state.config
+        delay = self._generation_delay(estimate_tokens(''.join(chunks))) / max(1, len(chunks))
+        if state.chance(config.drip_rate):
+            state.count('drip')
+            delay += config.drip_delay
+        disconnect_at = None
+        if len(chunks) > 1 and state.chance(config.disconnect_rate):
+            state.count('disconnect')
+            disconnect_at = len(chunks) // 2
+        return delay, disconnect_at
+
+    # --- 라우팅 ---
+
+    def do_GET(self):
+        if self.path == '/mock/stats':
+            with self.state.lock:
+                stats = dict(self.state.stats)
+            self._send_json(200, {'stats': stats, 'config': self.state.config.to_dict()})
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        try:
+            body = self._read_json()
+        except ValueError:
+            self._send_json(400, {"error": {"message": "invalid JSON body"}})
+            return
+
+        try:
+            if self.path == '/v1/messages':
+                self._handle_anthropic(body)
+            elif self.path in ('/v1/chat/completions', '/chat/completions'):
+                self._handle_deepseek(body)
+            elif self.path == '/mock/config':
+                self.state.config.update(body)
+                self._send_json(200, self.state.config.to_dict())
+            else:
+                self._send_json(404, {"error": {"message": "not found"}})
+        except ValueError as e:
+            self._send_json(400, {"error": {"message": str(e)}})
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 스트림을 먼저 닫음
+            self.close_connection = True
+
+    # --- Anthropic Messages API ---
+
+    @staticmethod
+    def _anthropic_prompt(body: Dict) -> Tuple[str, List[str]]:
+        """(전체 프롬프트 텍스트, cache_control 지점까지의 누적 접두어 목록)"""
+        parts: List[str] = []
+        cache_points: List[str] = []
+
+        def add(block):
+            if isinstance(block, str):
+                parts.append(block)
+                return
+            parts.append(block.get('text', ''))
+            if block.get('cache_control'):
+                cache_points.append(''.join(parts))
+
+        system = body.get('system')
+        for block in ([system] if isinstance(system, str) else system or []):
+            add(block)
+        for message in body.get('messages', []):
+            content = message.get('content')
+            for block in ([content] if isinstance(content, str) else content or []):
+                add(block)
+        return ''.join(parts), cache_points
+
+    def _handle_anthropic(self, body: Dict):
+        state = self.state
+        state.count('anthropic.requests')
+        if self._inject_fault('anthropic'):
+            return
+
+        prompt, cache_points = self._anthropic_prompt(body)
+        read_tokens, write_tokens = state.anthropic_cache(cache_points) if cache_points else (0, 0)
+        usage = {
+            "input_tokens": max(1, estimate_tokens(prompt) - read_tokens - write_tokens),
+            "cache_read_input_tokens": read_tokens,
+            "cache_creation_input_tokens": write_tokens
+        }
+
+        destination, days = parse_trip(prompt)
+        tool_choice = body.get('tool_choice') or {}
+        tool_name = tool_choice.get('name') if tool_choice.get('type') == 'tool' else None
+        if tool_name:
+            category = 'all' if tool_name == 'save_travel_content' else tool_name[len('save_'):]
+            data = build_content(category, destination, days)
+            if category != 'all':
+                data = {"items": data}
+        else:
+            data = build_content(detect_category(prompt), destination, days)
+        text = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False, indent=2)
+
+        stop_reason = 'tool_use' if tool_name else 'end_turn'
+        if not isinstance(data, str) and state.chance(state.config.truncate_rate):
+            state.count('truncated')
+            with state.lock:
+                text = truncate(text, state.rng.random())
+            stop_reason = 'max_tokens'
+        usage["output_tokens"] = estimate_tokens(text)
+
+        if body.get('stream'):
+            self._stream_anthropic(body, text, tool_name, stop_reason, usage)
+            return
+
+        time.sleep(self._generation_delay(usage["output_tokens"]))
+        if tool_name:
+            try:
+                tool_input = json.loads(text)
+            except ValueError:
+                # 잘린 도구 입력은 빈 입력으로 도착
+                tool_input = {}
+            content = [{"type": "tool_use", "id": "toolu_mock", "name": tool_name, "input": tool_input}]
+        else:
+            content = [{"type": "text", "text": text}]
+        self._send_json(200, {
+            "id": "msg_mock", "type": "message", "role": "assistant", "model": body.get('model'),
+            "content": content, "stop_reason": stop_reason, "usage": usage
+        })
+
+    def _stream_anthropic(self, body: Dict, text: str, tool_name: Optional[str], stop_reason: str, usage: Dict):
+        def event(payload: Dict) -> str:
+            return f"event: {payload['type']}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+        chunks = split_chunks(text, self.state.config.chunk_size)
+        delay, disconnect_at = self._stream_plan(chunks)
+        start_usage = {key: value for key, value in usage.items() if key != 'output_tokens'}
+        block = ({"type": "tool_use", "id": "toolu_mock", "name": tool_name, "input": {}}
+                 if tool_name else {"type": "text", "text": ""})
+
+        self._start_stream()
+        self._write_chunk(event({"type": "message_start", "message": {
+            "id": "msg_mock", "type": "message", "role": "assistant", "model": body.get('model'),
+            "content": [], "stop_reason": None, "usage": {**start_usage, "output_tokens": 1}}}))
+        self._write_chunk(event({"type": "content_block_start", "index": 0, "content_block": block}))
+        for index, chunk in enumerate(chunks):
+            if index == disconnect_at:
+                # 종료 청크 없이 연결을 끊음
+                self.close_connection = True
+                return
+            time.sleep(delay)
+            delta = ({"type": "input_json_delta", "partial_json": chunk}
+                     if tool_name else {"type": "text_delta", "text": chunk})
+            self._write_chunk(event({"type": "content_block_delta", "index": 0, "delta": delta}))
+        self._write_chunk(event({"type": "content_block_stop", "index": 0}))
+        self._write_chunk(event({"type": "message_delta", "delta": {"stop_reason": stop_reason},
+                                 "usage": {"output_tokens": usage["output_tokens"]}}))
+        self._write_chunk(event({"type": "message_stop"}))
+        self._end_stream()
+
+    # --- DeepSeek Chat Completions API ---
+
+    def _handle_deepseek(self, body: Dict):
+        state = self.state
+        state.count('deepseek.requests')
+        if self._inject_fault('deepseek'):
+            return
+
+        prompt = ''.join(
+            message.get('content') or '' for message in body.get('messages', [])
+            if isinstance(message.get('content'), str)
+        )
+        prompt_tokens = max(1, estimate_tokens(prompt))
+        hit_tokens = min(state.deepseek_cache(prompt), prompt_tokens)
+
+        destination, days = parse_trip(prompt)
+        data = build_content(detect_category(prompt), destination, days)
+        text = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False, indent=2)
+
+        finish_reason = 'stop'
+        if not isinstance(data, str) and state.chance(state.config.truncate_rate):
+            state.count('truncated')
+            with state.lock:
+                text = truncate(text, state.rng.random())
+            finish_reason = 'length'
+
+        completion_tokens = estimate_tokens(text)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_cache_hit_tokens": hit_tokens,
+            "prompt_cache_miss_tokens": prompt_tokens - hit_tokens
+        }
+        model = body.get('model')
+
+        if body.get('stream'):
+            chunks = split_chunks(text, state.config.chunk_size)
+            delay, disconnect_at = self._stream_plan(chunks)
+
+            def chunk_event(delta: Dict, reason: Optional[str] = None, extra: Optional[Dict] = None) -> str:
+                payload = {"id": "chatcmpl-mock", "object": "chat.completion.chunk", "model": model,
+                           "choices": [{"index": 0, "delta": delta, "finish_reason": reason}], **(extra or {})}
+                return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+            self._start_stream()
+            self._write_chunk(chunk_event({"role": "assistant", "content": ""}))
+            for index, chunk in enumerate(chunks):
+                if index == disconnect_at:
+                    self.close_connection = True
+                    return
+                time.sleep(delay)
+                self._write_chunk(chunk_event({"content": chunk}))
+            self._write_chunk(chunk_event({}, finish_reason, {"usage": usage}))
+            self._write_chunk("data: [DONE]\n\n")
+            self._end_stream()
+            return
+
+        time.sleep(self._generation_delay(completion_tokens))
+        self._send_json(200, {
+            "id": "chatcmpl-mock", "object": "chat.completion", "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": finish_reason}],
+            "usage": usage
+        })
+
+
+def create_server(host: str = '127.0.0.1', port: int = 8765, seed: Optional[int] = None,
+                  **options) -> ThreadingHTTPServer:
+    """
+    모의 서버 생성 (serve_forever는 호출하지 않음)
+
+    Args:
+        host: 바인딩 주소
+        port: 포트 (0이면 임의 포트)
+        seed: 장애 주입 난수 시드
+        **options: MockConfig 설정
+
+    Returns:
+        HTTP 서버 (server.server_address로 실제 포트 확인)
+    """
+    handler = type('BoundMockLLMHandler', (MockLLMHandler,), {'state': MockState(MockConfig(**options), seed)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Anthropic / DeepSeek API 모의 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--seed', type=int, help='장애 주입 난수 시드')
+    parser.add_argument('--latency', default='fixed:0',
+                        help='응답 헤더까지의 지연 분포 (fixed:S, uniform:A,B, normal:MU,SIGMA, lognormal:MEDIAN,SIGMA)')
+    parser.add_argument('--tokens-per-second', type=float, default=0, help='출력 생성 속도 (0이면 즉시)')
+    parser.add_argument('--rate-limit-rate', type=float, default=0, help='429 응답 비율')
+    parser.add_argument('--retry-after', type=float, default=1, help='429 응답의 Retry-After (초)')
+    parser.add_argument('--error-rate', type=float, default=0, help='5xx 응답 비율')
+    parser.add_argument('--error-statuses', default='500,502,503', help='주입할 5xx 상태 코드 목록')
+    parser.add_argument('--truncate-rate', type=float, default=0, help='max_tokens에서 잘린 JSON 응답 비율')
+    parser.add_argument('--drip-rate', type=float, default=0, help='느린 스트리밍 비율')
+    parser.add_argument('--drip-delay', type=float, default=0.5, help='느린 스트리밍의 조각당 추가 지연 (초)')
+    parser.add_argument('--disconnect-rate', type=float, default=0, help='스트리밍 중 연결 끊김 비율')
+    parser.add_argument('--chunk-size', type=int, default=24, help='스트리밍 조각 크기 (문자)')
+    args = parser.parse_args()
+
+    server = create_server(
+        args.host, args.port, args.seed,
+        latency=args.latency,
+        tokens_per_second=args.tokens_per_second,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        error_statuses=args.error_statuses.split(','),
+        truncate_rate=args.truncate_rate,
+        drip_rate=args.drip_rate,
+        drip_delay=args.drip_delay,
+        disconnect_rate=args.disconnect_rate,
+        chunk_size=args.chunk_size
+    )
+    host, port = server.server_address[:2]
+    print(f"🧪 AI API 모의 서버 실행: http://{host}:{port}")
+    print(f"   ANTHROPIC_BASE_URL=http://{host}:{port} DEEPSEEK_BASE_URL=http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 모의 서버를 종료합니다.")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+인기 목적지 여행 컨텐츠 묶음 사전 생성 스크립트
+
+목적지 × 계절(4) × 여행 스타일/일수 구간 조합의 AI 컨텐츠를 미리 생성해
+묶음 캐시(AIConfig.COMPLETION_CACHE_PATH의 trip_bundle_cache)에 저장합니다. 같은 조건의 첫 사용자도
+생성 대기 없이 캐시된 결과를 받습니다.
+
+- 동시 생성 수를 제한하고, 공급자 호출 한도(ai_ratelimit)를 그대로 따릅니다.
+- 이미 신선한 캐시가 있는 조합은 건너뛰므로 중단 후 다시 실행하면 이어서 생성합니다.
+
+사용법:
+    python pregenerate.py                       # 지명 사전의 인기 목적지 전체
+    python pregenerate.py 도쿄 파리 --workers 4
+    python pregenerate.py --seasons 봄 가을 --per-minute 10
+    python pregenerate.py --dry-run             # 생성할 조합만 출력
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from typing import List, Tuple
+
+from ai_travel_assistant import warm_bundle_cache
+from gazetteer import get_gazetteer
+
+# 계절별 대표 출발 월 (AITravelAssistant.get_season 기준)
+SEASON_MONTHS = {'봄': 4, '여름': 7, '가을': 10, '겨울': 1}
+
+# 여행 스타일 × 캐시 일수 구간 조합별 대표 일수
+# (단기 1-2일, 단기 3일, 일반 4일, 일반 5-7일, 장기 8일 이상)
+REPRESENTATIVE_DAYS = (2, 3, 4, 6, 10)
+
+
+class StartPacer:
+    """작업 시작 간격 제한 (분당 최대 시작 수, 0이면 제한 없음)"""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next_start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def build_tasks(destinations: List[str], seasons: List[str], days_list: List[int]) -> List[Tuple[str, str, int]]:
+    """(목적지, 계절, 일수) 조합 목록"""
+    return [
+        (destination, season, days)
+        for destination in destinations
+        for season in seasons
+        for days in days_list
+    ]
+
+
+def season_start_date(season: str) -> date:
+    """계절의 대표 출발일 (올해 기준)"""
+    return date(date.today().year, SEASON_MONTHS[season], 15)
+
+
+def run_pregeneration(tasks: List[Tuple[str, str, int]], workers: int = 2,
+                      per_minute: float = 0, force: bool = False) -> dict:
+    """
+    조합별 묶음 캐시 생성
+
+    Args:
+        tasks: (목적지, 계절, 일수) 조합 목록
+        workers: 동시에 생성할 묶음 수
+        per_minute: 분당 최대 생성 시작 수 (0이면 제한 없음)
+        force: 신선한 캐시가 있어도 다시 생성
+
+    Returns:
+        결과별 개수 (fresh, generated, failed, disabled, error, cancelled)
+    """
+    pacer = StartPacer(per_minute)
+    counts = {'fresh': 0, 'generated': 0, 'failed': 0, 'disabled': 0, 'error': 0, 'cancelled': 0}
+
+    def generate(destination: str, season: str, days: int):
+        start_date = season_start_date(season)
+        if not force:
+            # 이미 캐시된 조합은 시작 간격 제한 없이 바로 확인
+            status = warm_bundle_cache(destination, days, start_date, force=False, check_only=True)
+            if status != 'missing':
+                return status, 0.0
+        pacer.wait()
+        started = time.monotonic()
+        status = warm_bundle_cache(destination, days, start_date, force=force)
+        return status, time.monotonic() - started
+
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    futures = {executor.submit(generate, *task): task for task in tasks}
+    done = 0
+    try:
+        for future in as_completed(futures):
+            destination, season, days = futures[future]
+            done += 1
+            try:
+                status, elapsed = future.result()
+            except Exception as e:
+                status, elapsed = 'error', 0.0
+                print(f"❌ [{done}/{len(tasks)}] {destination} / {season} / {days}일 오류: {e}")
+            counts[status] += 1
+
+            if status == 'generated':
+                print(f"✅ [{done}/{len(tasks)}] {destination} / {season} / {days}일 생성 ({elapsed:.1f}초)")
+            elif status == 'failed':
+                print(f"⚠️ [{done}/{len(tasks)}] {destination} / {season} / {days}일 생성 실패 (다음 실행에서 재시도)")
+            elif status == 'disabled':
+                print("❌ 묶음 캐시가 비활성화되어 있습니다 (AI_BUNDLE_CACHE=true로 설정하세요).")
+                break
+    except KeyboardInterrupt:
+        print("\n⏹️ 중단 요청: 진행 중인 생성만 마치고 종료합니다. 다시 실행하면 이어서 생성합니다.")
+    finally:
+        counts['cancelled'] += sum(1 for future in futures if future.cancel())
+        try:
+            executor.shutdown(wait=True)
+        except KeyboardInterrupt:
+            # 두 번째 중단 요청은 진행 중인 생성을 기다리지 않음
+            print("⏹️ 진행 중인 생성을 기다리지 않고 종료합니다.")
+
+    return counts
+
+
+def main():
+    default_destinations = [place.ko for place in get_gazetteer().places(popular=True)]
+
+    parser = argparse.ArgumentParser(description='인기 목적지 여행 컨텐츠 묶음 사전 생성')
+    parser.add_argument('destinations', nargs='*', help='목적지 목록 (기본: 지명 사전의 인기 목적지)')
+    parser.add_argument('--seasons', nargs='+', choices=list(SEASON_MONTHS), default=list(SEASON_MONTHS))
+    parser.add_argument('--days', nargs='+', type=int, default=list(REPRESENTATIVE_DAYS),
+                        help='여행 일수 목록 (기본: 스타일/일수 구간별 대표 일수)')
+    parser.add_argument('--workers', type=int, default=2, help='동시에 생성할 묶음 수')
+    parser.add_argument('--per-minute', type=float, default=0, help='분당 최대 생성 시작 수 (0이면 제한 없음)')
+    parser.add_argument('--force', action='store_true', help='캐시가 있어도 다시 생성')
+    parser.add_argument('--dry-run', action='store_true', help='생성할 조합만 출력')
+    args = parser.parse_args()
+
+    tasks = build_tasks(args.destinations or default_destinations, args.seasons, args.days)
+    print(f"🗂️ 사전 생성 대상: {len(tasks)}개 조합 (목적지 {len(args.destinations or default_destinations)}개 × "
+          f"계절 {len(args.seasons)}개 × 일수 {len(args.days)}개)")
+
+    if args.dry_run:
+        for destination, season, days in tasks:
+            print(f"  - {destination} / {season} / {days}일")
+        return
+
+    started = time.monotonic()
+    counts = run_pregeneration(tasks, workers=args.workers, per_minute=args.per_minute, force=args.force)
+    print(f"\n🎉 사전 생성 종료 ({time.monotonic() - started:.1f}초): "
+          f"생성 {counts['generated']}개, 기존 캐시 {counts['fresh']}개, 실패 {counts['failed']}개, "
+          f"오류 {counts['error']}개, 취소 {counts['cancelled']}개")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+SQL 쿼리 수 계측
+
+SQLAlchemy 엔진 이벤트로 실행된 SQL 문을 세어, 요청(또는 코드 블록)마다
+실행한 쿼리 수를 확인합니다. 라우트에 query_budget을 붙이면 템플릿 렌더링
+중의 지연 로딩까지 포함해 쿼리 수가 한도를 넘는지 검사합니다.
+
+사용법:
+    with count_queries() as counter:
+        load_trip_aggregate(trip_id)
+    print(counter.count)
+
+    @app.route('/trip/<int:trip_id>')
+    @query_budget(1)
+    def trip_detail(trip_id): ...
+"""
+
+import contextvars
+import functools
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    """실행된 SQL 문 수 (중첩되면 바깥 계측기에도 함께 집계)"""
+
+    def __init__(self, parent: Optional['QueryCounter'] = None):
+        self.parent = parent
+        self.count = 0
+        self.statements: List[str] = []
+
+
+class QueryBudgetExceeded(AssertionError):
+    """요청의 쿼리 수가 한도를 넘음"""
+
+
+_current_counter: contextvars.ContextVar[Optional[QueryCounter]] = contextvars.ContextVar(
+    'query_counter', default=None
+)
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _current_counter.get()
+    while counter is not None:
+        counter.count += 1
+        counter.statements.append(statement)
+        counter = counter.parent
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """블록 안에서 실행된 SQL 문 세기"""
+    counter = QueryCounter(_current_counter.get())
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+def query_budget(limit: int, strict: Optional[bool] = None):
+    """
+    라우트의 요청당 쿼리 수 검사 데코레이터
+
+    Args:
+        limit: 요청당 최대 쿼리 수
+        strict: True면 한도 초과 시 QueryBudgetExceeded 발생, False면 경고만 출력
+            (None이면 디버그/테스트 모드에서만 예외)
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            with count_queries() as counter:
+                response = view(*args, **kwargs)
+
+            if counter.count > limit:
+                message = f"{view.__name__} 쿼리 {counter.count}개 실행 (한도 {limit}개)"
+                fail = strict if strict is not None else (current_app.debug or current_app.testing)
+                if fail:
+                    raise QueryBudgetExceeded(message + '\n' + '\n'.join(counter.statements))
+                print(f"⚠️ {message}")
+            return response
+        return wrapper
+    return decorator
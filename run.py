@@ -8,12 +8,15 @@
 
 import os
 import sys
-from app import app, db
+from app import app
+from ai_jobs import start_generation_workers
+from db_migrations import upgrade_database
 
 def create_database():
     """데이터베이스 테이블을 생성합니다."""
     with app.app_context():
-        db.create_all()
+        # 테이블 생성 + 기존 데이터베이스에 빠진 인덱스 추가
+        upgrade_database()
         print("✅ 데이터베이스 테이블이 생성되었습니다.")
 
 def run_app():
@@ -35,6 +38,10 @@ def run_app():
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     print(f"📁 업로드 폴더: {app.config['UPLOAD_FOLDER']}")
     
+    # AI 생성 워커 시작 (디버그 리로더의 감시 프로세스 제외)
+    if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_generation_workers(app)
+    
     print("\n🚀 애플리케이션을 시작합니다...\n")
     
     # Flask 앱 실행
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+AI 여행 컨텐츠 생성 워커 실행 스크립트
+
+웹 서버와 별도 프로세스로 AI 생성 작업을 처리할 때 사용합니다.
+웹 프로세스와 같은 데이터베이스의 작업 대기열을 공유합니다.
+
+사용법:
+    python worker.py            # GENERATION_WORKERS 설정만큼 워커 실행
+    python worker.py 4          # 워커 4개 실행
+"""
+
+import sys
+import threading
+
+from app import app
+from ai_jobs import start_generation_workers
+from db_migrations import upgrade_database
+
+def run_worker():
+    """워커를 시작하고 종료 신호까지 대기합니다."""
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    
+    with app.app_context():
+        upgrade_database()
+    
+    print("🛠️ AI 생성 워커를 시작합니다...")
+    print(f"💾 데이터베이스: {app.config['SQLALCHEMY_DATABASE_URI']}")
+    
+    stop_event = threading.Event()
+    threads = start_generation_workers(app, workers=workers, stop_event=stop_event)
+    
+    try:
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=1)
+    except KeyboardInterrupt:
+        stop_event.set()
+        print("\n👋 AI 생성 워커를 종료합니다.")
+
+if __name__ == '__main__':
+    run_worker()